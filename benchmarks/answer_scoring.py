@@ -0,0 +1,56 @@
+"""Measure answer-scoring throughput, one answer per call versus batches.
+
+Answers are synthetic (random draws from a small interview vocabulary, 40-160
+words each) against random questions from the bank.
+
+    python -m benchmarks.answer_scoring --answers 5000 --batch-sizes 1 16 256 5000
+"""
+import sys
+import os
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.question_bank import question_bank
+from services.scoring import get_answer_scorer
+
+VOCABULARY = (
+    "I we led the team to design build a cache with ttl and invalidation because latency was high so then "
+    "reduced p99 by 40% um basically measured results improved throughput users database queue retries "
+    "situation task action result project deadline tests deploy rollback monitoring"
+).split()
+
+def synthetic_answers(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        ("Software Engineer", rng.choice(question_bank.questions).text,
+         " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(40, 160))) + ".")
+        for _ in range(count)
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answers", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256, 5000])
+    args = parser.parse_args()
+
+    scorer = get_answer_scorer()
+    items = synthetic_answers(args.answers)
+    # Warm the token and reference caches, as a running server would be
+    scorer.score(items)
+
+    results = []
+    for batch_size in args.batch_sizes:
+        started = time.perf_counter()
+        for i in range(0, len(items), batch_size):
+            scorer.score(items[i:i + batch_size])
+        elapsed = time.perf_counter() - started
+        results.append({"batchSize": batch_size, "answersPerSecond": round(len(items) / elapsed),
+                        "usPerAnswer": round(elapsed / len(items) * 1e6, 1)})
+    print(json.dumps({"answers": args.answers, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure Bearer-token verification latency with and without the verified-token cache.
+
+Uses the local RS256 test verifier, so it needs no network or Firebase project.
+
+    python -m benchmarks.auth_cache --requests 2000 --tokens 20
+"""
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.requests import Request
+from services.auth import LocalTokenVerifier, set_token_verifier, get_token_cache, verify_firebase_token
+
+def request_with(token: str) -> Request:
+    return Request({"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())]})
+
+async def run(requests, cached: bool) -> float:
+    cache = get_token_cache()
+    cache.clear()
+    started = time.perf_counter()
+    for request in requests:
+        if not cached:
+            cache.clear()
+        await verify_firebase_token(request)
+    return (time.perf_counter() - started) / len(requests) * 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--tokens", type=int, default=20, help="distinct sessions sharing the request stream")
+    args = parser.parse_args()
+
+    verifier = LocalTokenVerifier()
+    set_token_verifier(verifier)
+    tokens = [verifier.issue(f"user-{i}") for i in range(args.tokens)]
+    requests = [request_with(tokens[i % len(tokens)]) for i in range(args.requests)]
+
+    uncached_us = asyncio.run(run(requests, cached=False))
+    cache = get_token_cache()
+    hits, misses = cache.hits, cache.misses
+    cached_us = asyncio.run(run(requests, cached=True))
+    print(json.dumps({
+        "requests": args.requests,
+        "tokens": args.tokens,
+        "uncachedMicrosPerRequest": round(uncached_us, 1),
+        "cachedMicrosPerRequest": round(cached_us, 1),
+        "speedup": round(uncached_us / cached_us, 1),
+        "cachedRunHits": cache.hits - hits,
+        "cachedRunMisses": cache.misses - misses,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
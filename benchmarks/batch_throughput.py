@@ -0,0 +1,55 @@
+"""Measure bulk resume analysis throughput (resumes/second) on a synthetic corpus.
+
+    python -m benchmarks.batch_throughput --count 200 --size medium
+"""
+import sys
+import os
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from benchmarks.corpus import build_corpus, SIZES
+from services.ai import run_resume_analysis, get_result_cache, PARSER_WORKERS
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--size", choices=sorted(SIZES), default="small")
+    args = parser.parse_args()
+
+    # A fresh cache directory would turn the second pass into cache hits
+    os.environ.pop("RESUME_CACHE_DIR", None)
+    corpus = build_corpus(args.count, args.size)
+
+    started = time.perf_counter()
+    for filename, content in corpus:
+        run_resume_analysis(content, filename)
+    sequential = time.perf_counter() - started
+
+    import main as api
+    client = TestClient(api.app)
+    files = [("files", (filename, content, "application/octet-stream")) for filename, content in corpus]
+    # Warm the process pool so worker start-up is not billed to the batch
+    client.post("/api/resume/analyze/batch", files=files[:PARSER_WORKERS])
+    get_result_cache().memory.clear()
+
+    started = time.perf_counter()
+    response = client.post("/api/resume/analyze/batch", files=files)
+    batch = time.perf_counter() - started
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    summary = lines[-1]["summary"]
+
+    print(json.dumps({
+        "count": args.count,
+        "size": args.size,
+        "workers": PARSER_WORKERS,
+        "sequentialResumesPerSecond": round(args.count / sequential, 1),
+        "batchResumesPerSecond": round(args.count / batch, 1),
+        "failed": summary["failed"],
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
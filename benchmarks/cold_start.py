@@ -0,0 +1,101 @@
+"""Measure cold start: time to import the app, time until /health answers, and where import time goes.
+
+Every run is a fresh interpreter. The import profile comes from
+`python -X importtime`; heavyModules lists the heavy SDKs that were loaded by
+`import main` and should only load on first use.
+
+    python -m benchmarks.cold_start --runs 5 --top 15
+"""
+import sys
+import os
+import json
+import time
+import socket
+import argparse
+import subprocess
+import statistics
+import urllib.request
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Loaded by the endpoints that need them; none should appear after a bare `import main`
+HEAVY_MODULES = ["numpy", "reportlab", "PyPDF2", "docx", "firebase_admin", "google.cloud.firestore",
+                 "google.cloud.storage", "jose", "cryptography"]
+HEALTH_TIMEOUT_SECONDS = 30
+
+IMPORT_SCRIPT = """
+import sys, time, json
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+print(json.dumps({"importMs": elapsed * 1000, "heavy": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+def import_run() -> Dict[str, Any]:
+    completed = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def health_run() -> float:
+    """Milliseconds from launching uvicorn until GET /health returns 200"""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+                              cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < HEALTH_TIMEOUT_SECONDS:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.005)
+        raise RuntimeError("/health did not answer in time")
+    finally:
+        server.terminate()
+        server.wait()
+
+def import_profile(top: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Slowest modules by cumulative and by self time, from -X importtime"""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        rows.append({"module": name.strip(), "selfMs": round(int(self_us) / 1000, 1),
+                     "cumulativeMs": round(int(cumulative_us) / 1000, 1)})
+    return {
+        "byCumulative": sorted(rows, key=lambda row: row["cumulativeMs"], reverse=True)[:top],
+        "bySelf": sorted(rows, key=lambda row: row["selfMs"], reverse=True)[:top],
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per measurement")
+    parser.add_argument("--top", type=int, default=15, help="modules listed in the import profile")
+    parser.add_argument("--no-server", action="store_true", help="skip the uvicorn /health measurement")
+    args = parser.parse_args()
+
+    imports = [import_run() for _ in range(args.runs)]
+    results: Dict[str, Any] = {
+        "runs": args.runs,
+        "importMainMs": {"median": round(statistics.median(run["importMs"] for run in imports), 1),
+                         "min": round(min(run["importMs"] for run in imports), 1)},
+        "heavyModules": imports[0]["heavy"],
+    }
+    if not args.no_server:
+        health = [health_run() for _ in range(args.runs)]
+        results["healthReadyMs"] = {"median": round(statistics.median(health), 1), "min": round(min(health), 1)}
+    results["importProfile"] = import_profile(args.top)
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Deterministic synthetic resume corpus for benchmarks.
+
+The same seed always yields the same resume text, so runs on different
+machines or commits measure identical inputs.
+"""
+import random
+from datetime import datetime
+from io import BytesIO
+from typing import List, Tuple
+
+FIRST_NAMES = ["Avery", "Jordan", "Priya", "Mateo", "Chen", "Fatima", "Lukas", "Amara", "Kenji", "Sofia"]
+LAST_NAMES = ["Patel", "Nguyen", "Garcia", "Okafor", "Schmidt", "Kim", "Rossi", "Haddad", "Silva", "Moreau"]
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Marketing Specialist", "Financial Analyst", "DevOps Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Enterprises"]
+SKILLS = ["Python", "JavaScript", "Java", "React", "Angular", "SQL", "HTML", "CSS", "Node.js", "Git", "Docker",
+          "AWS", "Azure", "machine learning", "data analysis", "leadership", "communication", "teamwork",
+          "project management", "time management", "Tableau", "Kubernetes", "Go", "C++"]
+VERBS = ["Led", "Developed", "Implemented", "Designed", "Optimized", "Automated", "Migrated", "Launched"]
+OBJECTS = ["a payment service", "the reporting pipeline", "a customer dashboard", "CI/CD workflows",
+           "the onboarding flow", "an internal analytics platform", "a recommendation engine"]
+IMPACTS = ["reducing latency by {n}%", "saving ${k}k per year", "growing revenue {n}%",
+           "cutting costs by {n}%", "serving {k}k daily users", "for {y} years"]
+
+SIZES = {"small": 1, "medium": 2, "large": 3, "huge": 12}
+
+def resume_lines(seed: int, pages: int) -> List[str]:
+    rng = random.Random(seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name.upper(),
+        f"{name.split()[0].lower()}.{seed}@example.com | (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "PROFESSIONAL SUMMARY:",
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience in {', '.join(rng.sample(SKILLS, 4))}.",
+        "EDUCATION:",
+        f"Bachelor of Science in Computer Science, State University ({rng.randint(2005, 2020)})",
+        "SKILLS:",
+        ", ".join(rng.sample(SKILLS, rng.randint(4, 10))),
+        "EXPERIENCE:",
+    ]
+    # Roughly 45 lines of experience bullets per page
+    for _ in range(pages * 45 - len(lines)):
+        impact = rng.choice(IMPACTS).format(n=rng.randint(5, 60), k=rng.randint(10, 900), y=rng.randint(1, 8))
+        lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} at {rng.choice(COMPANIES)}, {impact}")
+    return lines
+
+def resume_pdf(seed: int, pages: int) -> bytes:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+    buffer = BytesIO()
+    # invariant=1 drops the creation date and random document id, so output bytes are stable
+    pdf = canvas.Canvas(buffer, pagesize=letter, invariant=1)
+    y = 750
+    for line in resume_lines(seed, pages):
+        if y < 60:
+            pdf.showPage()
+            y = 750
+        pdf.drawString(60, y, line[:100])
+        y -= 15
+    pdf.save()
+    return buffer.getvalue()
+
+def resume_docx(seed: int, pages: int) -> bytes:
+    import docx
+    document = docx.Document()
+    document.core_properties.created = datetime(2024, 1, 1)
+    document.core_properties.modified = datetime(2024, 1, 1)
+    for line in resume_lines(seed, pages):
+        document.add_paragraph(line)
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def build_corpus(count: int, size: str = "small", formats: Tuple[str, ...] = ("pdf", "docx"), seed: int = 0) -> List[Tuple[str, bytes]]:
+    """Return count (filename, content) pairs, alternating through the requested formats"""
+    pages = SIZES[size]
+    corpus = []
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        render = resume_pdf if fmt == "pdf" else resume_docx
+        corpus.append((f"resume-{size}-{seed + i}.{fmt}", render(seed + i, pages)))
+    return corpus
@@ -0,0 +1,212 @@
+"""Load-test the interview API with concurrent simulated interview sessions.
+
+Each session starts an interview, answers until the API reports done and
+finishes it. Every concurrency level runs that many sessions at once, each
+repeating --rounds times, and reports requests/second and latency
+percentiles. By default the API is started under uvicorn with the in-memory
+repository and the local token verifier, so no Firebase project is needed;
+--db-latency-ms adds a simulated round trip to every repository call, to
+approximate a networked store such as Firestore.
+
+    python -m benchmarks.load_test --sessions 50 200 1000 --db-latency-ms 20
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --key-file key.pem
+"""
+import sys
+import os
+import json
+import time
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from services.auth import LocalTokenVerifier
+from services.repository import set_repository
+from services.memory_repository import MemoryRepository
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class DelayedRepository:
+    """Wraps a repository so every call first waits out a simulated network round trip"""
+
+    def __init__(self, inner, latency_seconds: float):
+        self.inner = inner
+        self.latency_seconds = latency_seconds
+
+    def __getattr__(self, name: str):
+        method = getattr(self.inner, name)
+
+        async def call(*args, **kwargs):
+            await asyncio.sleep(self.latency_seconds)
+            return await method(*args, **kwargs)
+        return call
+
+def build_app():
+    """uvicorn factory for the server under test"""
+    latency_ms = float(os.getenv("LOAD_TEST_DB_LATENCY_MS", "0"))
+    set_repository(DelayedRepository(MemoryRepository(), latency_ms / 1000) if latency_ms else MemoryRepository())
+    from main import app
+    return app
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(key_file: str, port: int, db_latency_ms: float) -> subprocess.Popen:
+    env = os.environ | {"AUTH_VERIFIER": "local", "AUTH_LOCAL_KEY_FILE": key_file,
+                        "LOAD_TEST_DB_LATENCY_MS": str(db_latency_ms)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.load_test:build_app", "--factory",
+         "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("API did not start within 30s")
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+class Connection:
+    """Minimal keep-alive HTTP/1.1 JSON client; one per simulated session, like one browser tab.
+
+    httpx spends several times the server's CPU per request, which on small
+    machines would make the load generator the bottleneck.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def request(self, method: str, path: str, token: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        payload = json.dumps(body).encode()
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nAuthorization: Bearer {token}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload
+        )
+        try:
+            head = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+            headers = dict(line.split(": ", 1) for line in head[1:] if line)
+            headers = {name.lower(): value for name, value in headers.items()}
+            content = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self.close()
+            raise
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return int(head[0].split()[1]), json.loads(content) if content else None
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+async def run_level(url: str, verifier: LocalTokenVerifier, sessions: int, rounds: int) -> Dict[str, Any]:
+    target = urlsplit(url)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    async def session(index: int) -> None:
+        token = verifier.issue(f"load-user-{index}")
+        connection = Connection(target.hostname, target.port or 80)
+
+        async def call(path: str, body: Dict[str, Any]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            try:
+                status, data = await connection.request("POST", path, token, body)
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                raise RuntimeError(f"{path} failed: {e!r}")
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+                raise RuntimeError(f"{path} returned {status}")
+            return data
+
+        try:
+            for _ in range(rounds):
+                try:
+                    started = await call("/api/interview/start",
+                                         {"role": "Software Engineer", "difficulty": "medium", "mode": "text"})
+                    question, done = started["first_question"], False
+                    while not done:
+                        answered = await call("/api/interview/answer", {
+                            "interview_id": started["interview_id"], "question": question,
+                            "answer": "I led the migration, measured latency before and after, and cut p99 by 40%.",
+                        })
+                        question, done = answered["next_question"], answered["done"]
+                    await call("/api/interview/finish", {"interview_id": started["interview_id"]})
+                except RuntimeError:
+                    continue
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "sessions": sessions,
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsedSeconds": round(elapsed, 2),
+        "requestsPerSecond": round(len(latencies) / elapsed, 1),
+        "p50Ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99Ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[50, 200, 1000], help="concurrency levels")
+    parser.add_argument("--rounds", type=int, default=2, help="interviews each simulated session runs back to back")
+    parser.add_argument("--db-latency-ms", type=float, default=0, help="simulated round trip per repository call")
+    parser.add_argument("--url", help="test an already running API instead of starting one")
+    parser.add_argument("--key-file", help="PEM key the API's local verifier uses (required with --url)")
+    args = parser.parse_args()
+
+    server = None
+    key_file = args.key_file
+    if key_file is None:
+        if args.url:
+            parser.error("--key-file is required with --url")
+        verifier = LocalTokenVerifier()
+        with tempfile.NamedTemporaryFile("wb", suffix=".pem", delete=False) as handle:
+            handle.write(verifier.private_key_pem)
+            key_file = handle.name
+    else:
+        verifier = LocalTokenVerifier(open(key_file, "rb").read())
+
+    url = args.url
+    if url is None:
+        port = free_port()
+        server = start_server(key_file, port, args.db_latency_ms)
+        url = f"http://127.0.0.1:{port}"
+    try:
+        results = [asyncio.run(run_level(url, verifier, sessions, args.rounds)) for sessions in args.sessions]
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if args.key_file is None:
+            os.unlink(key_file)
+    print(json.dumps({"url": url, "rounds": args.rounds, "dbLatencyMs": args.db_latency_ms, "levels": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure question bank index build time, memory and per-turn selection latency on a synthetic bank.
+
+Each simulated interview asks --turns questions in a row, the way
+submit_answer does, with the previously asked questions as the skip list.
+
+    python -m benchmarks.question_select --questions 100000 --interviews 5000
+"""
+import sys
+import os
+import json
+import time
+import uuid
+import random
+import argparse
+import tracemalloc
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.question_bank import QuestionBank, Question, DIFFICULTIES, OPENING_TOPIC, question_bank
+
+TOPICS = ["fundamentals", "design", "debugging", "teamwork", "performance", "testing", "security", "communication"]
+
+def synthetic_questions(count: int, seed: int = 7) -> List[Question]:
+    rng = random.Random(seed)
+    roles = list(question_bank.roles)
+    return [
+        Question(f"q-{i}", f"Synthetic question {i}?", [rng.choice(roles)], rng.choice(DIFFICULTIES),
+                 OPENING_TOPIC if i % 50 == 0 else rng.choice(TOPICS),
+                 ["text", "voice"] if rng.random() < 0.8 else ["text"], ["point a", "point b"])
+        for i in range(count)
+    ]
+
+def percentile(sorted_values, pct: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=100000)
+    parser.add_argument("--interviews", type=int, default=5000)
+    parser.add_argument("--turns", type=int, default=5)
+    args = parser.parse_args()
+
+    questions = synthetic_questions(args.questions)
+    started = time.perf_counter()
+    bank = QuestionBank(question_bank.roles, questions)
+    build_seconds = time.perf_counter() - started
+    # Measured on a second build; tracing slows allocation too much to time under it
+    tracemalloc.start()
+    indexed = QuestionBank(question_bank.roles, questions)
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    del indexed
+    tracemalloc.stop()
+
+    rng = random.Random(11)
+    roles = list(bank.roles)
+    latencies = []
+    for _ in range(args.interviews):
+        interview_id = str(uuid.uuid4())
+        role, difficulty, mode = rng.choice(roles), rng.choice(DIFFICULTIES), rng.choice(["text", "voice"])
+        asked = []
+        for turn in range(args.turns):
+            started = time.perf_counter()
+            question = bank.select(role, difficulty, mode, asked=asked, seed=interview_id,
+                                   topic=OPENING_TOPIC if turn == 0 else None)
+            latencies.append(time.perf_counter() - started)
+            asked.append(question.text)
+
+    latencies.sort()
+    print(json.dumps({
+        "questions": args.questions,
+        "buildSeconds": round(build_seconds, 3),
+        "indexMemoryMb": round(memory_mb, 1),
+        "selections": len(latencies),
+        "selectP50Us": round(percentile(latencies, 50) * 1e6, 1),
+        "selectP99Us": round(percentile(latencies, 99) * 1e6, 1),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
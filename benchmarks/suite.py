@@ -0,0 +1,258 @@
+"""Run the hot-path benchmark suite and write the results as JSON, or compare two result files.
+
+Cases cover resume text extraction (PDF and DOCX at several sizes), rule
+scoring, answer evaluation, PDF report rendering and full HTTP round trips
+through the app with the in-memory repository and the local token verifier.
+Inputs are deterministic (benchmarks.corpus and fixed seeds), and every case
+runs in its own process so its peak RSS is its own. Each case reports
+throughput, p50/p99 latency and peak RSS.
+
+    python -m benchmarks.suite --out bench.json
+    python -m benchmarks.suite --cases rules_small evaluate_answer --iterations 500
+    python -m benchmarks.suite --out new.json --compare bench.json    # exit 1 on regressions
+    python -m benchmarks.suite --compare bench.json new.json          # compare without running
+"""
+import sys
+import os
+import json
+import time
+import platform
+import argparse
+import subprocess
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import build_corpus
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, so peak RSS is reported as null
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIZES = ["small", "medium", "large"]
+DEFAULT_ITERATIONS = 200
+# A case regresses when p50 or peak RSS grows, or throughput drops, by more than this fraction
+DEFAULT_THRESHOLD = 0.10
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def timed(operations: List[Callable[[], Any]]) -> List[float]:
+    latencies = []
+    for operation in operations:
+        started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+# Each case builds its inputs, then returns one zero-argument call per measured operation
+
+def extract_case(fmt: str, size: str, iterations: int) -> List[Callable[[], Any]]:
+    from services.extraction import extract_text_from_file
+    corpus = build_corpus(min(iterations, 20), size, formats=(fmt,))
+    return [lambda doc=corpus[i % len(corpus)]: extract_text_from_file(doc[1], doc[0]) for i in range(iterations)]
+
+def rules_case(size: str, iterations: int) -> List[Callable[[], Any]]:
+    from services.extraction import extract_text_from_file
+    from services.ai import analyze_resume_with_rules
+    texts = [extract_text_from_file(content, name) for name, content in build_corpus(min(iterations, 20), size)]
+    return [lambda text=texts[i % len(texts)]: analyze_resume_with_rules(text) for i in range(iterations)]
+
+def evaluate_answer_case(iterations: int) -> List[Callable[[], Any]]:
+    from benchmarks.answer_scoring import synthetic_answers
+    from services.ai import evaluate_answer
+    return [lambda item=item: evaluate_answer(*item) for item in synthetic_answers(iterations)]
+
+def pdf_render_case(iterations: int) -> List[Callable[[], Any]]:
+    from services.extraction import extract_text_from_file
+    from services.ai import analyze_resume_with_rules
+    from services.pdf_generator import render_resume_analysis_pdf
+    analyses = [analyze_resume_with_rules(extract_text_from_file(content, name))
+                for name, content in build_corpus(10, "small")]
+    # Rendered directly, bypassing the render cache
+    return [lambda analysis=analyses[i % len(analyses)]: render_resume_analysis_pdf(analysis, "resume.pdf")
+            for i in range(iterations)]
+
+def http_client():
+    from fastapi.testclient import TestClient
+    from services.auth import LocalTokenVerifier, set_token_verifier
+    from services.repository import set_repository, create_repository
+    import main as api
+    set_repository(create_repository("memory"))
+    verifier = LocalTokenVerifier()
+    set_token_verifier(verifier)
+    return TestClient(api.app), {"Authorization": f"Bearer {verifier.issue('bench-user')}"}
+
+def http_interview_case(iterations: int) -> List[Callable[[], Any]]:
+    """One operation per request of an interview: start, answers until done, finish, then the history page"""
+    from benchmarks.answer_scoring import synthetic_answers
+    client, headers = http_client()
+    answers = [item[2] for item in synthetic_answers(50)]
+    state: Dict[str, Any] = {}
+
+    def call(method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        response = client.request(method, path, json=body, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    def start() -> None:
+        started = call("POST", "/api/interview/start", {"role": "Software Engineer", "difficulty": "medium", "mode": "text"})
+        state.update(id=started["interview_id"], question=started["first_question"], done=False, turn=0)
+
+    def answer() -> None:
+        result = call("POST", "/api/interview/answer", {"interview_id": state["id"], "question": state["question"],
+                                                        "answer": answers[state["turn"] % len(answers)]})
+        state.update(question=result["next_question"] or state["question"], done=result["done"], turn=state["turn"] + 1)
+
+    operations = []
+    # Interviews ask 5 questions: start, 5 answers, finish, history = 8 requests
+    for i in range(iterations):
+        step = i % 8
+        if step == 0:
+            operations.append(start)
+        elif step <= 5:
+            operations.append(answer)
+        elif step == 6:
+            operations.append(lambda: call("POST", "/api/interview/finish", {"interview_id": state["id"]}))
+        else:
+            operations.append(lambda: call("GET", "/api/interview/list?view=summary"))
+    return operations
+
+def http_resume_case(iterations: int) -> List[Callable[[], Any]]:
+    """Resume uploads, each a distinct document so the result cache never hits"""
+    from services.ai import PARSER_WORKERS
+    client, headers = http_client()
+    os.environ.pop("RESUME_CACHE_DIR", None)
+    corpus = build_corpus(iterations + PARSER_WORKERS, "small")
+
+    def upload(name: str, content: bytes) -> None:
+        client.post("/api/resume/analyze", files={"file": (name, content)}, headers=headers).raise_for_status()
+    # Start the parser processes before timing
+    for name, content in corpus[iterations:]:
+        upload(name, content)
+    return [lambda doc=doc: upload(*doc) for doc in corpus[:iterations]]
+
+CASES: Dict[str, Callable[[int], List[Callable[[], Any]]]] = {}
+for _size in SIZES:
+    for _fmt in ("pdf", "docx"):
+        CASES[f"extract_{_fmt}_{_size}"] = lambda n, fmt=_fmt, size=_size: extract_case(fmt, size, n)
+    CASES[f"rules_{_size}"] = lambda n, size=_size: rules_case(size, n)
+CASES["evaluate_answer"] = evaluate_answer_case
+CASES["pdf_render"] = pdf_render_case
+CASES["http_interview"] = http_interview_case
+CASES["http_resume_analyze"] = http_resume_case
+
+def run_case(name: str, iterations: int) -> Dict[str, Any]:
+    """Runs in the case's own process"""
+    warmup = max(1, min(10, iterations // 10))
+    # Extra operations warm lazy imports and caches the way a running server would be; only the
+    # fresh ones after them are timed, so inputs meant to miss caches still miss
+    operations = CASES[name](iterations + warmup)
+    for operation in operations[:warmup]:
+        operation()
+    started = time.perf_counter()
+    latencies = timed(operations[warmup:])
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "throughputPerSecond": round(iterations / elapsed, 1),
+        "p50Ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99Ms": round(percentile(latencies, 99) * 1000, 3),
+        "meanMs": round(sum(latencies) / len(latencies) * 1000, 3),
+        # ru_maxrss is in KiB on Linux
+        "peakRssMb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1) if resource else None,
+    }
+
+def spawn_case(name: str, iterations: int) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--run-case", name, "--iterations", str(iterations)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+    }
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> Dict[str, Any]:
+    """Relative change per case and metric (positive is worse), and the changes beyond threshold"""
+    changes: Dict[str, Dict[str, float]] = {}
+    regressions = []
+    for name, new in current["cases"].items():
+        old = baseline["cases"].get(name)
+        if not old or "error" in old or "error" in new:
+            continue
+        worse = {}
+        for metric in ("p50Ms", "p99Ms", "throughputPerSecond", "peakRssMb"):
+            # Null where a platform cannot measure it (peak RSS on Windows)
+            if not old.get(metric) or new.get(metric) is None:
+                continue
+            ratio = new[metric] / old[metric]
+            worse[metric] = 1 - ratio if metric == "throughputPerSecond" else ratio - 1
+        changes[name] = {metric: round(value, 3) for metric, value in worse.items()}
+        # p99 is too noisy over a few hundred samples to gate on
+        for metric in ("p50Ms", "throughputPerSecond", "peakRssMb"):
+            if worse.get(metric, 0.0) > threshold:
+                regressions.append({"case": name, "metric": metric, "baseline": old[metric], "current": new[metric],
+                                    "worseBy": round(worse[metric], 3)})
+    return {"baseline": baseline.get("environment", {}).get("commit"),
+            "current": current.get("environment", {}).get("commit"),
+            "threshold": threshold, "changes": changes, "regressions": regressions}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), help="cases to run (default: all)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="measured operations per case")
+    parser.add_argument("--out", help="write the results to this file")
+    parser.add_argument("--compare", nargs="+", metavar="FILE",
+                        help="baseline results; with a second file, compare the two without running")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case, args.iterations)))
+        return
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes a baseline file and optionally a current file")
+
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[1], "r", encoding="utf-8") as f:
+            results = json.load(f)
+    else:
+        results = {"environment": environment(), "iterations": args.iterations, "cases": {}}
+        for name in args.cases or list(CASES):
+            results["cases"][name] = spawn_case(name, args.iterations)
+            print(f"{name}: {json.dumps(results['cases'][name])}", file=sys.stderr, flush=True)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+    if not args.compare:
+        print(json.dumps(results, indent=2))
+        return
+    with open(args.compare[0], "r", encoding="utf-8") as f:
+        report = compare(json.load(f), results, args.threshold)
+    print(json.dumps(report, indent=2))
+    if report["regressions"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -4,22 +4,40 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from fastapi import FastAPI, Depends, UploadFile, File, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Depends, UploadFile, File, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from services.auth import verify_firebase_token
-from services.db import users_col, interviews_col, attempts_col
-from services.ai import evaluate_answer, analyze_resume
-from services.pdf_generator import generate_resume_analysis_pdf
+from services.auth import verify_firebase_token, verify_id_token
+from services.repository import (
+    get_repository, NotFoundError, ConflictError, apply_answer, encode_cursor, decode_cursor,
+    INTERVIEW_SUMMARY_FIELDS, RESUME_ANALYSIS_SUMMARY_FIELDS
+)
+from services.sessions import (
+    start_session, load_session, record_session_answer, close_session, SessionWriter, SESSION_WRITE_ATTEMPTS
+)
+from services.question_bank import question_bank, OPENING_TOPIC
+from services.rollups import answer_rollups, finish_rollups, progress, ROLLUP_MAX_BUCKETS
+from services.ai import evaluate_answer, build_interview_report, analyze_resume, stream_resume_analysis, analyze_resume_batch
+from services.sandbox import DocumentParseError
+from services.executors import run_cpu
+from services.metrics import MetricsMiddleware, render_metrics, METRICS_ENABLED, METRICS_TOKEN
+from services.voice import VoiceAnswer, TranscriberUnavailable, TranscriptionError, get_transcriber, VOICE_SAMPLE_RATE, VOICE_MAX_SECONDS
+from services.jobs import get_report_jobs, JobQueueFull
 from models.schemas import (
     Profile, InterviewStartRequest, InterviewStartResponse,
     AnswerRequest, AnswerResponse, FinishRequest, Report
 )
-from google.cloud.firestore import Client
+from pydantic import ValidationError
 from datetime import datetime
+import copy
+import hmac
 import uuid
-import tempfile
-from typing import Dict, Any
+import json
+import asyncio
+import time
+import zipfile
+from io import BytesIO
+from typing import Dict, Any, List, Tuple, Optional, Literal
 
 app = FastAPI(title="AI Interviewer API")
 
@@ -36,14 +54,24 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if METRICS_ENABLED:
+    # Added last so it is outermost and times everything, CORS included
+    app.add_middleware(MetricsMiddleware)
 
 @app.get("/health")
-def health():
+async def health():
     return {"ok": True}
 
+@app.get("/metrics")
+async def metrics(request: Request):
+    """Prometheus text exposition; set METRICS_TOKEN to require it as a Bearer token"""
+    if METRICS_TOKEN and not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return Response(render_metrics(), media_type="text/plain; version=0.0.4")
+
 # Convenience root
 @app.get("/")
-def root():
+async def root():
     return {
         "message": "AI Interviewer API running",
         "health": "/health",
@@ -52,25 +80,23 @@ def root():
 
 # 1) Profile
 @app.get("/api/profile")
-def get_profile(user=Depends(verify_firebase_token)):
+async def get_profile(user=Depends(verify_firebase_token)):
     uid = user["uid"]
-    doc = users_col().document(uid).get()
-    return doc.to_dict() or {}
+    return await get_repository().get_user(uid) or {}
 
 @app.put("/api/profile")
-def update_profile(body: Profile, user=Depends(verify_firebase_token)):
+async def update_profile(body: Profile, user=Depends(verify_firebase_token)):
     uid = user["uid"]
     data = {k: v for k, v in body.dict().items() if v is not None}
-    users_col().document(uid).set(data, merge=True)
+    await get_repository().merge_user(uid, data)
     return {"ok": True}
 
 # 2) Interview start
-@app.post("/api/interview/start", response_model=InterviewStartResponse)
-def start_interview(body: InterviewStartRequest, user=Depends(verify_firebase_token)):
-    uid = user["uid"]
+async def begin_interview(uid: str, body: InterviewStartRequest) -> InterviewStartResponse:
     interview_id = str(uuid.uuid4())
-    first_question = f"Why do you want the role {body.role}?"
-    interviews_col().document(interview_id).set({
+    opening = question_bank.select(body.role, body.difficulty, body.mode, seed=interview_id, topic=OPENING_TOPIC)
+    first_question = opening.text if opening else f"Why do you want the role {body.role}?"
+    await start_session(interview_id, {
         "userId": uid,
         "role": body.role,
         "difficulty": body.difficulty,
@@ -79,102 +105,405 @@ def start_interview(body: InterviewStartRequest, user=Depends(verify_firebase_to
         "status": "active",
         "questionsAsked": [first_question],
         "scores": [],
+        "answerCount": 0,
+        "scoreTotal": 0,
     })
     return InterviewStartResponse(interview_id=interview_id, first_question=first_question)
 
+@app.post("/api/interview/start", response_model=InterviewStartResponse)
+async def start_interview(body: InterviewStartRequest, user=Depends(verify_firebase_token)):
+    return await begin_interview(user["uid"], body)
+
 # 3) Submit answer (evaluate)
-@app.post("/api/interview/answer", response_model=AnswerResponse)
-def submit_answer(body: AnswerRequest, user=Depends(verify_firebase_token)):
-    uid = user["uid"]
-    interview_ref = interviews_col().document(body.interview_id)
-    interview = interview_ref.get()
-    if not interview.exists or interview.to_dict().get("userId") != uid:
-        raise HTTPException(status_code=404, detail="Interview not found")
-
-    eval_result = evaluate_answer(interview.to_dict()["role"], body.question, body.answer)
-    attempts_col().add({
-        "interviewId": body.interview_id,
-        "question": body.question,
-        "answer": body.answer,
+def plan_turn(interview_id: str, interview_data: Dict[str, Any], question: str) -> Tuple[bool, Optional[str]]:
+    """Whether answering `question` completes the interview, and the next question if it does not"""
+    # Naive flow control: ask up to 5 questions
+    answered = interview_data.get("answerCount", len(interview_data.get("scores", [])))
+    if answered + 1 >= 5:
+        return True, None
+    asked = interview_data.get("questionsAsked", []) + [question]
+    picked = question_bank.select(interview_data["role"], interview_data.get("difficulty", "medium"),
+                                  interview_data.get("mode", "text"), asked=asked, seed=interview_id)
+    return False, picked.text if picked else f"Tell me about a challenge in {interview_data['role']}."
+
+def turn_attempt(uid: str, interview_id: str, question: str, answer: str, eval_result: Dict[str, Any],
+                 answered_at: datetime) -> Dict[str, Any]:
+    return {
+        "interviewId": interview_id,
+        "question": question,
+        "answer": answer,
         "score": eval_result["score"],
         "components": eval_result["components"],
         "feedback": eval_result["feedback"],
-        "createdAt": datetime.utcnow().isoformat(),
+        "createdAt": answered_at.isoformat(),
         "userId": uid,
-    })
+    }
 
-    # Naive flow control: ask up to 5 questions
-    interview_data = interview.to_dict()
-    asked = interview_data.get("questionsAsked", [])
-    done = len(asked) >= 5
-    next_q = None if done else f"Tell me about a challenge in {interview_data['role']}."
-
-    interview_ref.update({
-        "questionsAsked": asked + [body.question],
-        "scores": interview_data.get("scores", []) + [eval_result["score"]],
-    })
+async def answer_turn(uid: str, interview_id: str, question: str, answer: str) -> AnswerResponse:
+    """Evaluate and record one answer, and pick the next question"""
+    eval_result = None
+    # Sessions come from the write-through cache; a version conflict means another worker wrote, so re-read
+    for _ in range(SESSION_WRITE_ATTEMPTS):
+        interview_data, version = await load_session(interview_id)
+        if interview_data is None or interview_data.get("userId") != uid:
+            raise HTTPException(status_code=404, detail="Interview not found")
 
-    return AnswerResponse(
-        score=eval_result["score"],
-        components=eval_result["components"],
-        feedback=eval_result["feedback"],
-        next_question=next_q,
-        done=done,
-    )
+        if eval_result is None:
+            eval_result = await run_cpu(evaluate_answer, interview_data["role"], question, answer)
+
+        done, next_q = plan_turn(interview_id, interview_data, question)
+
+        # Attempt insert, interview update and analytics rollups commit together as appends/increments
+        answered_at = datetime.utcnow()
+        try:
+            await record_session_answer(interview_id, interview_data, version,
+                turn_attempt(uid, interview_id, question, answer, eval_result, answered_at),
+                [question] + ([next_q] if next_q else []), eval_result["score"],
+                rollups=answer_rollups(uid, interview_data["role"], eval_result["score"], eval_result["components"], answered_at))
+        except ConflictError:
+            continue
+        except NotFoundError:
+            raise HTTPException(status_code=404, detail="Interview not found")
+
+        return AnswerResponse(
+            score=eval_result["score"],
+            components=eval_result["components"],
+            feedback=eval_result["feedback"],
+            next_question=next_q,
+            done=done,
+        )
+    raise HTTPException(status_code=409, detail="Interview is being updated concurrently, please retry")
+
+@app.post("/api/interview/answer", response_model=AnswerResponse)
+async def submit_answer(body: AnswerRequest, user=Depends(verify_firebase_token)):
+    return await answer_turn(user["uid"], body.interview_id, body.question, body.answer)
+
+# Voice answers: audio streamed over a WebSocket, transcribed while the candidate speaks
+WS_RECEIVE_TIMEOUT_SECONDS = float(os.getenv("WS_RECEIVE_TIMEOUT_SECONDS", "30"))
+
+async def ws_receive(websocket: WebSocket) -> Tuple[Optional[bytes], Optional[Dict[str, Any]]]:
+    """Next message as (binary payload, None) or (None, parsed JSON); raises WebSocketDisconnect or HTTPException"""
+    try:
+        message = await asyncio.wait_for(websocket.receive(), WS_RECEIVE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=408, detail="Timed out waiting for a message")
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    if message.get("bytes") is not None:
+        return message["bytes"], None
+    try:
+        data = json.loads(message.get("text") or "")
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Messages must be JSON objects")
+    return None, data
+
+async def ws_error(websocket: WebSocket, error: HTTPException) -> None:
+    """Report an error as an HTTP endpoint would, then close with code 4000 + the HTTP status"""
+    await websocket.send_json({"type": "error", "status": error.status_code, "detail": error.detail})
+    await websocket.close(code=4000 + error.status_code)
+
+@app.websocket("/api/interview/voice")
+async def voice_answer(websocket: WebSocket):
+    """One spoken answer: a start message, binary 16-bit mono PCM chunks, then {"type": "end"} (see README)"""
+    await websocket.accept()
+    answer = None
+    try:
+        try:
+            transcriber = get_transcriber()
+        except TranscriberUnavailable as e:
+            raise HTTPException(status_code=503, detail=f"Voice answers are unavailable: {str(e)}")
+        _, start = await ws_receive(websocket)
+        if start is None or start.get("type") != "start":
+            raise HTTPException(status_code=400, detail="Expected a start message")
+        # Browsers cannot set headers on WebSockets, so the ID token comes in the first message
+        user = await verify_id_token(str(start.get("token", "")))
+        interview_id, question = start.get("interview_id"), start.get("question")
+        if not isinstance(interview_id, str) or not isinstance(question, str) or not question:
+            raise HTTPException(status_code=400, detail="start needs interview_id and question")
+        sample_rate = start.get("sample_rate", VOICE_SAMPLE_RATE)
+        if not isinstance(sample_rate, int) or not 8000 <= sample_rate <= 48000:
+            raise HTTPException(status_code=400, detail="sample_rate must be 8000-48000")
+        interview_data, _ = await load_session(interview_id)
+        if interview_data is None or interview_data.get("userId") != user["uid"]:
+            raise HTTPException(status_code=404, detail="Interview not found")
+
+        answer = VoiceAnswer(sample_rate, transcriber)
+        await websocket.send_json({"type": "ready"})
+        while True:
+            chunk, message = await ws_receive(websocket)
+            if chunk is None:
+                if message.get("type") == "end":
+                    break
+                raise HTTPException(status_code=400, detail="Expected audio or an end message")
+            answer.feed(chunk)
+            if answer.seconds > VOICE_MAX_SECONDS:
+                raise HTTPException(status_code=413, detail=f"Answers are limited to {VOICE_MAX_SECONDS:.0f} seconds")
+            for text in answer.ready():
+                await websocket.send_json({"type": "partial", "text": text})
+
+        transcript = await answer.finish()
+        if not transcript:
+            raise HTTPException(status_code=422, detail="No speech detected")
+        result = await answer_turn(user["uid"], interview_id, question, transcript)
+        await websocket.send_json({"type": "result", "transcript": transcript} | result.dict())
+        await websocket.close()
+    except HTTPException as e:
+        if answer is not None:
+            answer.cancel()
+        await ws_error(websocket, e)
+    except TranscriptionError as e:
+        print(f"Voice transcription failed: {str(e)}")
+        answer.cancel()
+        await ws_error(websocket, HTTPException(status_code=502, detail="Transcription failed"))
+    except WebSocketDisconnect:
+        if answer is not None:
+            answer.cancel()
 
 # 4) Finish interview (aggregate report)
+async def finish_turn(uid: str, interview_id: str) -> Report:
+    for _ in range(SESSION_WRITE_ATTEMPTS):
+        interview_data, version = await load_session(interview_id)
+        if interview_data is None or interview_data.get("userId") != uid:
+            raise HTTPException(status_code=404, detail="Interview not found")
+
+        report: Report = Report(**build_interview_report(interview_id, interview_data))
+
+        # Conditioned on the version the report was computed from, so a racing answer is never left out
+        finished_at = datetime.utcnow()
+        # Finishing again only refreshes the report; the interview already counts toward analytics
+        rollups = None if interview_data.get("status") == "finished" else \
+            finish_rollups(uid, interview_data["role"], report.score, finished_at)
+        try:
+            await close_session(interview_id, version, {
+                "status": "finished", "report": report.dict(), "finishedAt": finished_at.isoformat(),
+            }, rollups=rollups)
+        except ConflictError:
+            continue
+        except NotFoundError:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        return report
+    raise HTTPException(status_code=409, detail="Interview is being updated concurrently, please retry")
+
 @app.post("/api/interview/finish", response_model=Report)
-def finish_interview(body: FinishRequest, user=Depends(verify_firebase_token)):
-    uid = user["uid"]
-    interview_ref = interviews_col().document(body.interview_id)
-    interview = interview_ref.get()
-    if not interview.exists or interview.to_dict().get("userId") != uid:
-        raise HTTPException(status_code=404, detail="Interview not found")
-
-    scores = interview.to_dict().get("scores", []) or [60]
-    overall = round(sum(scores) / len(scores))
-    components = {"technical": overall, "communication": max(50, overall - 5), "confidence": max(50, overall - 3)}
-
-    report: Report = Report(
-        interview_id=body.interview_id,
-        score=overall,
-        components=components,
-        strengths=["Clear communication"],
-        weaknesses=["Insufficient examples"],
-        tips=["Use STAR format", "Quantify impact"],
-    )
+async def finish_interview(body: FinishRequest, user=Depends(verify_firebase_token)):
+    return await finish_turn(user["uid"], body.interview_id)
 
-    interview_ref.update({"status": "finished", "report": report.dict()})
-    return report
+# Interview sessions: a whole interview over one WebSocket, authenticated and loaded once
+def session_write_error(error: Exception) -> HTTPException:
+    if isinstance(error, NotFoundError):
+        return HTTPException(status_code=404, detail="Interview not found")
+    if isinstance(error, ConflictError):
+        return HTTPException(status_code=409, detail="Interview is being updated concurrently, please retry")
+    print(f"Session write failed: {error!r}")
+    return HTTPException(status_code=500, detail="Could not save answers")
+
+@app.websocket("/api/interview/session")
+async def interview_session(websocket: WebSocket):
+    """A start or resume message, then answer messages, then finish (see README)"""
+    await websocket.accept()
+    writer = None
+    try:
+        _, hello = await ws_receive(websocket)
+        kind = hello.get("type") if hello else None
+        if kind not in ("start", "resume"):
+            raise HTTPException(status_code=400, detail="Expected a start or resume message")
+        user = await verify_id_token(str(hello.get("token", "")))
+        uid = user["uid"]
+        if kind == "start":
+            try:
+                body = InterviewStartRequest(**{name: hello.get(name) for name in ("role", "difficulty", "mode")})
+            except ValidationError:
+                raise HTTPException(status_code=400, detail="start needs role, difficulty and mode")
+            interview_id = (await begin_interview(uid, body)).interview_id
+        else:
+            interview_id = str(hello.get("interview_id", ""))
+        interview_data, version = await load_session(interview_id)
+        if interview_data is None or interview_data.get("userId") != uid:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        if interview_data.get("status") != "active":
+            raise HTTPException(status_code=409, detail="Interview already finished")
+
+        # Answers are stored in the background; this copy runs ahead of the stored one to plan the next turns
+        writer = SessionWriter(interview_id, interview_data, version)
+        view = copy.deepcopy(interview_data)
+        question = view["questionsAsked"][-1]
+        await websocket.send_json({"type": "question", "interview_id": interview_id, "question": question,
+                                   "answered": view.get("answerCount", 0)})
+        while True:
+            _, message = await ws_receive(websocket)
+            if writer.error is not None:
+                raise session_write_error(writer.error)
+            kind = message.get("type") if message else None
+            if kind == "answer":
+                answer = message.get("answer")
+                if not isinstance(answer, str) or not answer.strip():
+                    raise HTTPException(status_code=400, detail="answer must be non-empty text")
+                eval_result = await run_cpu(evaluate_answer, view["role"], question, answer)
+                done, next_q = plan_turn(interview_id, view, question)
+                answered_at = datetime.utcnow()
+                questions = [question] + ([next_q] if next_q else [])
+                apply_answer(view, None, questions, eval_result["score"], eval_result["components"])
+                writer.record(turn_attempt(uid, interview_id, question, answer, eval_result, answered_at),
+                              questions, eval_result["score"],
+                              rollups=answer_rollups(uid, view["role"], eval_result["score"],
+                                                     eval_result["components"], answered_at))
+                await websocket.send_json({"type": "score"} | AnswerResponse(
+                    score=eval_result["score"],
+                    components=eval_result["components"],
+                    feedback=eval_result["feedback"],
+                    next_question=next_q,
+                    done=done,
+                ).dict())
+                question = next_q or question
+            elif kind == "finish":
+                error = await writer.drain()
+                if error is not None:
+                    raise session_write_error(error)
+                report = await finish_turn(uid, interview_id)
+                await websocket.send_json({"type": "report"} | report.dict())
+                await websocket.close()
+                return
+            else:
+                raise HTTPException(status_code=400, detail="Expected an answer or finish message")
+    except HTTPException as e:
+        await ws_error(websocket, e)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # Answers already scored are stored even when the candidate disconnects first
+        if writer is not None and writer.pending:
+            error = await writer.drain()
+            if error is not None:
+                print(f"Session {writer.interview_id} lost answers after disconnect: {error!r}")
 
 # 5) History endpoints
+HISTORY_PAGE_SIZE = int(os.getenv("HISTORY_PAGE_SIZE", "20"))
+HISTORY_MAX_PAGE_SIZE = 100
+
+async def history_page(list_rows, limit: int, after: Optional[str], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Fetch one newest-first page (one extra row tells whether another page follows)"""
+    try:
+        after_key = decode_cursor(after) if after else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    rows = await list_rows(limit=limit + 1, after=after_key, fields=fields)
+    items = rows[:limit]
+    return {"items": items, "nextCursor": encode_cursor(items[-1]) if len(rows) > limit else None}
+
 @app.get("/api/interview/list")
-def list_interviews(user=Depends(verify_firebase_token)):
+async def list_interviews(
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    user=Depends(verify_firebase_token),
+):
+    """Page through the user's interviews; view=summary returns role, status, createdAt and report.score only"""
     uid = user["uid"]
-    docs = interviews_col().where("userId", "==", uid).order_by("createdAt", direction="DESCENDING").stream()
-    return [d.to_dict() | {"id": d.id} for d in docs]
+    fields = INTERVIEW_SUMMARY_FIELDS if view == "summary" else None
+    return await history_page(lambda **page: get_repository().list_interviews(uid, **page), limit, after, fields)
 
 @app.get("/api/interview/{interview_id}")
-def get_interview(interview_id: str, user=Depends(verify_firebase_token)):
+async def get_interview(interview_id: str, user=Depends(verify_firebase_token)):
     uid = user["uid"]
-    d = interviews_col().document(interview_id).get()
-    if not d.exists or d.to_dict().get("userId") != uid:
+    interview_data = await get_repository().get_interview(interview_id)
+    if interview_data is None or interview_data.get("userId") != uid:
         raise HTTPException(status_code=404, detail="Not found")
-    return d.to_dict() | {"id": d.id}
+    return interview_data | {"id": interview_id}
+
+# 6) Analytics
+@app.get("/api/analytics/progress")
+async def get_progress(
+    period: Literal["day", "week"] = "week",
+    count: int = Query(12, ge=1, le=ROLLUP_MAX_BUCKETS),
+    user=Depends(verify_firebase_token),
+):
+    """The user's last `count` days or weeks (oldest first) plus totals, read from precomputed rollup buckets"""
+    return await progress(get_repository(), user["uid"], period, count)
 
 # Resume Analysis endpoints
-@app.post("/api/resume/analyze")
-async def analyze_resume_endpoint(file: UploadFile = File(...)):
-    """Analyze uploaded resume using AI - NO AUTH REQUIRED FOR TESTING"""
-    
+MAX_RESUME_BYTES = 10 * 1024 * 1024
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "500"))
+# Total uncompressed size of the resumes in one batch, ZIP members included
+BATCH_MAX_BYTES = int(os.getenv("BATCH_MAX_BYTES", str(200 * 1024 * 1024)))
+
+async def read_resume_upload(file: UploadFile) -> bytes:
+    """Validate an uploaded resume and return its content"""
     # Validate file type
     if not file.filename.lower().endswith(('.pdf', '.docx')):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
     
     # Check file size (10MB limit)
     content = await file.read()
-    if len(content) > 10 * 1024 * 1024:
+    if len(content) > MAX_RESUME_BYTES:
         raise HTTPException(status_code=400, detail="File size must be less than 10MB")
+    return content
+
+def expand_uploads(uploads: List[Tuple[str, bytes]]) -> Tuple[List[Tuple[str, bytes]], List[Dict[str, Any]]]:
+    """Expand resumes and ZIP archives of resumes into (filename, content) pairs.
+    
+    Entries that cannot be analyzed are returned separately as per-file errors.
+    The batch is checked against BATCH_MAX_FILES and BATCH_MAX_BYTES using the
+    sizes in each archive's directory before any member is inflated.
+    """
+    # (filename, uncompressed size, reader) for every entry that passes the per-file checks
+    planned: List[Tuple[str, int, Any]] = []
+    rejected: List[Dict[str, Any]] = []
+    archives = []
+    
+    def add(filename: str, size: int, read) -> None:
+        if not filename.lower().endswith(('.pdf', '.docx')):
+            rejected.append({"filename": filename, "ok": False, "error": "Only PDF and DOCX files are supported"})
+        elif size > MAX_RESUME_BYTES:
+            rejected.append({"filename": filename, "ok": False, "error": "File size must be less than 10MB"})
+        else:
+            planned.append((filename, size, read))
+    
+    try:
+        for name, content in uploads:
+            if not name.lower().endswith('.zip'):
+                add(name, len(content), lambda content=content: content)
+                continue
+            try:
+                archive = zipfile.ZipFile(BytesIO(content))
+            except zipfile.BadZipFile:
+                rejected.append({"filename": name, "ok": False, "error": "Invalid ZIP archive"})
+                continue
+            archives.append(archive)
+            for member in archive.infolist():
+                if member.is_dir() or member.filename.startswith('__MACOSX/'):
+                    continue
+                add(f"{name}/{member.filename}", member.file_size,
+                    lambda archive=archive, member=member: archive.read(member))
+        
+        if len(planned) > BATCH_MAX_FILES:
+            raise HTTPException(status_code=400, detail=f"A batch can contain at most {BATCH_MAX_FILES} resumes")
+        if sum(size for _, size, _ in planned) > BATCH_MAX_BYTES:
+            raise HTTPException(status_code=400,
+                                detail=f"A batch can contain at most {BATCH_MAX_BYTES // (1024 * 1024)}MB of resumes")
+        
+        accepted: List[Tuple[str, bytes]] = []
+        for filename, _, read in planned:
+            try:
+                accepted.append((filename, read()))
+            except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, RuntimeError) as e:
+                # Corrupt, encrypted or unsupported members fail alone
+                rejected.append({"filename": filename, "ok": False, "error": f"Could not read archive member: {e}"})
+        return accepted, rejected
+    finally:
+        for archive in archives:
+            archive.close()
+
+async def read_batch_uploads(files: List[UploadFile]) -> Tuple[List[Tuple[str, bytes]], List[Dict[str, Any]]]:
+    """Read a batch upload; inflating ZIP archives is CPU work, so it runs off the event loop"""
+    uploads = [(file.filename, await file.read()) for file in files]
+    return await run_cpu(expand_uploads, uploads)
+
+@app.post("/api/resume/analyze")
+async def analyze_resume_endpoint(file: UploadFile = File(...)):
+    """Analyze uploaded resume using AI - NO AUTH REQUIRED FOR TESTING"""
+    content = await read_resume_upload(file)
     
     try:
         # Analyze resume using AI
@@ -189,39 +518,135 @@ async def analyze_resume_endpoint(file: UploadFile = File(...)):
             "message": "Resume analyzed successfully"
         }
         
+    except DocumentParseError as e:
+        # The document itself is unprocessable (corrupt, no text, timeout, memory cap, parser crash)
+        raise HTTPException(status_code=422, detail=f"Resume could not be processed: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+@app.post("/api/resume/analyze/stream")
+async def analyze_resume_stream_endpoint(file: UploadFile = File(...)):
+    """Analyze uploaded resume, streaming stage progress as server-sent events"""
+    content = await read_resume_upload(file)
+    filename = file.filename
+    
+    def sse(event: str, data: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    async def events():
+        try:
+            async for event in stream_resume_analysis(content, filename):
+                if event["event"] == "stage":
+                    yield sse("stage", {"stage": event["stage"], "elapsedMs": event["elapsedMs"]})
+                else:
+                    yield sse("result", {
+                        "analysisId": str(uuid.uuid4()),
+                        "analysis": event["analysis"],
+                        "message": "Resume analyzed successfully"
+                    })
+        except DocumentParseError as e:
+            yield sse("error", {"status": 422, "detail": f"Resume could not be processed: {str(e)}"})
+        except Exception as e:
+            yield sse("error", {"status": 500, "detail": f"Analysis failed: {str(e)}"})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.post("/api/resume/analyze/batch")
+async def analyze_resume_batch_endpoint(files: List[UploadFile] = File(...)):
+    """Analyze many resumes (or ZIP archives of resumes), streaming one NDJSON line per file as it completes"""
+    accepted, rejected = await read_batch_uploads(files)
+    
+    async def lines():
+        started = time.perf_counter()
+        succeeded = 0
+        for entry in rejected:
+            yield json.dumps(entry) + "\n"
+        async for entry in analyze_resume_batch(accepted):
+            succeeded += entry["ok"]
+            yield json.dumps(entry) + "\n"
+        elapsed = time.perf_counter() - started
+        yield json.dumps({"summary": {
+            "total": len(accepted) + len(rejected),
+            "succeeded": succeeded,
+            "failed": len(accepted) + len(rejected) - succeeded,
+            "elapsedMs": round(elapsed * 1000, 2),
+            "resumesPerSecond": round(len(accepted) / elapsed, 2) if elapsed > 0 else None,
+        }}) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @app.get("/api/resume/analysis/{analysis_id}")
-def get_resume_analysis(analysis_id: str, user=Depends(verify_firebase_token)):
+async def get_resume_analysis(analysis_id: str, user=Depends(verify_firebase_token)):
     """Get specific resume analysis by ID"""
     uid = user["uid"]
-    doc = users_col().document(uid).collection("resume_analyses").document(analysis_id).get()
+    analysis = await get_repository().get_resume_analysis(uid, analysis_id)
     
-    if not doc.exists:
+    if analysis is None:
         raise HTTPException(status_code=404, detail="Analysis not found")
     
-    return doc.to_dict()
+    return analysis
 
 @app.get("/api/resume/analyses")
-def list_resume_analyses(user=Depends(verify_firebase_token)):
-    """List all resume analyses for user"""
+async def list_resume_analyses(
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    user=Depends(verify_firebase_token),
+):
+    """List resume analyses for user, a page at a time"""
     uid = user["uid"]
-    docs = users_col().document(uid).collection("resume_analyses").order_by("createdAt", direction="DESCENDING").stream()
-    return [d.to_dict() | {"id": d.id} for d in docs]
+    fields = RESUME_ANALYSIS_SUMMARY_FIELDS if view == "summary" else None
+    return await history_page(lambda **page: get_repository().list_resume_analyses(uid, **page), limit, after, fields)
+
+def pdf_download_response(pdf_bytes: bytes) -> Response:
+    download_name = f"resume-analysis-{datetime.utcnow().strftime('%Y%m%d')}.pdf"
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="{download_name}"'}
+    )
 
 @app.post("/api/resume/analysis/pdf")
 async def download_resume_analysis_pdf(analysis: Dict[str, Any]):
     """Generate and download PDF from analysis data - NO AUTH REQUIRED"""
     try:
-        # Generate PDF from provided analysis
-        pdf_path = generate_resume_analysis_pdf(analysis, "resume.pdf")
+        # Generate PDF from provided analysis on the report pool (rendered in memory, cached by payload)
+        pdf_bytes = await get_report_jobs().render(analysis, "resume.pdf")
         
         # Return PDF file
-        return FileResponse(
-            path=pdf_path,
-            filename=f"resume-analysis-{datetime.utcnow().strftime('%Y%m%d')}.pdf",
-            media_type="application/pdf"
-        )
+        return pdf_download_response(pdf_bytes)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(e)}")
+
+@app.post("/api/resume/analysis/pdf/jobs", status_code=202)
+async def submit_resume_analysis_pdf_job(analysis: Dict[str, Any]):
+    """Queue PDF generation for an analysis and return a job id immediately - NO AUTH REQUIRED"""
+    try:
+        job = get_report_jobs().submit(analysis, "resume.pdf")
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=f"Report queue is full: {str(e)}")
+    return job.to_dict()
+
+@app.get("/api/resume/analysis/pdf/jobs/{job_id}")
+async def get_resume_analysis_pdf_job(job_id: str):
+    """Get the status of a queued PDF report"""
+    job = get_report_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found or expired")
+    return job.to_dict()
+
+@app.get("/api/resume/analysis/pdf/jobs/{job_id}/download")
+async def download_resume_analysis_pdf_job(job_id: str):
+    """Download a finished PDF report"""
+    job = get_report_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Report job not found or expired")
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=job.error)
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail=f"Report is not ready (status: {job.status})")
+    return pdf_download_response(job.result)
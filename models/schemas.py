@@ -37,6 +37,8 @@ class Report(BaseModel):
     interview_id: str
     score: int
     components: Dict[str, int]
+    # 100 when every answer scored the same; lower as answer scores spread
+    consistency: Optional[int] = None
     strengths: List[str] = Field(default_factory=list)
     weaknesses: List[str] = Field(default_factory=list)
     tips: List[str] = Field(default_factory=list)
\ No newline at end of file
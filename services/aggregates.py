@@ -0,0 +1,51 @@
+import math
+from typing import Any, Dict, Iterable, Optional
+
+# Per-answer values aggregated on the interview: the overall score and each component
+COMPONENTS = ["technical", "communication", "confidence"]
+AGGREGATED = ["overall"] + COMPONENTS
+
+def answer_samples(score: float, components: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """The values one answer contributes to the interview's running stats"""
+    samples = {"overall": score}
+    for name in COMPONENTS:
+        if components and name in components:
+            samples[name] = components[name]
+    return samples
+
+def add_samples(stats: Dict[str, Dict[str, float]], samples: Dict[str, float]) -> None:
+    """Fold one answer's samples into stats in place: count, sum, sumSq, min and max per name"""
+    for name, value in samples.items():
+        entry = stats.setdefault(name, {"count": 0, "sum": 0, "sumSq": 0})
+        entry["count"] += 1
+        entry["sum"] += value
+        entry["sumSq"] += value * value
+        entry["min"] = min(entry.get("min", value), value)
+        entry["max"] = max(entry.get("max", value), value)
+
+def stats_from_entries(entries: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Rebuild stats from score entries that carry their components"""
+    stats: Dict[str, Dict[str, float]] = {}
+    for entry in entries:
+        add_samples(stats, answer_samples(entry["score"], entry.get("components")))
+    return stats
+
+def summarize(entry: Dict[str, float]) -> Dict[str, float]:
+    """Mean, population standard deviation, min and max (when tracked) of one aggregated value"""
+    count = entry["count"]
+    mean = entry["sum"] / count
+    # Clamped: rounding in sumSq can push the variance of equal values slightly negative
+    variance = max(0.0, entry["sumSq"] / count - mean * mean)
+    return {"count": count, "mean": mean, "std": math.sqrt(variance), "min": entry.get("min"), "max": entry.get("max")}
+
+def consistency(std: float) -> int:
+    """0-100: 100 when every answer scored the same, 2 points lower per point of standard deviation"""
+    return round(max(0.0, 100 - 2 * std))
+
+def complete_stats(interview: Dict[str, Any]) -> Optional[Dict[str, Dict[str, float]]]:
+    """The interview's stats if they cover every answer, else None (interviews from before stats existed)"""
+    stats = interview.get("stats")
+    answered = interview.get("answerCount", 0)
+    if not stats or not answered or any(stats.get(name, {}).get("count") != answered for name in AGGREGATED):
+        return None
+    return stats
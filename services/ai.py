@@ -1,66 +1,120 @@
 import os
 import json
 import asyncio
-from typing import Dict, Any
-import PyPDF2
-import docx
-from io import BytesIO
+import time
+from typing import Dict, Any, Optional, Callable, AsyncIterator, List, Tuple
 import re
 from datetime import datetime
+from services.cache import ResultCache, content_digest
+from services.sandbox import ParserPool, DocumentParseError
+from services.executors import get_analysis_executor
+from services.metrics import stage, observe_stage, events, register_cache
+from services.keywords import resume_keywords
+from services.aggregates import COMPONENTS, complete_stats, summarize, consistency
+from services.extraction import (
+    extract_text_from_pdf, extract_text_from_docx, extract_text_from_file, extract_text_with_stats,
+    EXTRACT_MAX_PAGES, EXTRACT_MAX_CHARS,
+)
 
-def extract_text_from_pdf(content: bytes) -> str:
-    """Extract text from PDF content"""
-    try:
-        pdf_reader = PyPDF2.PdfReader(BytesIO(content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
-    except Exception as e:
-        raise Exception(f"Failed to extract text from PDF: {str(e)}")
+# Bump whenever extraction or scoring changes so cached results are not reused
+ANALYZER_VERSION = "4"
 
-def extract_text_from_docx(content: bytes) -> str:
-    """Extract text from DOCX content"""
-    try:
-        doc = docx.Document(BytesIO(content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text.strip()
-    except Exception as e:
-        raise Exception(f"Failed to extract text from DOCX: {str(e)}")
+# Extraction and rule scoring run on untrusted uploads, so they happen in
+# sandboxed child processes (one per core by default) with a per-document
+# timeout and address-space cap
+PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", "0")) or os.cpu_count() or 1
+PARSER_TIMEOUT_SECONDS = float(os.getenv("PARSER_TIMEOUT_SECONDS", "15"))
+PARSER_MEMORY_MB = int(os.getenv("PARSER_MEMORY_MB", "768"))
 
-def extract_text_from_file(content: bytes, filename: str) -> str:
-    """Extract text from resume file based on file type"""
-    if filename.lower().endswith('.pdf'):
-        return extract_text_from_pdf(content)
-    elif filename.lower().endswith('.docx'):
-        return extract_text_from_docx(content)
-    else:
-        raise ValueError("Unsupported file type")
+_parser_pool: Optional[ParserPool] = None
+
+def get_parser_pool() -> ParserPool:
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = ParserPool(
+            size=PARSER_WORKERS,
+            timeout=PARSER_TIMEOUT_SECONDS,
+            memory_limit=PARSER_MEMORY_MB * 1024 * 1024 if PARSER_MEMORY_MB > 0 else None,
+        )
+    return _parser_pool
+
+_result_cache: Optional[ResultCache] = None
+
+def get_result_cache() -> ResultCache:
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(
+            max_entries=int(os.getenv("RESUME_CACHE_SIZE", "256")),
+            directory=os.getenv("RESUME_CACHE_DIR") or None,
+            max_disk_entries=int(os.getenv("RESUME_CACHE_DISK_MAX", "10000")),
+        )
+    return _result_cache
+
+def _result_cache_stats() -> Dict[str, int]:
+    # A disk hit first misses the memory tier; count it once, as a hit
+    stats = get_result_cache().stats()
+    return stats | {"hits": stats["hits"] + stats["diskHits"], "misses": stats["misses"] - stats["diskHits"]}
+
+register_cache("resume_results", _result_cache_stats)
+
+def resume_cache_key(content: bytes, filename: str) -> str:
+    """Content-addressed cache key: the uploaded bytes, the file type and the analyzer version"""
+    extension = os.path.splitext(filename.lower())[1]
+    version = f"{ANALYZER_VERSION}:{resume_keywords.fingerprint}:{EXTRACT_MAX_PAGES}:{EXTRACT_MAX_CHARS}"
+    return content_digest(version.encode(), extension.encode(), content)
+
+def lookup_cached_analysis(content: bytes, filename: str) -> Optional[Dict[str, Any]]:
+    started = time.perf_counter()
+    cached = get_result_cache().get(resume_cache_key(content, filename))
+    if cached is not None:
+        cached["timings"] = {"cacheHit": True, "totalMs": round((time.perf_counter() - started) * 1000, 2)}
+    return cached
+
+def record_analysis(outcome: str, analysis_result: Optional[Dict[str, Any]] = None) -> None:
+    """Count an analysis by outcome, with the stage timings measured in the parser process"""
+    events.inc("resume_analysis", outcome)
+    timings = (analysis_result or {}).get("timings", {})
+    if "extractionMs" in timings:
+        observe_stage("resume_extraction", timings["extractionMs"] / 1000)
+        observe_stage("resume_scoring", timings["scoringMs"] / 1000)
+
+def store_cached_analysis(content: bytes, filename: str, analysis_result: Dict[str, Any]) -> None:
+    cacheable = {k: v for k, v in analysis_result.items() if k != "timings"}
+    get_result_cache().set(resume_cache_key(content, filename), cacheable)
 
-def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
-    """Analyze resume using rule-based approach - NO API COSTS!"""
-    import time
-    import random
+def analyze_resume_with_rules(resume_text: str, on_stage: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """Analyze resume using rule-based approach - NO API COSTS!
     
-    # Simulate processing time for each analysis step
-    time.sleep(0.5)  # Initial processing delay
+    on_stage, when given, is called with the name of each analysis stage as it completes.
+    """
+    def stage_done(stage: str) -> None:
+        if on_stage is not None:
+            on_stage(stage)
     
-    # Convert to lowercase for analysis
+    # Convert to lowercase and find every dictionary term in a single pass
     text_lower = resume_text.lower()
+    keywords = resume_keywords.scan(text_lower)
+    
+    # Baseline scores; every score is derived from the text alone so identical
+    # resumes always get identical results
+    word_count = len(resume_text.split())
+    if 300 <= word_count <= 900:
+        content_score = 85
+    elif 150 <= word_count <= 1300:
+        content_score = 72
+    else:
+        content_score = 58
     
-    # Initialize scores with some realistic variation
     base_scores = {
-        "formatting": random.randint(70, 85),
-        "content": random.randint(65, 80),
-        "keywords": random.randint(60, 75),
-        "experience": random.randint(70, 85),
-        "skills": random.randint(65, 80),
-        "education": random.randint(70, 90),
-        "contact": random.randint(75, 95),
-        "summary": random.randint(55, 75),
-        "achievements": random.randint(60, 80)
+        "formatting": 75,
+        "content": content_score,
+        "keywords": 65,
+        "experience": 75,
+        "skills": 70,
+        "education": 80,
+        "contact": 85,
+        "summary": 65,
+        "achievements": 60
     }
     
     scores = base_scores.copy()
@@ -72,13 +126,12 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
     missing_skills = []
     
     # 1. CONTACT INFO ANALYSIS
-    time.sleep(0.2)  # Simulate contact analysis time
     email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
     phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
     
     has_email = bool(re.search(email_pattern, resume_text))
     has_phone = bool(re.search(phone_pattern, resume_text))
-    has_address = any(word in text_lower for word in ['street', 'avenue', 'city', 'state', 'zip'])
+    has_address = keywords.has("address")
     
     if has_email and has_phone:
         scores["contact"] = 95
@@ -90,10 +143,10 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         scores["contact"] = 30
         improvements.append("Add email and phone number")
     
+    stage_done("contact")
+    
     # 2. EDUCATION ANALYSIS
-    time.sleep(0.3)  # Simulate education analysis time
-    education_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college', 'diploma', 'certification']
-    has_education = any(word in text_lower for word in education_keywords)
+    has_education = keywords.has("education")
     
     if has_education:
         scores["education"] = 85
@@ -102,14 +155,16 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         scores["education"] = 40
         improvements.append("Include educational background")
     
+    stage_done("education")
+    
     # 3. EXPERIENCE ANALYSIS
-    time.sleep(0.4)  # Simulate experience analysis time
-    experience_keywords = ['experience', 'worked', 'job', 'position', 'role', 'company', 'years']
-    has_experience = any(word in text_lower for word in experience_keywords)
+    has_experience = keywords.has("experience")
     
     # Look for quantified achievements
     numbers = re.findall(r'\d+%|\d+\+|\$\d+|\d+ years|\d+ months', resume_text)
     
+    scores["achievements"] = min(80, 60 + 10 * len(numbers))
+    
     if has_experience and len(numbers) >= 2:
         scores["experience"] = 90
         scores["achievements"] = 85
@@ -121,13 +176,11 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         scores["experience"] = 40
         improvements.append("Include work experience section")
     
-    # 4. SKILLS ANALYSIS
-    time.sleep(0.3)  # Simulate skills analysis time
-    technical_skills = ['python', 'javascript', 'java', 'react', 'angular', 'sql', 'html', 'css', 'node', 'git', 'docker', 'aws', 'azure', 'machine learning', 'ai', 'data analysis']
-    soft_skills = ['leadership', 'communication', 'teamwork', 'problem solving', 'project management', 'time management']
+    stage_done("experience")
     
-    found_technical = [skill for skill in technical_skills if skill in text_lower]
-    found_soft = [skill for skill in soft_skills if skill in text_lower]
+    # 4. SKILLS ANALYSIS
+    found_technical = keywords.found("technical_skills")
+    found_soft = keywords.found("soft_skills")
     
     current_skills = found_technical + found_soft
     
@@ -141,9 +194,10 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         scores["skills"] = 50
         improvements.append("Include technical skills section")
     
+    stage_done("skills")
+    
     # 5. KEYWORDS ANALYSIS
-    industry_keywords = ['software', 'engineering', 'development', 'design', 'marketing', 'sales', 'finance', 'analyst', 'manager', 'consultant']
-    found_keywords = [kw for kw in industry_keywords if kw in text_lower]
+    found_keywords = keywords.found("industry_keywords")
     
     if len(found_keywords) >= 3:
         scores["keywords"] = 80
@@ -152,8 +206,9 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         scores["keywords"] = 60
         improvements.append("Include more industry-specific keywords")
     
+    stage_done("keywords")
+    
     # 6. FORMATTING ANALYSIS
-    time.sleep(0.2)  # Simulate formatting analysis time
     lines = resume_text.split('\n')
     non_empty_lines = [line.strip() for line in lines if line.strip()]
     
@@ -171,10 +226,10 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         scores["formatting"] = 60
         improvements.append("Add bullet points and clear section headers")
     
+    stage_done("formatting")
+    
     # 7. SUMMARY ANALYSIS
-    time.sleep(0.2)  # Simulate summary analysis time
-    summary_indicators = ['summary', 'objective', 'profile', 'about']
-    has_summary = any(indicator in text_lower for indicator in summary_indicators)
+    has_summary = keywords.has("summary_indicators")
     
     if has_summary:
         scores["summary"] = 80
@@ -183,8 +238,7 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         scores["summary"] = 40
         improvements.append("Add a professional summary or objective")
     
-    # Final processing delay
-    time.sleep(0.5)  # Simulate final analysis and scoring time
+    stage_done("summary")
     
     # Calculate overall score
     overall_score = round(sum(scores.values()) / len(scores))
@@ -204,7 +258,7 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
     
     # Generate missing skills suggestions
     if len(found_technical) < 5:
-        missing_technical = [skill for skill in technical_skills[:10] if skill not in found_technical]
+        missing_technical = [skill for skill in resume_keywords.terms("technical_skills")[:10] if skill not in found_technical]
         missing_skills.extend(missing_technical[:3])
     
     # Generate recommendations
@@ -227,11 +281,11 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
     
     # Determine industry
     industry = "Technology"
-    if any(word in text_lower for word in ['marketing', 'sales', 'business']):
+    if keywords.has("industry_business"):
         industry = "Business"
-    elif any(word in text_lower for word in ['finance', 'accounting', 'banking']):
+    elif keywords.has("industry_finance"):
         industry = "Finance"
-    elif any(word in text_lower for word in ['healthcare', 'medical', 'nurse']):
+    elif keywords.has("industry_healthcare"):
         industry = "Healthcare"
     
     # Generate industry insights
@@ -249,6 +303,8 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         "Consider certification programs"
     ]
     
+    stage_done("scoring")
+    
     return {
         "overallScore": overall_score,
         "strengths": strengths,
@@ -298,56 +354,214 @@ def analyze_resume_with_rules(resume_text: str) -> Dict[str, Any]:
         }
     }
 
+def run_resume_analysis(content: bytes, filename: str, on_stage: Optional[Callable[[str, float], None]] = None) -> Dict[str, Any]:
+    """Extract and score a resume synchronously, recording real per-stage timings
+    
+    on_stage, when given, is called with each stage name and the milliseconds elapsed since the start.
+    """
+    started = time.perf_counter()
+    
+    def stage_done(stage: str) -> None:
+        if on_stage is not None:
+            on_stage(stage, round((time.perf_counter() - started) * 1000, 2))
+    
+    resume_text, extraction_stats = extract_text_with_stats(content, filename)
+    extracted = time.perf_counter()
+    stage_done("extraction")
+    
+    if not resume_text.strip():
+        raise DocumentParseError("No text content found in the resume")
+    
+    analysis_result = analyze_resume_with_rules(resume_text, on_stage=stage_done)
+    finished = time.perf_counter()
+    
+    analysis_result["timings"] = {
+        "extractionMs": round((extracted - started) * 1000, 2),
+        "scoringMs": round((finished - extracted) * 1000, 2),
+        "totalMs": round((finished - started) * 1000, 2),
+        "cacheHit": False,
+        "extraction": extraction_stats,
+    }
+    return analysis_result
+
 async def analyze_resume(content: bytes, filename: str) -> Dict[str, Any]:
     """Main function to analyze resume - FREE VERSION"""
-    import asyncio
-    import time
-    
     try:
-        print(f"Starting resume analysis for {filename}...")
-        
-        # Step 1: Extract text from file (2-3 seconds)
-        print("Extracting text content...")
-        await asyncio.sleep(2)  # Simulate text extraction time
-        resume_text = extract_text_from_file(content, filename)
+        cached = lookup_cached_analysis(content, filename)
+        if cached is not None:
+            record_analysis("cached")
+            return cached
         
-        if not resume_text.strip():
-            raise Exception("No text content found in the resume")
-        
-        # Step 2: Content analysis (3-4 seconds)
-        print("Analyzing content structure and formatting...")
-        await asyncio.sleep(3)  # Simulate content analysis time
-        
-        # Step 3: Skills and keyword analysis (2-3 seconds)
-        print("Analyzing skills and keywords...")
-        await asyncio.sleep(2)  # Simulate skills analysis time
-        
-        # Step 4: ATS optimization check (1-2 seconds)
-        print("Checking ATS compatibility...")
-        await asyncio.sleep(1)  # Simulate ATS check time
-        
-        # Step 5: Generate recommendations (2-3 seconds)
-        print("Generating recommendations and insights...")
-        await asyncio.sleep(2)  # Simulate recommendation generation
-        
-        # Analyze with rule-based approach
-        analysis_result = analyze_resume_with_rules(resume_text)
-        
-        print("Resume analysis completed successfully!")
+        # Run extraction and scoring on the worker pool so concurrent
+        # uploads never stall the event loop
+        loop = asyncio.get_running_loop()
+        with stage("resume_analysis"):
+            analysis_result = await loop.run_in_executor(
+                get_analysis_executor(), get_parser_pool().run, run_resume_analysis, content, filename
+            )
+        store_cached_analysis(content, filename, analysis_result)
+        record_analysis("analyzed", analysis_result)
         return analysis_result
         
+    except DocumentParseError as e:
+        record_analysis("rejected")
+        print(f"Resume parsing rejected: {str(e)}")
+        raise
     except Exception as e:
+        record_analysis("failed")
         print(f"Resume analysis failed: {str(e)}")
         raise Exception(f"Resume analysis failed: {str(e)}")
 
+async def stream_resume_analysis(content: bytes, filename: str) -> AsyncIterator[Dict[str, Any]]:
+    """Analyze a resume, yielding a stage event as each real stage completes and then the result"""
+    cached = lookup_cached_analysis(content, filename)
+    if cached is not None:
+        record_analysis("cached")
+        yield {"event": "stage", "stage": "cache", "elapsedMs": cached["timings"]["totalMs"]}
+        yield {"event": "result", "analysis": cached}
+        return
+    
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def on_stage(stage: str, elapsed_ms: float) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, {"stage": stage, "elapsedMs": elapsed_ms})
+    
+    pool = get_parser_pool()
+    future = loop.run_in_executor(
+        get_analysis_executor(), lambda: pool.run(run_resume_analysis, content, filename, on_stage=on_stage)
+    )
+    # Stage events are queued from the worker before its result is delivered,
+    # so the sentinel always arrives after the last stage
+    future.add_done_callback(lambda _: events.put_nowait(None))
+    
+    while True:
+        event = await events.get()
+        if event is None:
+            break
+        yield {"event": "stage", **event}
+    
+    try:
+        analysis_result = future.result()
+    except DocumentParseError:
+        record_analysis("rejected")
+        raise
+    except Exception as e:
+        record_analysis("failed")
+        raise Exception(f"Resume analysis failed: {str(e)}")
+    store_cached_analysis(content, filename, analysis_result)
+    record_analysis("analyzed", analysis_result)
+    yield {"event": "result", "analysis": analysis_result}
+
+async def analyze_resume_batch(files: List[Tuple[str, bytes]]) -> AsyncIterator[Dict[str, Any]]:
+    """Analyze many resumes across the parser pool, yielding each result as soon as it completes.
+    
+    A failure only affects its own entry, which is yielded with ok=False and the error.
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_analysis_executor()
+    pool = get_parser_pool()
+    
+    async def analyze_one(filename: str, content: bytes) -> Dict[str, Any]:
+        entry = {"filename": filename}
+        try:
+            analysis_result = lookup_cached_analysis(content, filename)
+            if analysis_result is None:
+                analysis_result = await loop.run_in_executor(executor, pool.run, run_resume_analysis, content, filename)
+                store_cached_analysis(content, filename, analysis_result)
+                record_analysis("analyzed", analysis_result)
+            else:
+                record_analysis("cached")
+            return {**entry, "ok": True, "analysis": analysis_result}
+        except DocumentParseError as e:
+            record_analysis("rejected")
+            return {**entry, "ok": False, "error": str(e)}
+        except Exception as e:
+            record_analysis("failed")
+            return {**entry, "ok": False, "error": f"Resume analysis failed: {str(e)}"}
+    
+    tasks = [asyncio.ensure_future(analyze_one(name, content)) for name, content in files]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def evaluate_answers(items: List[Tuple[str, str, str]]) -> List[Dict]:
+    """Score a batch of (role, question, answer) items with the local scoring engine"""
+    # Imported here so NumPy loads with the first answer, not at startup
+    from services.scoring import get_answer_scorer
+    with stage("answer_scoring"):
+        return get_answer_scorer().score(items)
+
 def evaluate_answer(role: str, question: str, answer: str) -> Dict:
-    """Evaluate interview answers (existing function)"""
-    # Simple rule-based evaluation for prototype
-    score_components = {
-        "technical": 70,
-        "communication": 75,
-        "confidence": 72,
+    """Evaluate one interview answer: {"score", "components", "feedback"}"""
+    return evaluate_answers([(role, question, answer)])[0]
+
+# Report wording per component, used when a component stands out
+COMPONENT_STRENGTHS = {
+    "technical": "Solid technical depth; answers covered the key points",
+    "communication": "Clear, well-paced communication",
+    "confidence": "Confident, structured delivery with ownership of results",
+}
+COMPONENT_WEAKNESSES = {
+    "technical": "Answers missed key technical points",
+    "communication": "Answers were hard to follow (length, pacing or filler words)",
+    "confidence": "Answers lacked structure and ownership of the outcome",
+}
+COMPONENT_TIPS = {
+    "technical": "Name the key concepts explicitly and tie each to a concrete example",
+    "communication": "Aim for one to two minute answers, signpost the steps and drop filler words",
+    "confidence": "Use STAR: the situation, your task, what you did and the measurable result",
+}
+STRONG_COMPONENT = 75
+WEAK_COMPONENT = 65
+# Standard deviation of answer scores above which answer quality counts as uneven
+UNEVEN_SPREAD = 12
+
+def build_interview_report(interview_id: str, interview: Dict[str, Any]) -> Dict[str, Any]:
+    """Aggregate an interview into its report (the Report model's fields).
+
+    Reads only the running stats kept on the interview, so the cost does not
+    depend on the number of answers.
+    """
+    stats = complete_stats(interview)
+    if stats is None:
+        # Interviews recorded before stats existed: average the scores, estimate the components
+        if interview.get("answerCount"):
+            overall = round(interview["scoreTotal"] / interview["answerCount"])
+        else:
+            # Interviews written before the counters existed hold bare scores
+            scores = [s["score"] if isinstance(s, dict) else s for s in interview.get("scores", [])] or [60]
+            overall = round(sum(scores) / len(scores))
+        components = {"technical": overall, "communication": max(50, overall - 5), "confidence": max(50, overall - 3)}
+        return {
+            "interview_id": interview_id,
+            "score": overall,
+            "components": components,
+            "strengths": ["Clear communication"],
+            "weaknesses": ["Insufficient examples"],
+            "tips": ["Use STAR format", "Quantify impact"],
+        }
+
+    overall = summarize(stats["overall"])
+    means = {name: summarize(stats[name])["mean"] for name in COMPONENTS}
+    ranked = sorted(COMPONENTS, key=means.__getitem__, reverse=True)
+    strengths = [name for name in ranked if means[name] >= STRONG_COMPONENT] or \
+        [name for name in ranked[:1] if means[name] >= WEAK_COMPONENT]
+    weaknesses = [name for name in reversed(ranked) if means[name] < WEAK_COMPONENT] or \
+        [name for name in ranked[-1:] if means[name] < STRONG_COMPONENT and name not in strengths]
+    tips = [COMPONENT_TIPS[name] for name in weaknesses]
+    if overall["count"] > 1 and overall["std"] > UNEVEN_SPREAD:
+        tips.append(f"Answer quality varied (scores from {round(overall['min'])} to {round(overall['max'])}); "
+                    "prepare a few reusable stories so every answer is as strong as your best")
+    return {
+        "interview_id": interview_id,
+        "score": round(overall["mean"]),
+        "components": {name: round(means[name]) for name in COMPONENTS},
+        "consistency": consistency(overall["std"]),
+        "strengths": [COMPONENT_STRENGTHS[name] for name in strengths],
+        "weaknesses": [COMPONENT_WEAKNESSES[name] for name in weaknesses],
+        "tips": tips or ["Keep practicing at a harder difficulty"],
     }
-    overall = round(sum(score_components.values()) / len(score_components))
-    feedback = "Good response structure. Consider adding more specific examples and quantifying your achievements."
-    return {"score": overall, "components": score_components, "feedback": feedback}
\ No newline at end of file
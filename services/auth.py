@@ -1,22 +1,170 @@
+import os
+import time
+import uuid
+import hashlib
+import threading
+from typing import Any, Dict, Optional
 from fastapi import HTTPException, Depends, Request
-from firebase_admin import auth as fb_auth
-import firebase_admin
-
-# Initialize Firebase Admin once (and tolerate missing GOOGLE_APPLICATION_CREDENTIALS gracefully)
-try:
-    if not firebase_admin._apps:
-        firebase_admin.initialize_app()
-except Exception:
-    # Startup should not crash; token verification will still fail until creds are correct
-    pass
-
-def verify_firebase_token(request: Request):
+from services.cache import LRUCache
+from services.executors import run_cpu
+from services.metrics import stage, register_cache
+
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+# Cached tokens are re-verified at least this often even if their exp is later
+TOKEN_CACHE_MAX_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_MAX_TTL_SECONDS", "300"))
+
+_firebase_ready = False
+_firebase_lock = threading.Lock()
+
+def init_firebase() -> None:
+    """Initialize Firebase Admin once, on first use (importing it costs ~200ms of cold start)"""
+    global _firebase_ready
+    if _firebase_ready:
+        return
+    with _firebase_lock:
+        if _firebase_ready:
+            return
+        import firebase_admin
+        try:
+            if not firebase_admin._apps:
+                firebase_admin.initialize_app()
+        except Exception:
+            # Tolerate missing GOOGLE_APPLICATION_CREDENTIALS; verification fails until creds are correct
+            pass
+        _firebase_ready = True
+
+class FirebaseTokenVerifier:
+    """Verifies Firebase ID tokens with the Admin SDK"""
+
+    def verify(self, id_token: str) -> Dict[str, Any]:
+        init_firebase()
+        from firebase_admin import auth as fb_auth
+        return fb_auth.verify_id_token(id_token)
+
+class LocalTokenVerifier:
+    """Issues and verifies RS256 tokens with a local test key pair.
+
+    For benchmarks and offline testing only: it accepts any token signed by its
+    own key and never talks to the network.
+    """
+
+    issuer = "local-test"
+
+    def __init__(self, private_key_pem: Optional[bytes] = None):
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        if private_key_pem is None:
+            key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+            private_key_pem = key.private_bytes(
+                serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+            )
+        from jose import jwk
+        key = serialization.load_pem_private_key(private_key_pem, password=None)
+        self.private_key_pem = private_key_pem
+        self.public_key_pem = key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        # Prepared once: jose would otherwise re-parse the PEM on every call (~50ms for the private key)
+        self._signing_key = jwk.construct(private_key_pem, "RS256")
+        self._verifying_key = jwk.construct(self.public_key_pem, "RS256")
+
+    def issue(self, uid: str, ttl_seconds: int = 3600, **claims: Any) -> str:
+        from jose import jwt
+        now = int(time.time())
+        payload = {"sub": uid, "uid": uid, "iss": self.issuer, "aud": self.issuer, "iat": now, "exp": now + ttl_seconds,
+                   "jti": str(uuid.uuid4()), **claims}
+        return jwt.encode(payload, self._signing_key, algorithm="RS256")
+
+    def verify(self, id_token: str) -> Dict[str, Any]:
+        from jose import jwt
+        return jwt.decode(id_token, self._verifying_key, algorithms=["RS256"],
+                          audience=self.issuer, issuer=self.issuer)
+
+class TokenCache:
+    """Bounded cache of decoded tokens keyed on a sha256 digest of the raw token.
+
+    Entries expire at the token's own exp or after max_ttl_seconds, whichever
+    comes first. Raw tokens are never stored.
+    """
+
+    def __init__(self, max_entries: int, max_ttl_seconds: float):
+        self.max_ttl_seconds = max_ttl_seconds
+        self._entries = LRUCache(max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(id_token: str) -> str:
+        return hashlib.sha256(id_token.encode()).hexdigest()
+
+    def get(self, id_token: str) -> Optional[Dict[str, Any]]:
+        key = self.digest(id_token)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= time.time():
+            self._entries.pop(key)
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def put(self, id_token: str, decoded: Dict[str, Any]) -> None:
+        expires_at = time.time() + self.max_ttl_seconds
+        if isinstance(decoded.get("exp"), (int, float)):
+            expires_at = min(expires_at, decoded["exp"])
+        self._entries.set(self.digest(id_token), (decoded, expires_at))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "hitRatio": round(self.hits / total, 4) if total else None}
+
+def _default_verifier():
+    if os.getenv("AUTH_VERIFIER", "firebase").lower() == "local":
+        key_file = os.getenv("AUTH_LOCAL_KEY_FILE")
+        private_key_pem = open(key_file, "rb").read() if key_file else None
+        print("WARNING: using the local test token verifier; never enable AUTH_VERIFIER=local in production")
+        return LocalTokenVerifier(private_key_pem)
+    return FirebaseTokenVerifier()
+
+_token_verifier = _default_verifier()
+_token_cache = TokenCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_MAX_TTL_SECONDS)
+register_cache("auth_tokens", lambda: _token_cache.stats())
+
+def get_token_verifier():
+    return _token_verifier
+
+def set_token_verifier(verifier) -> None:
+    """Swap the verifier (anything with verify(token) -> claims); cached verifications are dropped"""
+    global _token_verifier
+    _token_verifier = verifier
+    _token_cache.clear()
+
+def get_token_cache() -> TokenCache:
+    return _token_cache
+
+async def verify_id_token(id_token: str) -> Dict[str, Any]:
+    """Decoded claims for a raw ID token (cached); raises HTTPException(401) if it does not verify"""
+    decoded = _token_cache.get(id_token)
+    if decoded is not None:
+        return decoded
+    try:
+        # Signature checks (and the Admin SDK's certificate fetches) stay off the event loop
+        with stage("auth_verify"):
+            decoded = await run_cpu(_token_verifier.verify, id_token)
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    _token_cache.put(id_token, decoded)
+    return decoded
+
+async def verify_firebase_token(request: Request):
     auth_header = request.headers.get("Authorization", "")
     if not auth_header.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing Bearer token")
-    id_token = auth_header.split(" ", 1)[1]
-    try:
-        decoded = fb_auth.verify_id_token(id_token)
-        return decoded  # contains 'uid', etc.
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid token")
\ No newline at end of file
+    return await verify_id_token(auth_header.split(" ", 1)[1])  # contains 'uid', etc.
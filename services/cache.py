@@ -0,0 +1,143 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+class LRUCache:
+    """Thread-safe, size-bounded least-recently-used cache"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def evict_while(self, predicate: Callable[[Any], bool]) -> int:
+        """Drop entries from the least recently used end for as long as predicate(value) holds"""
+        evicted = 0
+        with self._lock:
+            while self._entries and predicate(next(iter(self._entries.values()))):
+                self._entries.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+class ResultCache:
+    """Two-tier JSON result cache: an in-memory LRU in front of an optional directory on disk.
+
+    Disk entries are written atomically (temp file + rename), so every worker
+    process on a host can share the same directory and it survives restarts.
+    """
+
+    def __init__(self, max_entries: int, directory: Optional[str] = None, max_disk_entries: int = 10000):
+        self.memory = LRUCache(max_entries)
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.disk_hits = 0
+        self._writes = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        payload = self.memory.get(key)
+        if payload is None and self.directory:
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    payload = f.read()
+                # Touch the entry so pruning evicts the least recently used files first
+                os.utime(path)
+            except OSError:
+                payload = None
+            if payload is not None:
+                self.disk_hits += 1
+                self.memory.set(key, payload)
+        return json.loads(payload) if payload is not None else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        payload = json.dumps(value)
+        self.memory.set(key, payload)
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Result cache write failed: {str(e)}")
+            return
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self.prune()
+
+    def prune(self) -> None:
+        """Drop the least recently used disk entries beyond max_disk_entries"""
+        if not self.directory:
+            return
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        entries.append((os.path.getmtime(path), path))
+                    except OSError:
+                        pass
+        excess = len(entries) - self.max_disk_entries
+        if excess <= 0:
+            return
+        for _, path in sorted(entries)[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        return {**self.memory.stats(), "diskHits": self.disk_hits}
+
+def content_digest(*parts: bytes) -> str:
+    """sha256 hex digest over the given byte strings (length-prefixed, so parts cannot run together)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
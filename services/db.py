@@ -1,20 +1,39 @@
-from typing import Optional
-from google.cloud import firestore
+import threading
+from typing import TYPE_CHECKING, Optional
 
-_db: Optional[firestore.Client] = None
+if TYPE_CHECKING:
+    from google.cloud import firestore
 
-def get_db() -> firestore.Client:
+_db: Optional["firestore.Client"] = None
+_async_db: Optional["firestore.AsyncClient"] = None
+# Clients are created on first use, once, even when several requests race for them
+_client_lock = threading.Lock()
+
+def get_db() -> "firestore.Client":
+    """Blocking client, for scripts and maintenance jobs"""
     global _db
     if _db is None:
-        # Lazily initialize so app can start even if creds are set after launch
-        _db = firestore.Client()
+        with _client_lock:
+            if _db is None:
+                from google.cloud import firestore
+                _db = firestore.Client()
     return _db
 
+def get_async_db() -> "firestore.AsyncClient":
+    """Client used by the API, awaited on the event loop"""
+    global _async_db
+    if _async_db is None:
+        with _client_lock:
+            if _async_db is None:
+                from google.cloud import firestore
+                _async_db = firestore.AsyncClient()
+    return _async_db
+
 def users_col():
-    return get_db().collection("users")
+    return get_async_db().collection("users")
 
 def interviews_col():
-    return get_db().collection("interviews")
+    return get_async_db().collection("interviews")
 
 def attempts_col():
-    return get_db().collection("attempts")
\ No newline at end of file
+    return get_async_db().collection("attempts")
@@ -0,0 +1,41 @@
+"""Where blocking and CPU-bound work runs, so request handlers never stall the event loop.
+
+- Firestore I/O: awaited on the loop through the AsyncClient.
+- SQLite I/O: the SQLite backend's own single thread.
+- Resume parsing and rule scoring: sandboxed ParserPool processes
+  (services.ai), handed off and waited on by the analysis threads here.
+- Answer scoring, token verification misses and other short in-process CPU
+  work: run_cpu(), a pool sized to the cores.
+- PDF rendering: the report job queue's bounded pool (services.jobs).
+"""
+import os
+import asyncio
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Threads that hand documents to the parser pool and wait on them
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "0")) or 2 * (int(os.getenv("PARSER_WORKERS", "0")) or os.cpu_count() or 1)
+CPU_WORKERS = int(os.getenv("CPU_WORKERS", "0")) or os.cpu_count() or 1
+
+_analysis_executor: Optional[ThreadPoolExecutor] = None
+_cpu_executor: Optional[ThreadPoolExecutor] = None
+
+def get_analysis_executor() -> ThreadPoolExecutor:
+    global _analysis_executor
+    if _analysis_executor is None:
+        _analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="resume-analysis")
+    return _analysis_executor
+
+def get_cpu_executor() -> ThreadPoolExecutor:
+    global _cpu_executor
+    if _cpu_executor is None:
+        _cpu_executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="cpu")
+    return _cpu_executor
+
+async def run_cpu(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a short CPU-bound call off the event loop, in the caller's context (so trace spans follow it)"""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_cpu_executor(), call)
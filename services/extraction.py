@@ -0,0 +1,130 @@
+import os
+import time
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from services.sandbox import DocumentParseError
+
+if TYPE_CHECKING:
+    import PyPDF2
+
+# PyPDF2 and python-docx are imported on first parse (in the parser workers), not when the app starts
+
+# A resume never needs page 40: stop reading once either limit is reached
+EXTRACT_MAX_PAGES = int(os.getenv("EXTRACT_MAX_PAGES", "10"))
+EXTRACT_MAX_CHARS = int(os.getenv("EXTRACT_MAX_CHARS", "60000"))
+
+# Files slower or denser than this per page are logged as pathological
+EXTRACT_SLOW_PAGE_MS = float(os.getenv("EXTRACT_SLOW_PAGE_MS", "200"))
+EXTRACT_DENSE_PAGE_BYTES = int(os.getenv("EXTRACT_DENSE_PAGE_BYTES", str(1024 * 1024)))
+
+def iter_pdf_pages(reader: "PyPDF2.PdfReader", max_pages: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of each PDF page, parsing pages lazily up to max_pages"""
+    for index, page in enumerate(reader.pages):
+        if max_pages is not None and index >= max_pages:
+            return
+        yield page.extract_text() or ""
+
+def _iter_block_text(container) -> Iterator[str]:
+    """Yield paragraph and table text from a document body, header or cell in document order"""
+    from docx.table import Table
+    for block in container.iter_inner_content():
+        if isinstance(block, Table):
+            for row in block.rows:
+                cells: List[str] = []
+                seen = set()
+                for cell in row.cells:
+                    # Merged cells repeat the same cell object across the grid
+                    if id(cell._tc) in seen:
+                        continue
+                    seen.add(id(cell._tc))
+                    text = " ".join(t for t in _iter_block_text(cell) if t)
+                    if text:
+                        cells.append(text)
+                if cells:
+                    yield " | ".join(cells)
+        else:
+            yield block.text
+
+def iter_docx_blocks(content: bytes) -> Iterator[str]:
+    """Yield header/footer text, then body paragraphs and table rows, from DOCX content"""
+    import docx
+    document = docx.Document(BytesIO(content))
+    seen_parts = set()
+    for section in document.sections:
+        for part in (section.header, section.first_page_header, section.footer):
+            # Linked headers share the previous section's part; read each part once
+            if part.is_linked_to_previous or id(part.part) in seen_parts:
+                continue
+            seen_parts.add(id(part.part))
+            yield from _iter_block_text(part)
+    yield from _iter_block_text(document)
+
+def _join_bounded(pieces: Iterable[str], max_chars: Optional[int]) -> Tuple[str, int, bool]:
+    """Join pieces with newlines in one pass, stopping once max_chars is reached"""
+    kept: List[str] = []
+    total = 0
+    count = 0
+    truncated = False
+    for piece in pieces:
+        count += 1
+        kept.append(piece)
+        total += len(piece) + 1
+        if max_chars is not None and total >= max_chars:
+            truncated = True
+            break
+    text = "\n".join(kept)
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars]
+    return text.strip(), count, truncated
+
+def extract_text_with_stats(content: bytes, filename: str, max_pages: Optional[int] = EXTRACT_MAX_PAGES,
+                            max_chars: Optional[int] = EXTRACT_MAX_CHARS) -> Tuple[str, Dict[str, Any]]:
+    """Extract resume text within page/character limits, returning the text and extraction stats"""
+    started = time.perf_counter()
+    name = filename.lower()
+    if name.endswith('.pdf'):
+        import PyPDF2
+        try:
+            reader = PyPDF2.PdfReader(BytesIO(content))
+            total_pages = len(reader.pages)
+            text, pages_read, truncated = _join_bounded(iter_pdf_pages(reader, max_pages), max_chars)
+        except Exception as e:
+            raise DocumentParseError(f"Failed to extract text from PDF: {str(e)}")
+        truncated = truncated or total_pages > pages_read
+        stats: Dict[str, Any] = {"format": "pdf", "pagesRead": pages_read, "totalPages": total_pages}
+    elif name.endswith('.docx'):
+        try:
+            text, blocks_read, truncated = _join_bounded(iter_docx_blocks(content), max_chars)
+        except Exception as e:
+            raise DocumentParseError(f"Failed to extract text from DOCX: {str(e)}")
+        # DOCX has no fixed pagination; the whole package counts as one page
+        stats = {"format": "docx", "pagesRead": 1, "totalPages": 1, "blocksRead": blocks_read}
+    else:
+        raise ValueError("Unsupported file type")
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    pages = max(stats["pagesRead"], 1)
+    stats.update({
+        "bytes": len(content),
+        "chars": len(text),
+        "bytesPerPage": round(len(content) / max(stats["totalPages"], 1)),
+        "msPerPage": round(elapsed_ms / pages, 2),
+        "extractionMs": round(elapsed_ms, 2),
+        "truncated": truncated,
+    })
+    if stats["msPerPage"] > EXTRACT_SLOW_PAGE_MS or stats["bytesPerPage"] > EXTRACT_DENSE_PAGE_BYTES:
+        print(f"Pathological resume {filename}: {stats['msPerPage']}ms/page, {stats['bytesPerPage']} bytes/page")
+    return text, stats
+
+def extract_text_from_pdf(content: bytes) -> str:
+    """Extract text from PDF content"""
+    return extract_text_with_stats(content, "resume.pdf")[0]
+
+def extract_text_from_docx(content: bytes) -> str:
+    """Extract text from DOCX content"""
+    return extract_text_with_stats(content, "resume.docx")[0]
+
+def extract_text_from_file(content: bytes, filename: str) -> str:
+    """Extract text from resume file based on file type"""
+    return extract_text_with_stats(content, filename)[0]
@@ -0,0 +1,183 @@
+from typing import Any, Dict, List, Optional, Tuple
+from google.api_core.exceptions import NotFound, FailedPrecondition
+from google.cloud import firestore
+from services.db import get_async_db, users_col, interviews_col, attempts_col
+from services.repository import Repository, RollupUpdate, NotFoundError, ConflictError, cursor_fields
+from services.aggregates import answer_samples
+
+async def _page(query, limit: Optional[int], after: Optional[Tuple[str, str]],
+                fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Newest-first keyset page; the (createdAt, __name__) order is served by a composite index"""
+    query = query.order_by("createdAt", direction="DESCENDING").order_by("__name__", direction="DESCENDING")
+    if fields is not None:
+        # Server-side projection: only these fields leave Firestore
+        query = query.select(cursor_fields(fields))
+    if after is not None:
+        query = query.start_after({"createdAt": after[0], "__name__": after[1]})
+    if limit is not None:
+        query = query.limit(limit)
+    return [d.to_dict() | {"id": d.id} async for d in query.stream()]
+
+# Most writes a single Firestore commit accepts
+FIRESTORE_BATCH_LIMIT = 500
+
+def _precondition(expected_version: Any):
+    # Interview versions are the document's update_time
+    return get_async_db().write_option(last_update_time=expected_version) if expected_version is not None else None
+
+def _rollup_document(fields: Dict[str, Any], increments: Dict[str, float]) -> Dict[str, Any]:
+    # set(merge=True) takes nested maps (dotted keys would be literal names), with Increment at the leaves
+    document = dict(fields)
+    for path, amount in increments.items():
+        *parents, leaf = path.split(".")
+        target = document
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = firestore.Increment(amount)
+    return document
+
+def _add_rollups(batch, rollups: Optional[List[RollupUpdate]]) -> None:
+    for uid, bucket_id, fields, increments in rollups or []:
+        ref = users_col().document(uid).collection("rollups").document(bucket_id)
+        batch.set(ref, _rollup_document(fields, increments), merge=True)
+
+class FirestoreRepository(Repository):
+    """Production backend on the google-cloud-firestore AsyncClient"""
+
+    async def get_user(self, uid: str) -> Optional[Dict[str, Any]]:
+        doc = await users_col().document(uid).get()
+        return doc.to_dict() if doc.exists else None
+
+    async def merge_user(self, uid: str, data: Dict[str, Any]) -> None:
+        await users_col().document(uid).set(data, merge=True)
+
+    async def create_interview(self, interview_id: str, data: Dict[str, Any]) -> Any:
+        return (await interviews_col().document(interview_id).set(data)).update_time
+
+    async def get_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        doc = await interviews_col().document(interview_id).get()
+        return doc.to_dict() if doc.exists else None
+
+    async def get_interview_versioned(self, interview_id: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+        doc = await interviews_col().document(interview_id).get()
+        return (doc.to_dict(), doc.update_time) if doc.exists else (None, None)
+
+    async def update_interview(self, interview_id: str, fields: Dict[str, Any], expected_version: Any = None,
+                               rollups: Optional[List[RollupUpdate]] = None) -> Any:
+        try:
+            if not rollups:
+                result = await interviews_col().document(interview_id).update(fields, option=_precondition(expected_version))
+                return result.update_time
+            batch = get_async_db().batch()
+            batch.update(interviews_col().document(interview_id), fields, option=_precondition(expected_version))
+            _add_rollups(batch, rollups)
+            return (await batch.commit())[0].update_time
+        except NotFound:
+            raise NotFoundError(f"Interview {interview_id} not found")
+        except FailedPrecondition:
+            raise ConflictError(f"Interview {interview_id} changed since it was read")
+
+    async def list_interviews(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                              fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return await _page(interviews_col().where("userId", "==", uid), limit, after, fields)
+
+    async def add_attempt(self, data: Dict[str, Any]) -> str:
+        _, ref = await attempts_col().add(data)
+        return ref.id
+
+    async def record_answer(self, interview_id: str, attempt: Dict[str, Any], questions: List[str], score: int,
+                            expected_version: Any = None,
+                            rollups: Optional[List[RollupUpdate]] = None) -> Tuple[str, Any]:
+        # One batched commit: the attempt insert plus server-side transforms on the
+        # interview, so concurrent answers never overwrite each other's appends
+        attempt_ref = attempts_col().document()
+        batch = get_async_db().batch()
+        batch.set(attempt_ref, attempt)
+        entry = {"attemptId": attempt_ref.id, "score": score}
+        if attempt.get("components") is not None:
+            entry["components"] = attempt["components"]
+        fields = {
+            "questionsAsked": firestore.ArrayUnion(questions),
+            # Entries carry the attempt id; ArrayUnion would drop a repeated bare score
+            "scores": firestore.ArrayUnion([entry]),
+            "answerCount": firestore.Increment(1),
+            "scoreTotal": firestore.Increment(score),
+        }
+        for name, value in answer_samples(score, attempt.get("components")).items():
+            fields |= {
+                f"stats.{name}.count": firestore.Increment(1),
+                f"stats.{name}.sum": firestore.Increment(value),
+                f"stats.{name}.sumSq": firestore.Increment(value * value),
+                f"stats.{name}.min": firestore.Minimum(value),
+                f"stats.{name}.max": firestore.Maximum(value),
+            }
+        batch.update(interviews_col().document(interview_id), fields, option=_precondition(expected_version))
+        _add_rollups(batch, rollups)
+        try:
+            results = await batch.commit()
+        except NotFound:
+            raise NotFoundError(f"Interview {interview_id} not found")
+        except FailedPrecondition:
+            raise ConflictError(f"Interview {interview_id} changed since it was read")
+        return attempt_ref.id, results[1].update_time
+
+    async def scan_attempts(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        query = attempts_col().order_by("interviewId").order_by("__name__").limit(limit)
+        if after is not None:
+            query = query.start_after({"interviewId": after[0], "__name__": after[1]})
+        return [d.to_dict() | {"id": d.id} async for d in query.stream()]
+
+    async def scan_interviews(self, limit: int, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        query = interviews_col().order_by("__name__").limit(limit)
+        if after is not None:
+            query = query.start_after({"__name__": after})
+        return [d.to_dict() | {"id": d.id} async for d in query.stream()]
+
+    async def get_interviews_versioned(self, interview_ids: List[str]) -> Dict[str, Tuple[Dict[str, Any], Any]]:
+        refs = [interviews_col().document(interview_id) for interview_id in interview_ids]
+        return {d.id: (d.to_dict(), d.update_time) async for d in get_async_db().get_all(refs) if d.exists}
+
+    async def bulk_update(self, attempts: Dict[str, Dict[str, Any]],
+                          interviews: Dict[str, Tuple[Dict[str, Any], Any]]) -> None:
+        writes = [(attempts_col().document(attempt_id), fields, None) for attempt_id, fields in attempts.items()]
+        writes += [(interviews_col().document(interview_id), fields, _precondition(expected_version))
+                   for interview_id, (fields, expected_version) in interviews.items()]
+        for i in range(0, len(writes), FIRESTORE_BATCH_LIMIT):
+            batch = get_async_db().batch()
+            for ref, fields, option in writes[i:i + FIRESTORE_BATCH_LIMIT]:
+                batch.update(ref, fields, option=option)
+            try:
+                await batch.commit()
+            except NotFound as e:
+                raise NotFoundError(str(e))
+            except FailedPrecondition:
+                raise ConflictError("An interview changed since it was read")
+
+    def _rollups(self, uid: str):
+        return users_col().document(uid).collection("rollups")
+
+    async def get_rollups(self, uid: str, bucket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        refs = [self._rollups(uid).document(bucket_id) for bucket_id in bucket_ids]
+        return {d.id: d.to_dict() async for d in get_async_db().get_all(refs) if d.exists}
+
+    async def put_rollups(self, uid: str, buckets: Dict[str, Dict[str, Any]]) -> None:
+        items = list(buckets.items())
+        for i in range(0, len(items), FIRESTORE_BATCH_LIMIT):
+            batch = get_async_db().batch()
+            for bucket_id, data in items[i:i + FIRESTORE_BATCH_LIMIT]:
+                batch.set(self._rollups(uid).document(bucket_id), data)
+            await batch.commit()
+
+    def _resume_analyses(self, uid: str):
+        return users_col().document(uid).collection("resume_analyses")
+
+    async def add_resume_analysis(self, uid: str, analysis_id: str, data: Dict[str, Any]) -> None:
+        await self._resume_analyses(uid).document(analysis_id).set(data)
+
+    async def get_resume_analysis(self, uid: str, analysis_id: str) -> Optional[Dict[str, Any]]:
+        doc = await self._resume_analyses(uid).document(analysis_id).get()
+        return doc.to_dict() if doc.exists else None
+
+    async def list_resume_analyses(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                                   fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return await _page(self._resume_analyses(uid), limit, after, fields)
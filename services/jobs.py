@@ -0,0 +1,111 @@
+import os
+import time
+import uuid
+import asyncio
+import contextvars
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from services.pdf_generator import generate_resume_analysis_pdf
+
+REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", "2"))
+REPORT_JOB_TTL_SECONDS = float(os.getenv("REPORT_JOB_TTL_SECONDS", "3600"))
+REPORT_MAX_PENDING = int(os.getenv("REPORT_MAX_PENDING", "200"))
+REPORT_MAX_FINISHED = int(os.getenv("REPORT_MAX_FINISHED", "1000"))
+
+class JobQueueFull(Exception):
+    """Too many report jobs are already queued or running"""
+
+class ReportJob:
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = "queued"
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.result: Optional[bytes] = None
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "jobId": self.id,
+            "status": self.status,
+            "createdAt": self.created_at,
+            "finishedAt": self.finished_at,
+            "error": self.error,
+            "size": len(self.result) if self.result is not None else None,
+        }
+
+class ReportJobQueue:
+    """Renders PDF reports on a bounded worker pool and keeps finished artifacts for a TTL.
+
+    Submitting returns a job id at once; callers poll status() and fetch the
+    bytes with result(). Expired and excess finished jobs are purged lazily
+    whenever the queue is touched.
+    """
+
+    def __init__(self, workers: int, ttl_seconds: float, max_pending: int, max_finished: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-render")
+        self._jobs: "OrderedDict[str, ReportJob]" = OrderedDict()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _purge(self) -> None:
+        now = time.time()
+        finished = [job for job in self._jobs.values() if job.finished_at is not None]
+        excess = len(finished) - self.max_finished
+        for job in finished:
+            if now - job.finished_at > self.ttl_seconds or excess > 0:
+                del self._jobs[job.id]
+                excess -= 1
+
+    def submit(self, analysis_data: Dict[str, Any], filename: str = "resume.pdf") -> ReportJob:
+        with self._lock:
+            self._purge()
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self._pending} report jobs already pending")
+            job = ReportJob(str(uuid.uuid4()))
+            self._jobs[job.id] = job
+            self._pending += 1
+
+        def run() -> bytes:
+            job.status = "running"
+            return generate_resume_analysis_pdf(analysis_data, filename)
+
+        future = self._executor.submit(run)
+        future.add_done_callback(lambda f: self._finish(job, f))
+        return job
+
+    def _finish(self, job: ReportJob, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            job.finished_at = time.time()
+            try:
+                job.result = future.result()
+                job.status = "done"
+            except Exception as e:
+                job.error = f"PDF generation failed: {str(e)}"
+                job.status = "failed"
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        with self._lock:
+            self._purge()
+            return self._jobs.get(job_id)
+
+    async def render(self, analysis_data: Dict[str, Any], filename: str = "resume.pdf") -> bytes:
+        """Render on the same bounded pool without creating a job, for synchronous downloads"""
+        loop = asyncio.get_running_loop()
+        # In the caller's context, so a traced request gets the render span
+        render = contextvars.copy_context().run
+        return await loop.run_in_executor(self._executor, render, generate_resume_analysis_pdf, analysis_data, filename)
+
+_report_jobs: Optional[ReportJobQueue] = None
+
+def get_report_jobs() -> ReportJobQueue:
+    global _report_jobs
+    if _report_jobs is None:
+        _report_jobs = ReportJobQueue(REPORT_WORKERS, REPORT_JOB_TTL_SECONDS, REPORT_MAX_PENDING, REPORT_MAX_FINISHED)
+    return _report_jobs
@@ -0,0 +1,87 @@
+import os
+import re
+import json
+import hashlib
+from typing import Dict, List, Optional
+
+DEFAULT_KEYWORDS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "resume_keywords.json")
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """Render a character trie as a regex; shared prefixes are matched once and longer terms win"""
+    terminal = "" in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        # Greedy optional: try the longer term first, fall back to the shorter one
+        return "(?:" + body + ")?" if len(branches) == 1 else body + "?"
+    return body
+
+class KeywordMatches:
+    """Result of a single scan: canonical term -> start offsets in the scanned text"""
+
+    def __init__(self, matcher: "KeywordMatcher", positions: Dict[str, List[int]]):
+        self._matcher = matcher
+        self.positions = positions
+
+    def found(self, category: str) -> List[str]:
+        """Terms of a category present in the text, in dictionary order"""
+        rank = self._matcher._rank.get(category, {})
+        return sorted((term for term in self.positions if term in rank), key=rank.__getitem__)
+
+    def has(self, category: str) -> bool:
+        rank = self._matcher._rank.get(category, {})
+        return any(term in rank for term in self.positions)
+
+class KeywordMatcher:
+    """Finds every dictionary term in lowercased text in one pass of a single precompiled regex.
+
+    Terms only match on whole words, so "ai" does not hit "maintain" and
+    "java" does not hit "javascript". Aliases map alternative spellings onto
+    a canonical term.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]], aliases: Optional[Dict[str, str]] = None, version: str = "1"):
+        self.version = version
+        self.categories = {category: list(terms) for category, terms in categories.items()}
+        self._rank: Dict[str, Dict[str, int]] = {
+            category: {term: i for i, term in enumerate(terms)} for category, terms in self.categories.items()
+        }
+        self._canonical: Dict[str, str] = {}
+        for terms in self.categories.values():
+            for term in terms:
+                self._canonical[term.lower()] = term
+        for alias, term in (aliases or {}).items():
+            self._canonical.setdefault(alias.lower(), term)
+
+        trie: Dict[str, dict] = {}
+        for surface in self._canonical:
+            node = trie
+            for char in surface:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self._pattern = re.compile(r"(?<![a-z0-9])(" + _trie_pattern(trie) + r")(?![a-z0-9])")
+        self.fingerprint = hashlib.sha256(
+            json.dumps([self.version, self.categories, self._canonical], sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+    def terms(self, category: str) -> List[str]:
+        return self.categories.get(category, [])
+
+    def scan(self, text_lower: str) -> KeywordMatches:
+        positions: Dict[str, List[int]] = {}
+        canonical = self._canonical
+        for match in self._pattern.finditer(text_lower):
+            positions.setdefault(canonical[match.group(1)], []).append(match.start())
+        return KeywordMatches(self, positions)
+
+def load_keyword_matcher(path: Optional[str] = None) -> KeywordMatcher:
+    """Build a matcher from a JSON dictionary file: {"version", "categories": {name: [terms]}, "aliases": {alias: term}}"""
+    path = path or os.getenv("RESUME_KEYWORDS_PATH") or DEFAULT_KEYWORDS_PATH
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return KeywordMatcher(data["categories"], data.get("aliases"), version=str(data.get("version", "1")))
+
+# Built once at import; shared by every analysis
+resume_keywords = load_keyword_matcher()
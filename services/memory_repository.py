@@ -0,0 +1,152 @@
+import copy
+import uuid
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from services.repository import (
+    Repository, RollupUpdate, NotFoundError, ConflictError, apply_answer, apply_rollup, project
+)
+
+def _newest_first(docs: Dict[str, Dict[str, Any]], uid: Optional[str] = None, limit: Optional[int] = None,
+                  after: Optional[Tuple[str, str]] = None, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    keyed = [((doc.get("createdAt") or "", doc_id), doc_id, doc) for doc_id, doc in docs.items()
+             if (uid is None or doc.get("userId") == uid)]
+    keyed = [entry for entry in keyed if after is None or entry[0] < after]
+    keyed.sort(key=lambda entry: entry[0], reverse=True)
+    return [copy.deepcopy(project(doc, fields)) | {"id": doc_id} for _, doc_id, doc in keyed[:limit]]
+
+class MemoryRepository(Repository):
+    """Process-local dictionaries; a fast stand-in for tests, benchmarks and profiling.
+
+    Every method completes without awaiting, so each call is atomic on the event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.interviews: Dict[str, Dict[str, Any]] = {}
+        self.versions: Dict[str, int] = {}
+        self.attempts: Dict[str, Dict[str, Any]] = {}
+        self.resume_analyses: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.rollups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    async def get_user(self, uid: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self.users.get(uid))
+
+    async def merge_user(self, uid: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self.users.setdefault(uid, {}).update(copy.deepcopy(data))
+
+    def _apply_rollups(self, rollups: Optional[List[RollupUpdate]]) -> None:
+        # Caller holds the lock
+        for uid, bucket_id, fields, increments in rollups or []:
+            apply_rollup(self.rollups.setdefault(uid, {}).setdefault(bucket_id, {}), fields, increments)
+
+    def _bump(self, interview_id: str, expected_version: Any) -> int:
+        # Caller holds the lock
+        if interview_id not in self.interviews:
+            raise NotFoundError(f"Interview {interview_id} not found")
+        if expected_version is not None and self.versions[interview_id] != expected_version:
+            raise ConflictError(f"Interview {interview_id} changed since version {expected_version}")
+        self.versions[interview_id] += 1
+        return self.versions[interview_id]
+
+    async def create_interview(self, interview_id: str, data: Dict[str, Any]) -> Any:
+        with self._lock:
+            self.interviews[interview_id] = copy.deepcopy(data)
+            self.versions[interview_id] = self.versions.get(interview_id, 0) + 1
+            return self.versions[interview_id]
+
+    async def get_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self.interviews.get(interview_id))
+
+    async def get_interview_versioned(self, interview_id: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+        with self._lock:
+            return copy.deepcopy(self.interviews.get(interview_id)), self.versions.get(interview_id)
+
+    async def update_interview(self, interview_id: str, fields: Dict[str, Any], expected_version: Any = None,
+                               rollups: Optional[List[RollupUpdate]] = None) -> Any:
+        with self._lock:
+            version = self._bump(interview_id, expected_version)
+            self.interviews[interview_id].update(copy.deepcopy(fields))
+            self._apply_rollups(rollups)
+            return version
+
+    async def list_interviews(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                              fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return _newest_first(self.interviews, uid, limit, after, fields)
+
+    async def add_attempt(self, data: Dict[str, Any]) -> str:
+        attempt_id = uuid.uuid4().hex
+        with self._lock:
+            self.attempts[attempt_id] = copy.deepcopy(data)
+        return attempt_id
+
+    async def record_answer(self, interview_id: str, attempt: Dict[str, Any], questions: List[str], score: int,
+                            expected_version: Any = None,
+                            rollups: Optional[List[RollupUpdate]] = None) -> Tuple[str, Any]:
+        attempt_id = uuid.uuid4().hex
+        with self._lock:
+            version = self._bump(interview_id, expected_version)
+            self.attempts[attempt_id] = copy.deepcopy(attempt)
+            apply_answer(self.interviews[interview_id], attempt_id, questions, score, attempt.get("components"))
+            self._apply_rollups(rollups)
+        return attempt_id, version
+
+    async def scan_attempts(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            keyed = sorted(((attempt.get("interviewId") or "", attempt_id), attempt)
+                           for attempt_id, attempt in self.attempts.items())
+            keyed = [entry for entry in keyed if after is None or entry[0] > after]
+            return [copy.deepcopy(attempt) | {"id": key[1]} for key, attempt in keyed[:limit]]
+
+    async def scan_interviews(self, limit: int, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            ids = sorted(interview_id for interview_id in self.interviews if after is None or interview_id > after)
+            return [copy.deepcopy(self.interviews[interview_id]) | {"id": interview_id} for interview_id in ids[:limit]]
+
+    async def get_interviews_versioned(self, interview_ids: List[str]) -> Dict[str, Tuple[Dict[str, Any], Any]]:
+        with self._lock:
+            return {interview_id: (copy.deepcopy(self.interviews[interview_id]), self.versions[interview_id])
+                    for interview_id in interview_ids if interview_id in self.interviews}
+
+    async def bulk_update(self, attempts: Dict[str, Dict[str, Any]],
+                          interviews: Dict[str, Tuple[Dict[str, Any], Any]]) -> None:
+        with self._lock:
+            for attempt_id in attempts:
+                if attempt_id not in self.attempts:
+                    raise NotFoundError(f"Attempt {attempt_id} not found")
+            for interview_id, (_, expected_version) in interviews.items():
+                if interview_id not in self.interviews:
+                    raise NotFoundError(f"Interview {interview_id} not found")
+                if expected_version is not None and self.versions[interview_id] != expected_version:
+                    raise ConflictError(f"Interview {interview_id} changed since version {expected_version}")
+            for attempt_id, fields in attempts.items():
+                self.attempts[attempt_id].update(copy.deepcopy(fields))
+            for interview_id, (fields, expected_version) in interviews.items():
+                self._bump(interview_id, expected_version)
+                self.interviews[interview_id].update(copy.deepcopy(fields))
+
+    async def get_rollups(self, uid: str, bucket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            buckets = self.rollups.get(uid, {})
+            return {bucket_id: copy.deepcopy(buckets[bucket_id]) for bucket_id in bucket_ids if bucket_id in buckets}
+
+    async def put_rollups(self, uid: str, buckets: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self.rollups.setdefault(uid, {}).update(copy.deepcopy(buckets))
+
+    async def add_resume_analysis(self, uid: str, analysis_id: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self.resume_analyses.setdefault(uid, {})[analysis_id] = copy.deepcopy(data)
+
+    async def get_resume_analysis(self, uid: str, analysis_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self.resume_analyses.get(uid, {}).get(analysis_id))
+
+    async def list_resume_analyses(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                                   fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return _newest_first(self.resume_analyses.get(uid, {}), None, limit, after, fields)
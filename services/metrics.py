@@ -0,0 +1,279 @@
+"""In-process metrics in the Prometheus text format, with optional per-request trace spans.
+
+Counters, gauges and histograms are plain numbers behind a lock, so an
+observation costs about a microsecond and the metrics can stay on in
+production. GET /metrics renders them. Cache hit ratios are read from the
+caches themselves when /metrics is scraped (register_cache), so cache
+lookups pay nothing extra.
+
+Time a hot-path stage with `with stage("pdf_render"):`. That observes the
+stage histogram and, when the current request is traced, adds a span.
+Traced requests carry their spans back in a Server-Timing header, where
+browser dev tools show them. TRACING=off (default) | header (only requests
+sending "X-Trace: 1") | all.
+"""
+import os
+import time
+import random
+import bisect
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1").lower() not in ("0", "false", "no")
+# When set, /metrics requires "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN") or None
+TRACING = os.getenv("TRACING", "off").lower()
+# Fraction of requests traced when TRACING=all
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_labels(self.label_names, key)} {_number(value)}" for key, value in values]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+        # Per label set: [count per bucket (last is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = [(key, list(counts), total) for key, (counts, total) in self._series.items()]
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {cumulative}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._caches: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def add(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_cache(self, name: str, stats: Callable[[], Dict[str, Any]]) -> None:
+        """Expose a cache's stats() (entries, hits, misses) as cache_* metrics, read at scrape time"""
+        self._caches[name] = stats
+
+    def _cache_lines(self) -> List[str]:
+        families = {
+            "cache_hits_total": ("counter", "Cache lookups that hit", "hits"),
+            "cache_misses_total": ("counter", "Cache lookups that missed", "misses"),
+            "cache_entries": ("gauge", "Entries currently cached", "entries"),
+            "cache_hit_ratio": ("gauge", "Hits over lookups since start", None),
+        }
+        stats = {name: read() for name, read in self._caches.items()}
+        lines = []
+        for family, (kind, help, field) in families.items():
+            lines += [f"# HELP {family} {help}", f"# TYPE {family} {kind}"]
+            for name, values in stats.items():
+                if field is None:
+                    lookups = values.get("hits", 0) + values.get("misses", 0)
+                    if not lookups:
+                        continue
+                    value = values.get("hits", 0) / lookups
+                else:
+                    value = values.get(field, 0)
+                lines.append(f'{family}{{cache="{_escape(name)}"}} {_number(value)}')
+        return lines
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines += metric.header() + metric.render()
+        lines += self._cache_lines()
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+register_cache = registry.register_cache
+
+http_request_duration = registry.add(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ["method", "route", "status"]))
+http_requests_in_flight = registry.add(Gauge(
+    "http_requests_in_flight", "HTTP requests and WebSocket connections being served", ["route"]))
+http_request_size = registry.add(Histogram(
+    "http_request_size_bytes", "Request body size (Content-Length)", ["route"], SIZE_BUCKETS))
+http_response_size = registry.add(Histogram(
+    "http_response_size_bytes", "Response body size", ["route"], SIZE_BUCKETS))
+stage_duration = registry.add(Histogram(
+    "stage_duration_seconds", "Time per hot-path stage", ["stage"]))
+repository_call_duration = registry.add(Histogram(
+    "repository_call_duration_seconds", "Time per repository call", ["backend", "method", "outcome"]))
+events = registry.add(Counter(
+    "events_total", "Notable outcomes, such as how resume analyses ended", ["event", "outcome"]))
+
+# Spans of the request being traced: (name, milliseconds); None when it is not traced
+_spans: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar("spans", default=None)
+
+def add_span(name: str, seconds: float) -> None:
+    spans = _spans.get()
+    if spans is not None:
+        spans.append((name, seconds * 1000))
+
+def observe_stage(name: str, seconds: float) -> None:
+    """Record a stage timed elsewhere (e.g. in a worker process)"""
+    stage_duration.observe(seconds, name)
+    add_span(name, seconds)
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(name, time.perf_counter() - started)
+
+def server_timing(spans: List[Tuple[str, float]], total_ms: Optional[float] = None) -> str:
+    entries = [f"{name.replace('.', '-')};dur={ms:.2f}" for name, ms in spans]
+    if total_ms is not None:
+        entries.insert(0, f"app;dur={total_ms:.2f}")
+    return ", ".join(entries)
+
+def _traced(headers: List[Tuple[bytes, bytes]]) -> bool:
+    if TRACING == "all":
+        return TRACE_SAMPLE_RATE >= 1 or random.random() < TRACE_SAMPLE_RATE
+    if TRACING == "header":
+        return (b"x-trace", b"1") in headers
+    return False
+
+class MetricsMiddleware:
+    """ASGI middleware: per-route latency, in-flight, payload sizes and Server-Timing for traced requests.
+
+    Routes are labelled by their path template ("/api/interview/{interview_id}"),
+    and paths that match no route as "unmatched", so label sets stay bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._static: Optional[Dict[str, str]] = None
+        self._dynamic: List[Tuple[Any, str]] = []
+
+    def _route(self, scope: Dict[str, Any]) -> str:
+        if self._static is None:
+            routes = getattr(scope.get("app"), "routes", [])
+            self._static = {route.path: route.path for route in routes
+                            if hasattr(route, "path") and not getattr(route, "param_convertors", None)}
+            self._dynamic = [(route.path_regex, route.path) for route in routes
+                             if getattr(route, "param_convertors", None)]
+        path = scope.get("path", "")
+        route = self._static.get(path)
+        if route is None:
+            route = next((template for regex, template in self._dynamic if regex.match(path)), "unmatched")
+        return route
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            return await self.app(scope, receive, send)
+        route = self._route(scope)
+        http_requests_in_flight.inc(route)
+        if scope["type"] == "websocket":
+            try:
+                return await self.app(scope, receive, send)
+            finally:
+                http_requests_in_flight.dec(route)
+
+        started = time.perf_counter()
+        headers = scope.get("headers", [])
+        spans = [] if _traced(headers) else None
+        token = _spans.set(spans)
+        status = [500]
+        size = [0]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                if spans is not None:
+                    timing = server_timing(spans, (time.perf_counter() - started) * 1000)
+                    message = message | {"headers": list(message.get("headers", [])) +
+                                         [(b"server-timing", timing.encode())]}
+            elif message["type"] == "http.response.body":
+                size[0] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _spans.reset(token)
+            http_requests_in_flight.dec(route)
+            http_request_duration.observe(time.perf_counter() - started, scope.get("method", ""), route, str(status[0]))
+            length = next((value for name, value in headers if name == b"content-length"), None)
+            if length is not None and length.isdigit():
+                http_request_size.observe(int(length), route)
+            http_response_size.observe(size[0], route)
+
+def render_metrics() -> str:
+    return registry.render()
@@ -1,19 +1,85 @@
 import os
-import tempfile
-from datetime import datetime
-from typing import Dict, Any
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
+import json
+from datetime import date, datetime
+from typing import Dict, Any, Optional
 import io
+import threading
+from services.cache import LRUCache, content_digest
+from services.metrics import stage, register_cache
+
+# ReportLab costs ~200ms to import, so it loads with the first report rather than at startup
+_styles = None
+_styles_lock = threading.Lock()
+
+def _report_styles():
+    """Paragraph and table styles, built once on first use and shared by every report (they are immutable)"""
+    global _styles
+    with _styles_lock:
+        if _styles is None:
+            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+            from reportlab.lib import colors
+            from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+            from reportlab.platypus import TableStyle
+            styles = getSampleStyleSheet()
+
+            title_style = ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontSize=24,
+                spaceAfter=30,
+                alignment=TA_CENTER,
+                textColor=colors.HexColor('#1F2937')
+            )
+
+            heading_style = ParagraphStyle(
+                'CustomHeading',
+                parent=styles['Heading2'],
+                fontSize=16,
+                spaceAfter=12,
+                spaceBefore=20,
+                textColor=colors.HexColor('#374151')
+            )
+
+            subheading_style = ParagraphStyle(
+                'CustomSubHeading',
+                parent=styles['Heading3'],
+                fontSize=14,
+                spaceAfter=8,
+                spaceBefore=12,
+                textColor=colors.HexColor('#4B5563')
+            )
+
+            body_style = ParagraphStyle(
+                'CustomBody',
+                parent=styles['Normal'],
+                fontSize=11,
+                spaceAfter=6,
+                alignment=TA_JUSTIFY
+            )
+
+            score_table_style = TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3F4F6')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ])
+            _styles = (title_style, heading_style, subheading_style, body_style, score_table_style)
+        return _styles
+
+# Rendered reports keyed on a hash of the analysis payload; repeat downloads skip ReportLab
+_render_cache = LRUCache(int(os.getenv("PDF_RENDER_CACHE_SIZE", "64")))
+register_cache("pdf_renders", _render_cache.stats)
+
+def get_render_cache() -> LRUCache:
+    return _render_cache
 
 def create_circular_progress(canvas, x, y, radius, score, max_score=100):
     """Draw a circular progress indicator"""
+    from reportlab.lib import colors
     # Background circle
     canvas.setStrokeColor(colors.lightgrey)
     canvas.setLineWidth(3)
@@ -34,55 +100,38 @@ def create_circular_progress(canvas, x, y, radius, score, max_score=100):
     canvas.setFont("Helvetica", 10)
     canvas.drawCentredText(x, y + 15, "Score")
 
-def generate_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str) -> str:
-    """Generate a comprehensive PDF report for resume analysis"""
-    
-    # Create temporary file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-    temp_path = temp_file.name
-    temp_file.close()
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(temp_path, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#1F2937')
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceAfter=12,
-        spaceBefore=20,
-        textColor=colors.HexColor('#374151')
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=14,
-        spaceAfter=8,
-        spaceBefore=12,
-        textColor=colors.HexColor('#4B5563')
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=6,
-        alignment=TA_JUSTIFY
-    )
+def render_cache_key(analysis_data: Dict[str, Any], filename: str, generated_on: date) -> str:
+    # Timings describe how the analysis ran, not what it says, so they do not affect the report.
+    # The report is dated, so a render is only reused on the day it was made
+    payload = {k: v for k, v in analysis_data.items() if k != "timings"}
+    return content_digest(json.dumps(payload, sort_keys=True, default=str).encode(), filename.encode(),
+                          generated_on.isoformat().encode())
+
+def generate_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str) -> bytes:
+    """Generate a comprehensive PDF report for resume analysis and return its bytes"""
+    
+    generated_on = datetime.now().date()
+    cache_key = render_cache_key(analysis_data, filename, generated_on)
+    cached = _render_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    with stage("pdf_render"):
+        pdf_bytes = render_resume_analysis_pdf(analysis_data, filename, generated_on)
+    _render_cache.set(cache_key, pdf_bytes)
+    return pdf_bytes
+
+def render_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str,
+                               generated_on: Optional[date] = None) -> bytes:
+    """Render the report, bypassing the cache; it is dated generated_on (default today)"""
+    generated_on = generated_on or datetime.now().date()
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+    title_style, heading_style, subheading_style, body_style, score_table_style = _report_styles()
+    # Build into memory; nothing touches the filesystem
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
     
     # Build content
     story = []
@@ -93,7 +142,7 @@ def generate_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str) -
     
     # Report info
     report_info = f"""
-    <b>Generated:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}<br/>
+    <b>Generated:</b> {generated_on.strftime('%B %d, %Y')}<br/>
     <b>Resume File:</b> {filename}<br/>
     <b>Overall Score:</b> {analysis_data.get('overallScore', 0)}/100
     """
@@ -116,16 +165,7 @@ def generate_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str) -
     ]
     
     score_table = Table(score_data, colWidths=[2*inch, 1*inch, 1.5*inch])
-    score_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3F4F6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    score_table.setStyle(score_table_style)
     
     story.append(score_table)
     story.append(Spacer(1, 20))
@@ -139,16 +179,7 @@ def generate_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str) -
         section_data.append([section.title(), f"{score}/100", get_score_status(score)])
     
     section_table = Table(section_data, colWidths=[2*inch, 1*inch, 1.5*inch])
-    section_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3F4F6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    section_table.setStyle(score_table_style)
     
     story.append(section_table)
     story.append(Spacer(1, 20))
@@ -276,7 +307,7 @@ def generate_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str) -
     
     # Footer
     footer_text = f"""
-    <i>Report generated by AI Virtual Interviewer on {datetime.now().strftime('%B %d, %Y')}<br/>
+    <i>Report generated by AI Virtual Interviewer on {generated_on.strftime('%B %d, %Y')}<br/>
     For more career guidance and interview preparation, visit our platform.</i>
     """
     story.append(Paragraph(footer_text, body_style))
@@ -284,7 +315,7 @@ def generate_resume_analysis_pdf(analysis_data: Dict[str, Any], filename: str) -
     # Build PDF
     doc.build(story)
     
-    return temp_path
+    return buffer.getvalue()
 
 def get_score_status(score: int) -> str:
     """Get status text based on score"""
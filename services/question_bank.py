@@ -0,0 +1,140 @@
+import os
+import json
+import zlib
+from math import gcd
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_QUESTION_BANK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "question_bank.json")
+
+GENERAL_ROLE = "general"
+DIFFICULTIES = ["easy", "medium", "hard"]
+MODES = ["text", "voice"]
+# Opening questions are only served when asked for by topic, never as follow-ups
+OPENING_TOPIC = "introduction"
+
+# Where to look when a difficulty's pool is empty or used up
+_DIFFICULTY_FALLBACK = {"easy": ["easy", "medium", "hard"], "medium": ["medium", "easy", "hard"], "hard": ["hard", "medium", "easy"]}
+_DIFFICULTY_ALIASES = {"beginner": "easy", "junior": "easy", "intermediate": "medium", "mid": "medium",
+                       "advanced": "hard", "senior": "hard", "expert": "hard"}
+
+PoolKey = Tuple[str, str, str, Optional[str]]
+
+class Question:
+    __slots__ = ("id", "text", "roles", "difficulty", "topic", "modes", "key_points")
+
+    def __init__(self, id: str, text: str, roles: List[str], difficulty: str, topic: str,
+                 modes: List[str], key_points: List[str]):
+        self.id = id
+        self.text = text
+        self.roles = roles
+        self.difficulty = difficulty
+        self.topic = topic
+        self.modes = modes
+        self.key_points = key_points
+
+class QuestionBank:
+    """In-memory question dataset indexed by (role, difficulty, mode, topic).
+
+    Every combination maps to a precomputed pool of question indexes, so
+    picking a question never scans the dataset. General questions belong to
+    every role's pools. Within a pool, an interview walks a fixed permutation
+    seeded by its id (start offset plus a stride coprime to the pool size), so
+    its n-th question sits at position n and normally comes back on the first
+    probe; questions it has already seen are stepped over.
+    """
+
+    def __init__(self, roles: Dict[str, Dict[str, object]], questions: Iterable[Question], version: str = "1"):
+        self.version = version
+        self.roles = {slug: dict(meta) for slug, meta in roles.items()}
+        self.roles.setdefault(GENERAL_ROLE, {"name": "General", "aliases": []})
+        self._role_lookup: Dict[str, str] = {}
+        for slug, meta in self.roles.items():
+            for surface in [slug, slug.replace("-", " "), str(meta.get("name", slug))] + list(meta.get("aliases", [])):
+                self._role_lookup.setdefault(surface.strip().lower(), slug)
+
+        self.questions: List[Question] = list(questions)
+        self._by_id: Dict[str, Question] = {}
+        self._by_text: Dict[str, Question] = {}
+        pools: Dict[PoolKey, List[int]] = {}
+        for index, question in enumerate(self.questions):
+            self._by_id[question.id] = question
+            self._by_text.setdefault(question.text, question)
+            roles_for = self.roles if GENERAL_ROLE in question.roles else question.roles
+            for role in roles_for:
+                for mode in question.modes:
+                    pools.setdefault((role, question.difficulty, mode, question.topic), []).append(index)
+                    if question.topic != OPENING_TOPIC:
+                        pools.setdefault((role, question.difficulty, mode, None), []).append(index)
+        self._pools: Dict[PoolKey, Tuple[int, ...]] = {key: tuple(pool) for key, pool in pools.items()}
+
+    def normalize_role(self, role: str) -> str:
+        """Map a free-text role ("Software Engineer", "SWE") onto a role slug; unknown roles get general questions"""
+        return self._role_lookup.get(role.strip().lower(), GENERAL_ROLE)
+
+    @staticmethod
+    def normalize_difficulty(difficulty: str) -> str:
+        value = difficulty.strip().lower()
+        value = _DIFFICULTY_ALIASES.get(value, value)
+        return value if value in DIFFICULTIES else "medium"
+
+    @staticmethod
+    def normalize_mode(mode: str) -> str:
+        value = mode.strip().lower()
+        return value if value in MODES else "text"
+
+    def get(self, question_id: str) -> Optional[Question]:
+        return self._by_id.get(question_id)
+
+    def find(self, text: str) -> Optional[Question]:
+        """Look up the bank entry a question text was served from"""
+        return self._by_text.get(text)
+
+    def pool_size(self, role: str, difficulty: str, mode: str, topic: Optional[str] = None) -> int:
+        return len(self._pools.get((role, difficulty, mode, topic), ()))
+
+    def _pick(self, pool: Tuple[int, ...], asked: set, position: int, seed: int) -> Optional[Question]:
+        size = len(pool)
+        start = seed % size
+        stride = 1 + (seed // size) % (size - 1) if size > 1 else 1
+        while gcd(stride, size) != 1:
+            stride += 1
+        for step in range(position, position + size):
+            question = self.questions[pool[(start + step * stride) % size]]
+            if question.text not in asked:
+                return question
+        return None
+
+    def select(self, role: str, difficulty: str, mode: str, asked: Iterable[str] = (), seed: str = "",
+               topic: Optional[str] = None) -> Optional[Question]:
+        """Next question for an interview that has asked `asked` so far, or None when every pool is used up.
+
+        The same seed (the interview id) always walks the same order, so any
+        worker picks the same question for the same interview state.
+        """
+        asked = list(asked)
+        asked_set = set(asked)
+        seed_hash = zlib.crc32(seed.encode("utf-8"))
+        slug = self.normalize_role(role)
+        mode = self.normalize_mode(mode)
+        for level in _DIFFICULTY_FALLBACK[self.normalize_difficulty(difficulty)]:
+            for pool_role in (slug, GENERAL_ROLE) if slug != GENERAL_ROLE else (slug,):
+                pool = self._pools.get((pool_role, level, mode, topic))
+                if pool:
+                    question = self._pick(pool, asked_set, len(asked), seed_hash)
+                    if question is not None:
+                        return question
+        return None
+
+def load_question_bank(path: Optional[str] = None) -> QuestionBank:
+    """Build a bank from a JSON dataset: {"version", "roles": {slug: {name, aliases}}, "questions": [...]}"""
+    path = path or os.getenv("QUESTION_BANK_PATH") or DEFAULT_QUESTION_BANK_PATH
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    questions = (
+        Question(q["id"], q["text"], q["roles"], q["difficulty"], q["topic"], q.get("modes", MODES), q.get("keyPoints", []))
+        for q in data["questions"]
+    )
+    return QuestionBank(data.get("roles", {}), questions, version=str(data.get("version", "1")))
+
+# Built once at import; shared by every interview
+question_bank = load_question_bank()
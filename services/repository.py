@@ -0,0 +1,267 @@
+import os
+import json
+import time
+import base64
+import inspect
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from services.aggregates import add_samples, answer_samples
+from services.metrics import repository_call_duration, add_span, METRICS_ENABLED
+
+class NotFoundError(Exception):
+    """The document to update does not exist"""
+
+class ConflictError(Exception):
+    """The document changed since the version a conditional write expected"""
+
+# One write to a user's rollup bucket (users/{uid}/rollups/{bucket} in Firestore):
+# (uid, bucket id, fields to set, increments keyed by dotted field path)
+RollupUpdate = Tuple[str, str, Dict[str, Any], Dict[str, float]]
+
+class Repository:
+    """Persistence for users, interviews, attempts and each user's resume analyses.
+
+    Documents are plain dicts. Listings return newest first by (createdAt, id),
+    with the document id under "id". They take an optional page size (limit),
+    the (createdAt, id) of the last row already seen (after), and a field
+    projection (fields, dotted paths allowed); projected rows always keep
+    createdAt so they can seed the next page. Update fields are top-level
+    field names.
+    Interview writes return the document's new version, an opaque value that
+    a later write can pass as expected_version to fail with ConflictError if
+    anyone else wrote in between.
+    Interview writes can carry rollup updates (see services.rollups), which
+    commit atomically with the write, so a failed or conflicting write never
+    counts toward analytics.
+    All methods are coroutines. Backends: Firestore (the default, on the
+    AsyncClient), in-memory, and SQLite (on its own thread). Choose one with
+    DB_BACKEND=firestore|memory|sqlite.
+    """
+
+    # Users
+    async def get_user(self, uid: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def merge_user(self, uid: str, data: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    # Interviews
+    async def create_interview(self, interview_id: str, data: Dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    async def get_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def get_interview_versioned(self, interview_id: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+        raise NotImplementedError
+
+    async def update_interview(self, interview_id: str, fields: Dict[str, Any], expected_version: Any = None,
+                               rollups: Optional[List[RollupUpdate]] = None) -> Any:
+        raise NotImplementedError
+
+    async def list_interviews(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                              fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    # Attempts
+    async def add_attempt(self, data: Dict[str, Any]) -> str:
+        raise NotImplementedError
+
+    async def record_answer(self, interview_id: str, attempt: Dict[str, Any], questions: List[str], score: int,
+                            expected_version: Any = None,
+                            rollups: Optional[List[RollupUpdate]] = None) -> Tuple[str, Any]:
+        """Insert an attempt and fold it into its interview in one atomic write.
+
+        The interview update is a set-union of questions into questionsAsked,
+        an append of {"attemptId", "score", "components"} to scores,
+        increments of answerCount and scoreTotal, and the answer's overall
+        and component scores folded into the running stats (count, sum,
+        sumSq, min, max per value; see services.aggregates). The components
+        come from attempt["components"]. Returns the attempt id and the
+        interview's new version. Raises NotFoundError or ConflictError, and
+        nothing is written.
+        """
+        raise NotImplementedError
+
+    # Bulk maintenance, for offline jobs such as services.rescore
+    async def scan_attempts(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        """Page through every attempt in (interviewId, id) order, so an interview's attempts are adjacent.
+
+        after is the (interviewId, id) of the last attempt already seen.
+        """
+        raise NotImplementedError
+
+    async def scan_interviews(self, limit: int, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Page through every interview in id order; after is the id of the last interview already seen"""
+        raise NotImplementedError
+
+    async def get_interviews_versioned(self, interview_ids: List[str]) -> Dict[str, Tuple[Dict[str, Any], Any]]:
+        """Read many interviews at once: id -> (data, version); missing ids are left out"""
+        raise NotImplementedError
+
+    async def bulk_update(self, attempts: Dict[str, Dict[str, Any]],
+                          interviews: Dict[str, Tuple[Dict[str, Any], Any]]) -> None:
+        """Update fields on many attempts and interviews (id -> (fields, expected_version)) in one write.
+
+        Raises ConflictError if an interview changed since its expected
+        version, and nothing is written. Firestore commits at most
+        FIRESTORE_BATCH_LIMIT writes at a time, so larger calls are only
+        atomic per chunk.
+        """
+        raise NotImplementedError
+
+    # Analytics rollups (users/{uid}/rollups in Firestore)
+    async def get_rollups(self, uid: str, bucket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read a user's rollup buckets by id; buckets never written are left out"""
+        raise NotImplementedError
+
+    async def put_rollups(self, uid: str, buckets: Dict[str, Dict[str, Any]]) -> None:
+        """Replace a user's rollup buckets outright (for backfills)"""
+        raise NotImplementedError
+
+    # Resume analyses (users/{uid}/resume_analyses in Firestore)
+    async def add_resume_analysis(self, uid: str, analysis_id: str, data: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    async def get_resume_analysis(self, uid: str, analysis_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def list_resume_analyses(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                                   fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+def apply_answer(interview: Dict[str, Any], attempt_id: str, questions: List[str], score: int,
+                 components: Optional[Dict[str, int]] = None) -> None:
+    """Apply record_answer's interview update to a document in place (for backends without server-side transforms)"""
+    asked = interview.setdefault("questionsAsked", [])
+    for question in questions:
+        if question not in asked:
+            asked.append(question)
+    entry = {"attemptId": attempt_id, "score": score}
+    if components is not None:
+        entry["components"] = dict(components)
+    interview.setdefault("scores", []).append(entry)
+    interview["answerCount"] = interview.get("answerCount", 0) + 1
+    interview["scoreTotal"] = interview.get("scoreTotal", 0) + score
+    add_samples(interview.setdefault("stats", {}), answer_samples(score, components))
+
+def apply_rollup(bucket: Dict[str, Any], fields: Dict[str, Any], increments: Dict[str, float]) -> None:
+    """Apply a rollup update to a bucket document in place"""
+    bucket.update(fields)
+    for path, amount in increments.items():
+        *parents, leaf = path.split(".")
+        target = bucket
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = target.get(leaf, 0) + amount
+
+# Summary projections for history views
+INTERVIEW_SUMMARY_FIELDS = ["role", "status", "createdAt", "report.score"]
+RESUME_ANALYSIS_SUMMARY_FIELDS = ["filename", "overallScore", "createdAt"]
+
+def cursor_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+    """A projection widened with the field pages are keyed on"""
+    return None if fields is None else list(dict.fromkeys([*fields, "createdAt"]))
+
+def project(doc: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Copy only the given (dotted) field paths out of a document; missing fields are left out"""
+    if fields is None:
+        return doc
+    result: Dict[str, Any] = {}
+    for path in cursor_fields(fields):
+        *parents, leaf = path.split(".")
+        source, target = doc, result
+        for key in parents:
+            source = source.get(key) if isinstance(source, dict) else None
+            target = target.setdefault(key, {})
+        if isinstance(source, dict) and leaf in source:
+            target[leaf] = source[leaf]
+    return result
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    """Opaque page cursor for the row a page ended on"""
+    return base64.urlsafe_b64encode(json.dumps([row.get("createdAt"), row["id"]]).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce"""
+    try:
+        value = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    # Only a [createdAt, id] list; a two-key object would otherwise unpack into its keys
+    if not isinstance(value, list) or len(value) != 2:
+        raise ValueError("Invalid cursor")
+    created_at, doc_id = value
+    # Ids are single path segments (Firestore rejects "" and "/" in document ids)
+    if not isinstance(created_at, str) or not isinstance(doc_id, str) or not doc_id or "/" in doc_id:
+        raise ValueError("Invalid cursor")
+    return created_at, doc_id
+
+class InstrumentedRepository(Repository):
+    """Times every call on another repository, per backend, method and outcome (and as a span when traced)"""
+
+    def __init__(self, inner: Repository, backend: str):
+        self.inner = inner
+        self.backend = backend
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything beyond the interface (e.g. the in-memory backend's dictionaries) passes straight through
+        return getattr(self.inner, name)
+
+def _timed(name: str):
+    async def call(self, *args, **kwargs):
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            return await getattr(self.inner, name)(*args, **kwargs)
+        except NotFoundError:
+            outcome = "not_found"
+            raise
+        except ConflictError:
+            outcome = "conflict"
+            raise
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            repository_call_duration.observe(elapsed, self.backend, name, outcome)
+            add_span(f"{self.backend}.{name}", elapsed)
+    call.__name__ = name
+    return call
+
+for _name, _method in list(vars(Repository).items()):
+    if inspect.iscoroutinefunction(_method):
+        setattr(InstrumentedRepository, _name, _timed(_name))
+
+def create_repository(backend: Optional[str] = None) -> Repository:
+    backend = (backend or os.getenv("DB_BACKEND", "firestore")).lower()
+    # Backends are imported on demand so the in-memory and SQLite stand-ins never load the Firestore SDK
+    if backend == "memory":
+        from services.memory_repository import MemoryRepository
+        repository: Repository = MemoryRepository()
+    elif backend == "sqlite":
+        from services.sqlite_repository import SQLiteRepository
+        repository = SQLiteRepository(os.getenv("SQLITE_PATH", "interviewer.db"))
+    elif backend == "firestore":
+        from services.firestore_repository import FirestoreRepository
+        repository = FirestoreRepository()
+    else:
+        raise ValueError(f"Unknown DB_BACKEND: {backend}")
+    return InstrumentedRepository(repository, backend) if METRICS_ENABLED else repository
+
+_repository: Optional[Repository] = None
+_repository_lock = threading.Lock()
+
+def get_repository() -> Repository:
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = create_repository()
+    return _repository
+
+def set_repository(repository: Repository) -> None:
+    """Install a repository explicitly, e.g. an in-memory one for load tests"""
+    global _repository
+    _repository = repository
@@ -0,0 +1,168 @@
+"""Re-score every stored attempt with the current scoring engine and refresh the interviews built from them.
+
+Attempts are streamed in pages in (interviewId, id) order. Each page is
+scored in parallel batches on a process pool while the next page is being
+fetched. Changed attempts, plus each affected interview's scores, scoreTotal,
+stats and report, are then written back in one bulk write, with the interview
+writes conditioned on the version that was read. A checkpoint file records
+the last attempt written, so an interrupted run resumes where it stopped.
+
+Per-user progress rollups (services.rollups) still hold the old scores
+afterwards; pass --rebuild-rollups to rebuild them once the run completes.
+
+    python -m services.rescore --backend sqlite --workers 4 --rebuild-rollups
+    python -m services.rescore --restart    # ignore an existing checkpoint
+"""
+import os
+import json
+import time
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.repository import Repository, ConflictError, create_repository
+from services.ai import evaluate_answers, build_interview_report
+from services.aggregates import stats_from_entries
+from services.rollups import backfill
+
+RESCORE_PAGE_SIZE = int(os.getenv("RESCORE_PAGE_SIZE", "200"))
+RESCORE_BATCH_SIZE = int(os.getenv("RESCORE_BATCH_SIZE", "50"))
+RESCORE_CHECKPOINT_PATH = os.getenv("RESCORE_CHECKPOINT_PATH", "rescore-checkpoint.json")
+# A page whose interviews keep changing underneath it (live answers) is re-read this many times
+RESCORE_WRITE_ATTEMPTS = 5
+
+def score_batch(items: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+    """Runs in the worker processes"""
+    return evaluate_answers(items)
+
+def load_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    # Write-then-rename, so a crash never leaves a torn checkpoint behind
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+def rescored_interview(interview_id: str, interview: Dict[str, Any],
+                       results: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Fields to update on an interview given new attempt results, or None if nothing changes"""
+    entries = interview.get("scores", [])
+    if any(not isinstance(entry, dict) for entry in entries):
+        # Bare scores from before attempt ids were recorded cannot be matched to attempts
+        return None
+    updated = []
+    for entry in entries:
+        result = results.get(entry.get("attemptId"))
+        updated.append(entry if result is None else entry | {"score": result["score"], "components": result["components"]})
+    if updated == entries:
+        return None
+    fields: Dict[str, Any] = {"scores": updated, "scoreTotal": sum(entry["score"] for entry in updated)}
+    if all("components" in entry for entry in updated):
+        # Otherwise the rest of this interview's attempts are on the next page, which rebuilds the stats
+        fields["stats"] = stats_from_entries(updated)
+    if "report" in interview:
+        fields["report"] = build_interview_report(interview_id, interview | fields)
+    return fields
+
+async def rescore(repository: Repository, pool: ProcessPoolExecutor, state: Dict[str, Any], checkpoint_path: str,
+                  page_size: int, batch_size: int) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    elapsed_before = state["elapsedSeconds"]
+    after = tuple(state["after"]) if state["after"] else None
+    next_page = asyncio.create_task(repository.scan_attempts(page_size, after))
+    while True:
+        page = await next_page
+        if not page:
+            break
+        after = (page[-1].get("interviewId") or "", page[-1]["id"])
+        # Prefetch the next page while this one is scored and written
+        next_page = asyncio.create_task(repository.scan_attempts(page_size, after))
+
+        interview_ids = sorted({attempt["interviewId"] for attempt in page if attempt.get("interviewId")})
+        interviews = await repository.get_interviews_versioned(interview_ids)
+        items = [(interviews.get(attempt.get("interviewId"), ({}, None))[0].get("role", ""),
+                  attempt.get("question", ""), attempt.get("answer", "")) for attempt in page]
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(pool, score_batch, items[i:i + batch_size]) for i in range(0, len(items), batch_size)
+        ))
+        results = [result for batch in batches for result in batch]
+
+        attempt_updates: Dict[str, Dict[str, Any]] = {}
+        results_by_interview: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for attempt, result in zip(page, results):
+            fields = {"score": result["score"], "components": result["components"], "feedback": result["feedback"]}
+            if any(attempt.get(name) != value for name, value in fields.items()):
+                attempt_updates[attempt["id"]] = fields
+                if attempt.get("interviewId") in interviews:
+                    results_by_interview.setdefault(attempt["interviewId"], {})[attempt["id"]] = result
+
+        for _ in range(RESCORE_WRITE_ATTEMPTS):
+            interview_updates = {}
+            for interview_id, results in results_by_interview.items():
+                data, version = interviews[interview_id]
+                fields = rescored_interview(interview_id, data, results)
+                if fields is not None:
+                    interview_updates[interview_id] = (fields, version)
+            try:
+                await repository.bulk_update(attempt_updates, interview_updates)
+                break
+            except ConflictError:
+                interviews = await repository.get_interviews_versioned(sorted(results_by_interview))
+        else:
+            raise RuntimeError(f"Interviews kept changing while page after {after} was written; re-run to resume")
+
+        state["after"] = list(after)
+        state["attempts"] += len(page)
+        state["rescored"] += len(attempt_updates)
+        state["interviews"] += len(interview_updates)
+        state["elapsedSeconds"] = round(elapsed_before + time.perf_counter() - started, 3)
+        save_checkpoint(checkpoint_path, state)
+        rate = state["attempts"] / max(state["elapsedSeconds"], 1e-9)
+        print(f"{state['attempts']} attempts scanned, {state['rescored']} rescored, "
+              f"{state['interviews']} interviews refreshed ({rate:.0f} attempts/s)", flush=True)
+
+    state["done"] = True
+    save_checkpoint(checkpoint_path, state)
+    return state
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", help="repository backend (default: DB_BACKEND)")
+    parser.add_argument("--page-size", type=int, default=RESCORE_PAGE_SIZE, help="attempts read and written per page")
+    parser.add_argument("--batch-size", type=int, default=RESCORE_BATCH_SIZE, help="attempts per scoring task")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="scoring processes")
+    parser.add_argument("--checkpoint", default=RESCORE_CHECKPOINT_PATH)
+    parser.add_argument("--restart", action="store_true", help="start from the first attempt, ignoring the checkpoint")
+    parser.add_argument("--rebuild-rollups", action="store_true",
+                        help="rebuild the progress rollups from the new scores when the run completes")
+    args = parser.parse_args()
+
+    state = None if args.restart else load_checkpoint(args.checkpoint)
+    if state is None or state.get("done"):
+        state = {"after": None, "attempts": 0, "rescored": 0, "interviews": 0, "elapsedSeconds": 0.0}
+    elif state["after"]:
+        print(f"Resuming after attempt {state['after'][1]} ({state['attempts']} already scanned)", flush=True)
+
+    repository = create_repository(args.backend)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        state = asyncio.run(rescore(repository, pool, state, args.checkpoint, args.page_size, args.batch_size))
+    rate = state["attempts"] / max(state["elapsedSeconds"], 1e-9)
+    print(json.dumps(state | {"attemptsPerSecond": round(rate, 1)}, indent=2))
+    if args.rebuild_rollups:
+        print("Rebuilding progress rollups from the new scores", flush=True)
+        print(json.dumps(asyncio.run(backfill(repository, args.page_size)), indent=2))
+    elif state["rescored"]:
+        print(f"NOTICE: {state['rescored']} attempts were rescored, but /api/analytics/progress still shows the old "
+              f"scores. Rebuild the rollups with: python -m services.rollups" +
+              (f" --backend {args.backend}" if args.backend else ""), flush=True)
+
+if __name__ == "__main__":
+    main()
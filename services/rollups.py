@@ -0,0 +1,203 @@
+"""Per-user progress rollups: one small document per user per day and per week.
+
+Every recorded answer and every finished interview adds to the current day
+and week buckets, in the same atomic write as the interview itself, so
+dashboards read a handful of buckets instead of scanning history. A bucket
+holds, per aggregated value (overall and each component), count, sum and
+sumSq under "answers"; per role (as a question bank slug) answer and
+finished-interview counts and score sums under "roles"; and finished
+interview totals under "interviews".
+
+Rebuild every bucket from stored attempts and interviews (for data recorded
+before rollups existed, or after a re-score). Buckets are replaced outright,
+so answers recorded while the backfill runs can be lost from them; run it
+when traffic is quiet, or run it again afterwards.
+
+    python -m services.rollups --backend sqlite
+"""
+import os
+import json
+import time
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.aggregates import COMPONENTS, answer_samples, summarize, consistency
+from services.question_bank import question_bank
+from services.repository import Repository, RollupUpdate, apply_rollup, create_repository
+
+ROLLUP_PERIODS = ["day", "week"]
+# Most buckets one progress request may read
+ROLLUP_MAX_BUCKETS = 90
+BACKFILL_PAGE_SIZE = int(os.getenv("ROLLUP_BACKFILL_PAGE_SIZE", "500"))
+
+def period_start(period: str, when: datetime) -> datetime:
+    day = datetime(when.year, when.month, when.day)
+    return day - timedelta(days=day.weekday()) if period == "week" else day
+
+def bucket_id(period: str, start: datetime) -> str:
+    """Buckets are named by period and start date (weeks start on Monday): "day-2026-10-18", "week-2026-10-12" """
+    return f"{period}-{start.date().isoformat()}"
+
+def role_key(role: str) -> str:
+    # Bank slugs, with "_" for "-" so they are plain Firestore field names
+    return question_bank.normalize_role(role or "").replace("-", "_")
+
+def _updates(uid: str, when: datetime, increments: Dict[str, float]) -> List[RollupUpdate]:
+    updates = []
+    for period in ROLLUP_PERIODS:
+        start = period_start(period, when)
+        updates.append((uid, bucket_id(period, start), {"period": period, "start": start.date().isoformat()}, increments))
+    return updates
+
+def answer_rollups(uid: str, role: str, score: int, components: Optional[Dict[str, int]], when: datetime) -> List[RollupUpdate]:
+    """Bucket updates for one recorded answer"""
+    increments: Dict[str, float] = {}
+    for name, value in answer_samples(score, components).items():
+        increments[f"answers.{name}.count"] = 1
+        increments[f"answers.{name}.sum"] = value
+        increments[f"answers.{name}.sumSq"] = value * value
+    key = role_key(role)
+    increments[f"roles.{key}.answers"] = 1
+    increments[f"roles.{key}.scoreSum"] = score
+    return _updates(uid, when, increments)
+
+def finish_rollups(uid: str, role: str, score: int, when: datetime) -> List[RollupUpdate]:
+    """Bucket updates for one finished interview"""
+    key = role_key(role)
+    return _updates(uid, when, {
+        "interviews.finished": 1,
+        "interviews.scoreSum": score,
+        f"roles.{key}.finished": 1,
+        f"roles.{key}.finishedScoreSum": score,
+    })
+
+def summarize_bucket(bucket: Dict[str, Any]) -> Dict[str, Any]:
+    """Dashboard view of one bucket (or of several merged with apply_rollup)"""
+    answers = bucket.get("answers", {})
+    overall = summarize(answers["overall"]) if answers.get("overall", {}).get("count") else None
+    interviews = bucket.get("interviews", {})
+    finished = interviews.get("finished", 0)
+    return {
+        "answers": overall["count"] if overall else 0,
+        "averageScore": round(overall["mean"], 1) if overall else None,
+        "consistency": consistency(overall["std"]) if overall else None,
+        "components": {
+            name: round(summarize(answers[name])["mean"], 1)
+            for name in COMPONENTS if answers.get(name, {}).get("count")
+        },
+        "interviewsFinished": finished,
+        "averageInterviewScore": round(interviews["scoreSum"] / finished, 1) if finished else None,
+        "roles": {
+            key.replace("_", "-"): {
+                "answers": role.get("answers", 0),
+                "averageScore": round(role["scoreSum"] / role["answers"], 1) if role.get("answers") else None,
+                "interviewsFinished": role.get("finished", 0),
+            }
+            for key, role in bucket.get("roles", {}).items()
+        },
+    }
+
+def _flatten(bucket: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    # A bucket's numeric leaves as dotted-path increments, to merge buckets with apply_rollup
+    flat: Dict[str, float] = {}
+    for key, value in bucket.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and prefix:
+            flat[prefix + key] = value
+    return flat
+
+async def progress(repository: Repository, uid: str, period: str, count: int,
+                   now: Optional[datetime] = None) -> Dict[str, Any]:
+    """The user's last `count` buckets of a period, oldest first, plus totals over all of them"""
+    current = period_start(period, now or datetime.utcnow())
+    step = timedelta(days=7 if period == "week" else 1)
+    starts = [current - step * i for i in reversed(range(count))]
+    ids = [bucket_id(period, start) for start in starts]
+    buckets = await repository.get_rollups(uid, ids)
+    totals: Dict[str, Any] = {}
+    for bucket in buckets.values():
+        apply_rollup(totals, {}, _flatten(bucket))
+    return {
+        "period": period,
+        "buckets": [
+            {"start": start.date().isoformat()} | summarize_bucket(buckets.get(bucket, {}))
+            for start, bucket in zip(starts, ids)
+        ],
+        "totals": summarize_bucket(totals),
+    }
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+async def backfill(repository: Repository, page_size: int) -> Dict[str, Any]:
+    """Recompute every user's buckets from stored attempts and finished interviews and replace them"""
+    started = time.perf_counter()
+    buckets: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    counts = {"attempts": 0, "interviews": 0, "skipped": 0}
+
+    def add(updates: List[RollupUpdate]) -> None:
+        for uid, bucket, fields, increments in updates:
+            apply_rollup(buckets.setdefault(uid, {}).setdefault(bucket, {}), fields, increments)
+
+    def progress_line() -> None:
+        print(f"{counts['attempts']} attempts, {counts['interviews']} finished interviews, "
+              f"{len(buckets)} users", flush=True)
+
+    # Answers, from attempts (their interview supplies the role, and the user for older attempts)
+    after: Optional[Tuple[str, str]] = None
+    while True:
+        page = await repository.scan_attempts(page_size, after)
+        if not page:
+            break
+        after = (page[-1].get("interviewId") or "", page[-1]["id"])
+        interviews = await repository.get_interviews_versioned(
+            sorted({attempt["interviewId"] for attempt in page if attempt.get("interviewId")})
+        )
+        for attempt in page:
+            interview = interviews.get(attempt.get("interviewId"), ({}, None))[0]
+            uid = attempt.get("userId") or interview.get("userId")
+            when = _parse_time(attempt.get("createdAt"))
+            if not uid or when is None or "score" not in attempt:
+                counts["skipped"] += 1
+                continue
+            add(answer_rollups(uid, interview.get("role", ""), attempt["score"], attempt.get("components"), when))
+            counts["attempts"] += 1
+        progress_line()
+
+    # Finished interviews, scanned on their own so those without stored attempts count too
+    after_id: Optional[str] = None
+    while True:
+        page = await repository.scan_interviews(page_size, after_id)
+        if not page:
+            break
+        after_id = page[-1]["id"]
+        for interview in page:
+            when = _parse_time(interview.get("finishedAt") or interview.get("createdAt"))
+            if interview.get("status") == "finished" and interview.get("report") and interview.get("userId") and when:
+                add(finish_rollups(interview["userId"], interview.get("role", ""), interview["report"]["score"], when))
+                counts["interviews"] += 1
+        progress_line()
+
+    for uid, user_buckets in buckets.items():
+        await repository.put_rollups(uid, user_buckets)
+    return counts | {
+        "users": len(buckets),
+        "buckets": sum(len(user_buckets) for user_buckets in buckets.values()),
+        "elapsedSeconds": round(time.perf_counter() - started, 2),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild per-user progress rollups from stored history")
+    parser.add_argument("--backend", help="repository backend (default: DB_BACKEND)")
+    parser.add_argument("--page-size", type=int, default=BACKFILL_PAGE_SIZE, help="attempts read per page")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(backfill(create_repository(args.backend), args.page_size)), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import time
+import queue
+import multiprocessing
+from typing import Any, Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, timeouts still apply
+    resource = None
+
+class DocumentParseError(Exception):
+    """A document could not be processed: it is corrupt or unreadable, or it timed out, hit the memory cap or
+    crashed its worker. Always the document's fault, never the server's"""
+
+def _apply_memory_limit(memory_limit: Optional[int]) -> None:
+    if resource is None or not memory_limit:
+        return
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    except (ValueError, OSError) as e:
+        print(f"Parser worker could not apply memory limit: {str(e)}")
+
+def _worker_main(conn, memory_limit: Optional[int]) -> None:
+    """Child process loop: run jobs from the pipe, streaming stage events and then the outcome"""
+    _apply_memory_limit(memory_limit)
+    while True:
+        try:
+            func, args, with_stages = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            if with_stages:
+                result = func(*args, on_stage=lambda *stage: conn.send(("stage", *stage)))
+            else:
+                result = func(*args)
+            conn.send(("ok", result))
+        except DocumentParseError as e:
+            # The document is bad (corrupt, no text); the worker is fine
+            conn.send(("invalid", str(e)))
+        except MemoryError:
+            # The heap may be unusable now; report and let the parent replace this worker
+            conn.send(("fatal", "Document exceeds the parser memory limit"))
+            return
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+class _Worker:
+    def __init__(self, ctx, memory_limit: Optional[int]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, memory_limit), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+class ParserPool:
+    """Reusable child processes for untrusted document parsing.
+
+    Each job gets a wall-clock timeout, and each worker runs under an
+    address-space limit. A worker that exceeds either, or dies, is killed and
+    replaced, and the caller gets DocumentParseError. DocumentParseError
+    raised by func itself (a corrupt document) reaches the caller as-is and
+    keeps the worker. Other jobs are not affected. Workers are started on first use.
+    """
+
+    def __init__(self, size: int, timeout: float, memory_limit: Optional[int] = None):
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        # spawn keeps workers clear of locks held by the API's own threads at fork time
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        for _ in range(size):
+            self._idle.put(None)
+        self.replaced = 0
+
+    def run(self, func: Callable[..., Any], *args: Any, on_stage: Optional[Callable[..., None]] = None,
+            timeout: Optional[float] = None) -> Any:
+        """Run func(*args) in a worker, blocking until it finishes.
+
+        func must be a module-level function. When on_stage is given, it is
+        passed through as func's on_stage keyword argument.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        worker = self._idle.get()
+        if worker is not None and not worker.process.is_alive():
+            # Died while idle (e.g. killed externally); never blame the next document for it
+            worker.kill()
+            worker = None
+        if worker is None:
+            try:
+                worker = _Worker(self._ctx, self.memory_limit)
+            except Exception:
+                self._idle.put(None)
+                raise
+        healthy = False
+        try:
+            worker.conn.send((func, args, on_stage is not None))
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not worker.conn.poll(remaining):
+                    raise DocumentParseError(f"Document parsing timed out after {timeout:g}s")
+                kind, *payload = worker.conn.recv()
+                if kind == "stage":
+                    on_stage(*payload)
+                elif kind == "ok":
+                    healthy = True
+                    return payload[0]
+                elif kind == "invalid":
+                    healthy = True
+                    raise DocumentParseError(payload[0])
+                elif kind == "error":
+                    # Anything else is a fault in our code, not in the document
+                    healthy = True
+                    raise Exception(payload[0])
+                else:
+                    raise DocumentParseError(payload[0])
+        except (EOFError, OSError):
+            raise DocumentParseError("Document parser crashed")
+        finally:
+            if healthy:
+                self._idle.put(worker)
+            else:
+                worker.kill()
+                self.replaced += 1
+                # The replacement starts lazily on the next job
+                self._idle.put(None)
@@ -0,0 +1,287 @@
+import os
+import re
+import zlib
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from services.cache import LRUCache
+from services.metrics import register_cache
+from services.question_bank import QuestionBank, question_bank
+
+# Hashed vocabulary: tokens and stems each map to one of 2**HASH_BITS buckets
+HASH_BITS = 16
+HASH_SIZE = 1 << HASH_BITS
+# Distinct tokens remembered with their precomputed codes before the table is reset
+TOKEN_CACHE_SIZE = int(os.getenv("SCORING_TOKEN_CACHE_SIZE", "200000"))
+REFERENCE_CACHE_SIZE = int(os.getenv("SCORING_REFERENCE_CACHE_SIZE", "4096"))
+# A key point counts as covered once this share of its words (by stem) appear in the answer
+KEY_POINT_THRESHOLD = 0.5
+
+TOKEN_RE = re.compile(r"[a-z0-9%]+(?:'[a-z]+)?")
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+STOPWORDS = set("""
+a an the and or but if of to in on at by for with from as is are was were be been being it its this that these
+those there here i me my we our you your he she they them their his her him what which who whom how why when
+where do does did done have has had having not no so than too very can could would should will just about into
+over under up down out more most some any each all both few other such own same only also then once again
+further while because until against between through during before after above below off am i'm i've i'd it's
+""".split())
+# Prompt words that say nothing about the expected content
+PROMPT_WORDS = {"tell", "describe", "explain", "walk", "give", "talk", "example", "time", "would", "think"}
+FILLERS = {"um", "uh", "umm", "uhh", "erm", "er", "hmm", "basically", "literally", "actually", "honestly",
+           "whatever", "stuff", "kinda", "sorta", "anyway"}
+HEDGES = {"maybe", "perhaps", "probably", "guess", "possibly", "might", "somewhat", "unsure", "hopefully", "suppose"}
+CONNECTORS = {"first", "firstly", "second", "secondly", "then", "next", "because", "therefore", "so", "finally",
+              "however", "additionally", "consequently", "afterwards", "overall", "thus", "since", "instead"}
+SITUATION_CUES = {"situation", "context", "background", "project", "previously", "once", "recently", "during",
+                  "when", "while", "company", "team", "client"}
+TASK_CUES = {"task", "goal", "objective", "responsible", "responsibility", "needed", "challenge", "problem",
+             "required", "deadline", "asked", "assigned", "target"}
+ACTION_CUES = {"led", "built", "designed", "implemented", "created", "developed", "wrote", "decided", "organized",
+               "analyzed", "migrated", "refactored", "introduced", "drove", "owned", "proposed", "coordinated",
+               "automated", "investigated", "fixed", "added", "measured", "profiled", "tested", "deployed",
+               "negotiated", "prioritized", "mentored", "planned", "researched", "optimized"}
+RESULT_CUES = {"result", "results", "resulted", "outcome", "impact", "improved", "increased", "reduced",
+               "decreased", "saved", "achieved", "delivered", "grew", "cut", "faster", "launched", "percent",
+               "learned", "success", "successfully"}
+
+# Token flag bits, stored above the two hash fields in each token's code
+STOP, FILLER, HEDGE, CONNECTOR, SITUATION, TASK, ACTION, RESULT, NUMBER, SELF = (1 << bit for bit in range(10))
+_LEXICONS = [(STOPWORDS, STOP), (FILLERS, FILLER), (HEDGES, HEDGE), (CONNECTORS, CONNECTOR),
+             (SITUATION_CUES, SITUATION), (TASK_CUES, TASK), (ACTION_CUES, ACTION), (RESULT_CUES, RESULT)]
+_SUFFIXES = ("ations", "ation", "ments", "ment", "ings", "ing", "ies", "ed", "es", "ly", "s")
+
+def stem(token: str) -> str:
+    """Crude suffix-stripping stem, enough to match "optimize" against "optimization" """
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    return token[:6]
+
+def _bucket(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8")) & (HASH_SIZE - 1)
+
+def _encode(token: str) -> int:
+    flags = 0
+    for lexicon, flag in _LEXICONS:
+        if token in lexicon:
+            flags |= flag
+    if any(char.isdigit() for char in token):
+        flags |= NUMBER | RESULT
+    if token in ("i", "i'm", "i've", "i'd", "my"):
+        flags |= SELF
+    return _bucket(token) | _bucket(stem(token)) << HASH_BITS | flags << (2 * HASH_BITS)
+
+class _Reference:
+    """Precomputed reference for one question: TF-IDF vector over the question and key points, plus key point stems"""
+    __slots__ = ("buckets", "weights", "norm", "point_stems", "point_names")
+
+    def __init__(self, buckets: np.ndarray, weights: np.ndarray, point_stems: List[np.ndarray], point_names: List[str]):
+        self.buckets = buckets
+        self.weights = weights
+        self.norm = float(np.sqrt(np.square(weights).sum())) or 1.0
+        self.point_stems = point_stems
+        self.point_names = point_names
+
+class AnswerScorer:
+    """Local, deterministic interview answer scorer; feature extraction runs over whole batches in NumPy.
+
+    Each token is turned once into a packed integer code (token bucket, stem
+    bucket, lexicon flags) and cached. A batch is then one flat code array
+    plus a row index, and every feature (counts, TF-IDF cosine against the
+    question's reference, key point coverage) is a handful of array ops over
+    it, whatever the batch size.
+    """
+
+    def __init__(self, bank: QuestionBank):
+        self.bank = bank
+        self._codes: Dict[str, int] = {}
+        self._codes_lock = threading.Lock()
+        self._references = LRUCache(REFERENCE_CACHE_SIZE)
+
+        # IDF over the bank, one document per question with its key points
+        df = np.zeros(HASH_SIZE, dtype=np.float64)
+        for question in bank.questions:
+            codes = self._token_codes(question.text.lower() + " " + " ".join(question.key_points).lower())
+            df[np.unique(codes & (HASH_SIZE - 1))] += 1
+        documents = max(1, len(bank.questions))
+        self.idf = (np.log((documents + 1) / (df + 1)) + 1).astype(np.float32)
+
+    def _token_codes(self, text_lower: str) -> np.ndarray:
+        # One snapshot per call: a reset replaces self._codes rather than clearing it, so the snapshot
+        # never loses entries while this thread reads it
+        codes = self._codes
+        tokens = TOKEN_RE.findall(text_lower)
+        missing = {token: 0 for token in tokens if token not in codes}
+        if not missing:
+            return np.fromiter((codes[token] for token in tokens), dtype=np.int64, count=len(tokens))
+        for token in missing:
+            missing[token] = _encode(token)
+        with self._codes_lock:
+            if len(self._codes) + len(missing) > TOKEN_CACHE_SIZE:
+                self._codes = dict(missing)
+            else:
+                self._codes.update(missing)
+        return np.fromiter((missing[token] if token in missing else codes[token] for token in tokens),
+                           dtype=np.int64, count=len(tokens))
+
+    def _reference(self, role: str, question: str) -> _Reference:
+        entry = self.bank.find(question)
+        # Off-bank references include the role, so they are cached per role
+        key = question if entry is not None and entry.key_points else f"{role}\n{question}"
+        cached = self._references.get(key)
+        if cached is not None:
+            return cached
+        if entry is not None and entry.key_points:
+            points = list(entry.key_points)
+            text = question + " " + " ".join(points)
+        else:
+            # Questions from outside the bank: every content word of the question is its own point
+            points = [token for token in TOKEN_RE.findall(question.lower())
+                      if token not in STOPWORDS and token not in PROMPT_WORDS]
+            text = question + " " + role
+        codes = self._token_codes(text.lower())
+        content = codes[(codes >> (2 * HASH_BITS) & STOP) == 0]
+        buckets, counts = np.unique(content & (HASH_SIZE - 1), return_counts=True)
+        weights = (1 + np.log(counts)) * self.idf[buckets]
+        point_stems = []
+        for point in points:
+            point_codes = self._token_codes(point.lower())
+            point_codes = point_codes[(point_codes >> (2 * HASH_BITS) & STOP) == 0]
+            point_stems.append(np.unique(point_codes >> HASH_BITS & (HASH_SIZE - 1)))
+        reference = _Reference(buckets, weights.astype(np.float32), point_stems, points)
+        self._references.set(key, reference)
+        return reference
+
+    def features(self, items: Sequence[Tuple[str, str, str]]) -> Dict[str, np.ndarray]:
+        """Per-answer feature arrays for (role, question, answer) items"""
+        n = len(items)
+        per_answer = [self._token_codes(answer.lower()) for _, _, answer in items]
+        lengths = np.fromiter((len(codes) for codes in per_answer), dtype=np.int64, count=n)
+        codes = np.concatenate(per_answer) if n else np.zeros(0, dtype=np.int64)
+        rows = np.repeat(np.arange(n), lengths)
+        flags = codes >> (2 * HASH_BITS)
+        buckets = codes & (HASH_SIZE - 1)
+        stems = codes >> HASH_BITS & (HASH_SIZE - 1)
+
+        def count(flag: int) -> np.ndarray:
+            return np.bincount(rows, weights=(flags & flag) != 0, minlength=n)
+
+        words = np.maximum(lengths, 1).astype(np.float64)
+        sentences = np.fromiter(
+            (max(1, sum(1 for part in SENTENCE_SPLIT_RE.split(answer) if part.strip())) for _, _, answer in items),
+            dtype=np.float64, count=n,
+        )
+        star = sum((count(flag) > 0).astype(np.float64) for flag in (SITUATION, TASK, ACTION, RESULT))
+
+        # TF-IDF cosine: (row, bucket) keys for the answers and the references, joined on the sorted keys
+        content = (flags & STOP) == 0
+        answer_keys, answer_counts = np.unique(rows[content] * HASH_SIZE + buckets[content], return_counts=True)
+        answer_weights = (1 + np.log(answer_counts)) * self.idf[answer_keys % HASH_SIZE]
+        answer_norms = np.sqrt(np.bincount(answer_keys // HASH_SIZE, weights=answer_weights ** 2, minlength=n))
+        references = [self._reference(role, question) for role, question, _ in items]
+        reference_keys = np.concatenate(
+            [row * HASH_SIZE + ref.buckets for row, ref in enumerate(references)]
+        ) if n else np.zeros(0, dtype=np.int64)
+        reference_weights = np.concatenate([ref.weights for ref in references]) if n else np.zeros(0, dtype=np.float32)
+        _, in_answer, in_reference = np.intersect1d(answer_keys, reference_keys, assume_unique=True, return_indices=True)
+        dots = np.bincount(answer_keys[in_answer] // HASH_SIZE,
+                           weights=answer_weights[in_answer] * reference_weights[in_reference], minlength=n)
+        reference_norms = np.fromiter((ref.norm for ref in references), dtype=np.float64, count=n)
+        similarity = dots / np.maximum(answer_norms * reference_norms, 1e-9)
+
+        # Key point coverage: share of each point's stems found among the answer's stems
+        answer_stems = np.unique(rows * HASH_SIZE + stems)
+        point_rows = [row for row, ref in enumerate(references) for _ in ref.point_stems]
+        point_sizes = [len(stems_) for ref in references for stems_ in ref.point_stems]
+        if point_sizes:
+            point_keys = np.concatenate([row * HASH_SIZE + stems_ for row, ref in enumerate(references)
+                                         for stems_ in ref.point_stems])
+            point_ids = np.repeat(np.arange(len(point_sizes)), point_sizes)
+            found = np.isin(point_keys, answer_stems)
+            point_covered = np.bincount(point_ids, weights=found, minlength=len(point_sizes)) \
+                >= KEY_POINT_THRESHOLD * np.maximum(point_sizes, 1)
+            covered = np.bincount(point_rows, weights=point_covered, minlength=n)
+            totals = np.bincount(point_rows, minlength=n)
+        else:
+            point_covered = np.zeros(0, dtype=bool)
+            covered = totals = np.zeros(n)
+        coverage = np.where(totals > 0, covered / np.maximum(totals, 1), 0.0)
+
+        return {
+            "words": lengths.astype(np.float64),
+            "sentences": sentences,
+            "wordsPerSentence": lengths / sentences,
+            "similarity": similarity,
+            "coverage": coverage,
+            "pointCovered": point_covered,
+            "star": star,
+            "numbers": count(NUMBER),
+            "connectors": count(CONNECTOR),
+            "ownership": count(SELF) + count(ACTION),
+            "fillerRatio": count(FILLER) / words,
+            "hedgeRatio": count(HEDGE) / words,
+            "references": references,
+        }
+
+    def score(self, items: Sequence[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """Score (role, question, answer) items; returns {"score", "components", "feedback"} per item"""
+        if not items:
+            return []
+        f = self.features(items)
+        words = f["words"]
+        # 0 under 5 words, 1 from 50 to 250, easing to 0.6 by 500
+        length = np.clip((words - 5) / 45, 0, 1) - np.clip((words - 250) / 625, 0, 0.4)
+        pace = 1 - np.clip(np.abs(f["wordsPerSentence"] - 16) - 8, 0, 30) / 30
+        technical = (25 + 35 * f["coverage"] + 25 * np.clip(f["similarity"] / 0.3, 0, 1)
+                     + 15 * np.minimum(f["numbers"], 1)) * np.clip(words / 30, 0.3, 1)
+        communication = (35 + 30 * length + 20 * pace + 15 * np.clip(f["connectors"] / 2, 0, 1)
+                         - 300 * f["fillerRatio"]) * np.clip(words / 15, 0.3, 1)
+        confidence = (40 + 30 * f["star"] / 4 + 20 * np.clip(f["ownership"] / 3, 0, 1) + 10 * length
+                      - 300 * f["hedgeRatio"] - 200 * f["fillerRatio"]) * np.clip(words / 15, 0.3, 1)
+        components = np.rint(np.clip(np.stack([technical, communication, confidence]), 0, 100)).astype(int)
+
+        results = []
+        offset = 0
+        for row, reference in enumerate(f["references"]):
+            covered = f["pointCovered"][offset:offset + len(reference.point_names)]
+            offset += len(reference.point_names)
+            missing = [name for name, hit in zip(reference.point_names, covered) if not hit]
+            values = {"technical": int(components[0, row]), "communication": int(components[1, row]),
+                      "confidence": int(components[2, row])}
+            results.append({
+                "score": round(sum(values.values()) / len(values)),
+                "components": values,
+                "feedback": self._feedback(f, row, missing),
+            })
+        return results
+
+    @staticmethod
+    def _feedback(f: Dict[str, np.ndarray], row: int, missing: List[str]) -> str:
+        tips = []
+        if f["words"][row] < 40:
+            tips.append("Add more detail and walk through a concrete example.")
+        if missing and f["coverage"][row] < 0.75:
+            tips.append("Cover more of the key points, such as " + " and ".join(missing[:2]) + ".")
+        if f["star"][row] < 3:
+            tips.append("Structure the answer as Situation, Task, Action and Result.")
+        if f["numbers"][row] == 0:
+            tips.append("Quantify the impact with numbers where you can.")
+        if f["fillerRatio"][row] > 0.02:
+            tips.append("Cut filler words like \"um\" and \"basically\".")
+        if f["hedgeRatio"][row] > 0.02:
+            tips.append("State your decisions with more confidence; avoid hedging words.")
+        if not tips:
+            return "Strong answer: well structured, specific and on point."
+        return " ".join(tips[:2])
+
+_answer_scorer: Optional[AnswerScorer] = None
+
+def get_answer_scorer() -> AnswerScorer:
+    global _answer_scorer
+    if _answer_scorer is None:
+        _answer_scorer = AnswerScorer(question_bank)
+        register_cache("scoring_references", _answer_scorer._references.stats)
+    return _answer_scorer
@@ -0,0 +1,158 @@
+import os
+import copy
+import time
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from services.cache import LRUCache
+from services.metrics import register_cache
+from services.repository import get_repository, apply_answer, RollupUpdate, ConflictError, NotFoundError
+
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "10000"))
+# Sessions untouched for this long are dropped and re-read on their next turn
+SESSION_IDLE_SECONDS = float(os.getenv("SESSION_IDLE_SECONDS", "1800"))
+# A turn that keeps losing version races gives up with 409 after this many tries
+SESSION_WRITE_ATTEMPTS = int(os.getenv("SESSION_WRITE_ATTEMPTS", "3"))
+
+class SessionCache:
+    """Bounded cache of active interview documents with their stored version.
+
+    Entries are written through after every successful write, so a worker's
+    copy matches the stored document as of that version. Each write is
+    conditioned on the cached version; if another worker (or an unrouted
+    request) wrote in between, the write fails with ConflictError, the entry
+    is dropped and the caller re-reads. Sticky session routing only raises
+    the hit rate; correctness does not depend on it.
+    """
+
+    def __init__(self, max_entries: int, idle_seconds: float):
+        self.idle_seconds = idle_seconds
+        self._entries = LRUCache(max_entries)
+
+    def get(self, interview_id: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+        entry = self._entries.get(interview_id)
+        now = time.monotonic()
+        if entry is None or entry[2] + self.idle_seconds <= now:
+            if entry is not None:
+                self._entries.pop(interview_id)
+            return None
+        entry[2] = now
+        # Callers update their copy in place before writing it back
+        return copy.deepcopy(entry[0]), entry[1]
+
+    def put(self, interview_id: str, data: Dict[str, Any], version: Any) -> None:
+        now = time.monotonic()
+        self._entries.set(interview_id, [data, version, now])
+        # Recency order is idle order, so expired sessions sit at the old end
+        self._entries.evict_while(lambda entry: entry[2] + self.idle_seconds <= now)
+
+    def invalidate(self, interview_id: str) -> None:
+        self._entries.pop(interview_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._entries.stats()
+        total = stats["hits"] + stats["misses"]
+        return stats | {"hitRatio": round(stats["hits"] / total, 4) if total else None}
+
+_session_cache = SessionCache(SESSION_CACHE_SIZE, SESSION_IDLE_SECONDS)
+register_cache("sessions", lambda: _session_cache.stats())
+
+def get_session_cache() -> SessionCache:
+    return _session_cache
+
+async def start_session(interview_id: str, data: Dict[str, Any]) -> None:
+    version = await get_repository().create_interview(interview_id, data)
+    _session_cache.put(interview_id, copy.deepcopy(data), version)
+
+async def load_session(interview_id: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+    """Return an interview and its version, from the cache when possible"""
+    cached = _session_cache.get(interview_id)
+    if cached is not None:
+        return cached
+    data, version = await get_repository().get_interview_versioned(interview_id)
+    if data is not None and data.get("status") == "active":
+        _session_cache.put(interview_id, copy.deepcopy(data), version)
+    return data, version
+
+async def record_session_answer(interview_id: str, data: Dict[str, Any], version: Any, attempt: Dict[str, Any],
+                                questions: List[str], score: int,
+                                rollups: Optional[List[RollupUpdate]] = None) -> Tuple[str, Any]:
+    """Record an answer conditioned on version, then write the result through to the cache.
+
+    Returns the attempt id and the interview's new version; data is updated in place.
+    """
+    try:
+        attempt_id, version = await get_repository().record_answer(
+            interview_id, attempt, questions, score, expected_version=version, rollups=rollups
+        )
+    except (ConflictError, NotFoundError):
+        _session_cache.invalidate(interview_id)
+        raise
+    apply_answer(data, attempt_id, questions, score, attempt.get("components"))
+    _session_cache.put(interview_id, data, version)
+    return attempt_id, version
+
+async def close_session(interview_id: str, version: Any, fields: Dict[str, Any],
+                        rollups: Optional[List[RollupUpdate]] = None) -> None:
+    """Apply the final update conditioned on version and drop the session"""
+    try:
+        await get_repository().update_interview(interview_id, fields, expected_version=version, rollups=rollups)
+    finally:
+        _session_cache.invalidate(interview_id)
+
+class SessionWriter:
+    """Records one connection's answers in order, in the background, so a turn never waits on the database.
+
+    Each write is still conditioned on the stored version. On a conflict (a
+    write from another connection or an HTTP request) the session is re-read
+    and the answer recorded again on top, which is safe because recording an
+    answer only appends and increments. After the first failure later answers
+    are not written, and the failure is kept in error.
+    """
+
+    def __init__(self, interview_id: str, data: Dict[str, Any], version: Any):
+        self.interview_id = interview_id
+        self.data = data
+        self.version = version
+        self.pending = 0
+        self.error: Optional[Exception] = None
+        self._tail: Optional[asyncio.Future] = None
+
+    def record(self, attempt: Dict[str, Any], questions: List[str], score: int,
+               rollups: Optional[List[RollupUpdate]] = None) -> None:
+        self.pending += 1
+        self._tail = asyncio.ensure_future(self._write(self._tail, attempt, questions, score, rollups))
+
+    async def drain(self) -> Optional[Exception]:
+        """Wait until every answer recorded so far is stored (or has failed); returns error"""
+        if self._tail is not None:
+            await asyncio.shield(self._tail)
+        return self.error
+
+    async def _write(self, previous: Optional[asyncio.Future], attempt: Dict[str, Any], questions: List[str],
+                     score: int, rollups: Optional[List[RollupUpdate]]) -> None:
+        if previous is not None:
+            await previous
+        try:
+            if self.error is None:
+                await self._record(attempt, questions, score, rollups)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.pending -= 1
+
+    async def _record(self, attempt: Dict[str, Any], questions: List[str], score: int,
+                      rollups: Optional[List[RollupUpdate]]) -> None:
+        for _ in range(SESSION_WRITE_ATTEMPTS):
+            try:
+                _, self.version = await record_session_answer(
+                    self.interview_id, self.data, self.version, attempt, questions, score, rollups
+                )
+                return
+            except ConflictError:
+                self.data, self.version = await load_session(self.interview_id)
+                if self.data is None:
+                    raise NotFoundError(f"Interview {self.interview_id} not found")
+        raise ConflictError(f"Interview {self.interview_id} kept changing while an answer was recorded")
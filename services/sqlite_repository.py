@@ -0,0 +1,350 @@
+import json
+import uuid
+import sqlite3
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from services.repository import (
+    Repository, RollupUpdate, NotFoundError, ConflictError, apply_answer, apply_rollup, project
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS interviews (
+    id TEXT PRIMARY KEY,
+    user_id TEXT,
+    created_at TEXT,
+    version INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS interviews_user_created ON interviews (user_id, created_at DESC, id DESC);
+CREATE TABLE IF NOT EXISTS attempts (
+    id TEXT PRIMARY KEY,
+    interview_id TEXT,
+    user_id TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_interview ON attempts (interview_id, created_at);
+CREATE INDEX IF NOT EXISTS attempts_interview_id ON attempts (interview_id, id);
+CREATE TABLE IF NOT EXISTS resume_analyses (
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    created_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (user_id, id)
+);
+CREATE INDEX IF NOT EXISTS resume_analyses_user_created ON resume_analyses (user_id, created_at DESC, id DESC);
+CREATE TABLE IF NOT EXISTS rollups (
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (user_id, id)
+);
+"""
+
+class SQLiteStore:
+    """Single-file SQLite store: documents as JSON with the queried fields (userId, createdAt) as indexed columns.
+
+    Blocking; SQLiteRepository runs it off the event loop. Methods mirror Repository.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # One connection shared across request threads, serialized by a lock
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            # Databases created before interview versions existed
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(interviews)")}
+            if "version" not in columns:
+                self._conn.execute("ALTER TABLE interviews ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+    def _one(self, sql: str, params: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _listing(self, table: str, where: str, params: tuple, limit: Optional[int],
+                 after: Optional[Tuple[str, str]], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+        # Keyset pagination on the (user_id, created_at DESC, id DESC) index
+        sql = f"SELECT id, data FROM {table} WHERE {where}"
+        if after is not None:
+            sql += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+            params += (after[0], after[0], after[1])
+        sql += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [project(json.loads(data), fields) | {"id": doc_id} for doc_id, data in rows]
+
+    def get_user(self, uid: str) -> Optional[Dict[str, Any]]:
+        return self._one("SELECT data FROM users WHERE id = ?", (uid,))
+
+    def merge_user(self, uid: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT data FROM users WHERE id = ?", (uid,)).fetchone()
+                merged = (json.loads(row[0]) if row else {}) | data
+                self._conn.execute("INSERT OR REPLACE INTO users (id, data) VALUES (?, ?)", (uid, json.dumps(merged)))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def create_interview(self, interview_id: str, data: Dict[str, Any]) -> Any:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO interviews (id, user_id, created_at, version, data) VALUES (?, ?, ?, 1, ?) "
+                "ON CONFLICT (id) DO UPDATE SET user_id = excluded.user_id, created_at = excluded.created_at, "
+                "version = version + 1, data = excluded.data",
+                (interview_id, data.get("userId"), data.get("createdAt"), json.dumps(data)),
+            )
+            return self._conn.execute("SELECT version FROM interviews WHERE id = ?", (interview_id,)).fetchone()[0]
+
+    def get_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        return self._one("SELECT data FROM interviews WHERE id = ?", (interview_id,))
+
+    def get_interview_versioned(self, interview_id: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT data, version FROM interviews WHERE id = ?", (interview_id,)).fetchone()
+        return (json.loads(row[0]), row[1]) if row else (None, None)
+
+    def _write_interview(self, interview_id: str, expected_version: Any,
+                         change: Callable[[Dict[str, Any]], None]) -> int:
+        """Read-modify-write one interview in a transaction, bumping its version; caller holds the lock"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute("SELECT data, version FROM interviews WHERE id = ?", (interview_id,)).fetchone()
+            if row is None:
+                raise NotFoundError(f"Interview {interview_id} not found")
+            if expected_version is not None and row[1] != expected_version:
+                raise ConflictError(f"Interview {interview_id} changed since version {expected_version}")
+            data = json.loads(row[0])
+            change(data)
+            self._conn.execute(
+                "UPDATE interviews SET data = ?, version = ? WHERE id = ?", (json.dumps(data), row[1] + 1, interview_id)
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return row[1] + 1
+
+    def _apply_rollups(self, rollups: Optional[List[RollupUpdate]]) -> None:
+        """Fold rollup updates into their buckets; caller holds the lock inside a transaction"""
+        for uid, bucket_id, fields, increments in rollups or []:
+            row = self._conn.execute("SELECT data FROM rollups WHERE user_id = ? AND id = ?", (uid, bucket_id)).fetchone()
+            bucket = json.loads(row[0]) if row else {}
+            apply_rollup(bucket, fields, increments)
+            self._conn.execute("INSERT OR REPLACE INTO rollups (user_id, id, data) VALUES (?, ?, ?)",
+                               (uid, bucket_id, json.dumps(bucket)))
+
+    def update_interview(self, interview_id: str, fields: Dict[str, Any], expected_version: Any = None,
+                         rollups: Optional[List[RollupUpdate]] = None) -> Any:
+        def change(interview: Dict[str, Any]) -> None:
+            interview.update(fields)
+            self._apply_rollups(rollups)
+
+        with self._lock:
+            return self._write_interview(interview_id, expected_version, change)
+
+    def list_interviews(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                        fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return self._listing("interviews", "user_id = ?", (uid,), limit, after, fields)
+
+    def add_attempt(self, data: Dict[str, Any]) -> str:
+        attempt_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO attempts (id, interview_id, user_id, created_at, data) VALUES (?, ?, ?, ?, ?)",
+                (attempt_id, data.get("interviewId"), data.get("userId"), data.get("createdAt"), json.dumps(data)),
+            )
+        return attempt_id
+
+    def record_answer(self, interview_id: str, attempt: Dict[str, Any], questions: List[str], score: int,
+                      expected_version: Any = None, rollups: Optional[List[RollupUpdate]] = None) -> Tuple[str, Any]:
+        attempt_id = uuid.uuid4().hex
+
+        def change(interview: Dict[str, Any]) -> None:
+            apply_answer(interview, attempt_id, questions, score, attempt.get("components"))
+            self._conn.execute(
+                "INSERT INTO attempts (id, interview_id, user_id, created_at, data) VALUES (?, ?, ?, ?, ?)",
+                (attempt_id, attempt.get("interviewId"), attempt.get("userId"), attempt.get("createdAt"), json.dumps(attempt)),
+            )
+            self._apply_rollups(rollups)
+
+        with self._lock:
+            version = self._write_interview(interview_id, expected_version, change)
+        return attempt_id, version
+
+    def scan_attempts(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        sql, params = "SELECT id, data FROM attempts", ()
+        if after is not None:
+            sql += " WHERE interview_id > ? OR (interview_id = ? AND id > ?)"
+            params = (after[0], after[0], after[1])
+        sql += " ORDER BY interview_id, id LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(sql, params + (limit,)).fetchall()
+        return [json.loads(data) | {"id": attempt_id} for attempt_id, data in rows]
+
+    def scan_interviews(self, limit: int, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql, params = "SELECT id, data FROM interviews", ()
+        if after is not None:
+            sql, params = sql + " WHERE id > ?", (after,)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY id LIMIT ?", params + (limit,)).fetchall()
+        return [json.loads(data) | {"id": interview_id} for interview_id, data in rows]
+
+    def get_interviews_versioned(self, interview_ids: List[str]) -> Dict[str, Tuple[Dict[str, Any], Any]]:
+        found: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for i in range(0, len(interview_ids), 500):
+                chunk = interview_ids[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT id, data, version FROM interviews WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                found.update((interview_id, (json.loads(data), version)) for interview_id, data, version in rows)
+        return found
+
+    def bulk_update(self, attempts: Dict[str, Dict[str, Any]], interviews: Dict[str, Tuple[Dict[str, Any], Any]]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for attempt_id, fields in attempts.items():
+                    row = self._conn.execute("SELECT data FROM attempts WHERE id = ?", (attempt_id,)).fetchone()
+                    if row is None:
+                        raise NotFoundError(f"Attempt {attempt_id} not found")
+                    self._conn.execute("UPDATE attempts SET data = ? WHERE id = ?",
+                                       (json.dumps(json.loads(row[0]) | fields), attempt_id))
+                for interview_id, (fields, expected_version) in interviews.items():
+                    row = self._conn.execute("SELECT data, version FROM interviews WHERE id = ?", (interview_id,)).fetchone()
+                    if row is None:
+                        raise NotFoundError(f"Interview {interview_id} not found")
+                    if expected_version is not None and row[1] != expected_version:
+                        raise ConflictError(f"Interview {interview_id} changed since version {expected_version}")
+                    self._conn.execute("UPDATE interviews SET data = ?, version = ? WHERE id = ?",
+                                       (json.dumps(json.loads(row[0]) | fields), row[1] + 1, interview_id))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get_rollups(self, uid: str, bucket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not bucket_ids:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, data FROM rollups WHERE user_id = ? AND id IN ({','.join('?' * len(bucket_ids))})",
+                (uid, *bucket_ids),
+            ).fetchall()
+        return {bucket_id: json.loads(data) for bucket_id, data in rows}
+
+    def put_rollups(self, uid: str, buckets: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO rollups (user_id, id, data) VALUES (?, ?, ?)",
+                                       [(uid, bucket_id, json.dumps(data)) for bucket_id, data in buckets.items()])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def add_resume_analysis(self, uid: str, analysis_id: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resume_analyses (user_id, id, created_at, data) VALUES (?, ?, ?, ?)",
+                (uid, analysis_id, data.get("createdAt"), json.dumps(data)),
+            )
+
+    def get_resume_analysis(self, uid: str, analysis_id: str) -> Optional[Dict[str, Any]]:
+        return self._one("SELECT data FROM resume_analyses WHERE user_id = ? AND id = ?", (uid, analysis_id))
+
+    def list_resume_analyses(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                             fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return self._listing("resume_analyses", "user_id = ?", (uid,), limit, after, fields)
+
+class SQLiteRepository(Repository):
+    """Repository over a SQLiteStore; every call runs on one dedicated thread, so none blocks the event loop"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.store = SQLiteStore(path)
+        # The store serializes on one connection anyway; more threads would only queue on its lock
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+
+    async def _run(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: method(*args, **kwargs))
+
+    async def get_user(self, uid: str) -> Optional[Dict[str, Any]]:
+        return await self._run(self.store.get_user, uid)
+
+    async def merge_user(self, uid: str, data: Dict[str, Any]) -> None:
+        await self._run(self.store.merge_user, uid, data)
+
+    async def create_interview(self, interview_id: str, data: Dict[str, Any]) -> Any:
+        return await self._run(self.store.create_interview, interview_id, data)
+
+    async def get_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        return await self._run(self.store.get_interview, interview_id)
+
+    async def get_interview_versioned(self, interview_id: str) -> Tuple[Optional[Dict[str, Any]], Any]:
+        return await self._run(self.store.get_interview_versioned, interview_id)
+
+    async def update_interview(self, interview_id: str, fields: Dict[str, Any], expected_version: Any = None,
+                               rollups: Optional[List[RollupUpdate]] = None) -> Any:
+        return await self._run(self.store.update_interview, interview_id, fields, expected_version, rollups)
+
+    async def list_interviews(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                              fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return await self._run(self.store.list_interviews, uid, limit, after, fields)
+
+    async def add_attempt(self, data: Dict[str, Any]) -> str:
+        return await self._run(self.store.add_attempt, data)
+
+    async def record_answer(self, interview_id: str, attempt: Dict[str, Any], questions: List[str], score: int,
+                            expected_version: Any = None,
+                            rollups: Optional[List[RollupUpdate]] = None) -> Tuple[str, Any]:
+        return await self._run(self.store.record_answer, interview_id, attempt, questions, score, expected_version, rollups)
+
+    async def scan_attempts(self, limit: int, after: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+        return await self._run(self.store.scan_attempts, limit, after)
+
+    async def scan_interviews(self, limit: int, after: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await self._run(self.store.scan_interviews, limit, after)
+
+    async def get_interviews_versioned(self, interview_ids: List[str]) -> Dict[str, Tuple[Dict[str, Any], Any]]:
+        return await self._run(self.store.get_interviews_versioned, interview_ids)
+
+    async def bulk_update(self, attempts: Dict[str, Dict[str, Any]],
+                          interviews: Dict[str, Tuple[Dict[str, Any], Any]]) -> None:
+        await self._run(self.store.bulk_update, attempts, interviews)
+
+    async def get_rollups(self, uid: str, bucket_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return await self._run(self.store.get_rollups, uid, bucket_ids)
+
+    async def put_rollups(self, uid: str, buckets: Dict[str, Dict[str, Any]]) -> None:
+        await self._run(self.store.put_rollups, uid, buckets)
+
+    async def add_resume_analysis(self, uid: str, analysis_id: str, data: Dict[str, Any]) -> None:
+        await self._run(self.store.add_resume_analysis, uid, analysis_id, data)
+
+    async def get_resume_analysis(self, uid: str, analysis_id: str) -> Optional[Dict[str, Any]]:
+        return await self._run(self.store.get_resume_analysis, uid, analysis_id)
+
+    async def list_resume_analyses(self, uid: str, limit: Optional[int] = None, after: Optional[Tuple[str, str]] = None,
+                                   fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return await self._run(self.store.list_resume_analyses, uid, limit, after, fields)
@@ -1,6 +1,18 @@
-from google.cloud import storage
+import threading
+from typing import Any, Optional
 
-storage_client = storage.Client()
+_storage_client: Optional[Any] = None
+_client_lock = threading.Lock()
+
+def get_storage_client():
+    """Created on first use: the client runs credential discovery, which has no place in startup"""
+    global _storage_client
+    if _storage_client is None:
+        with _client_lock:
+            if _storage_client is None:
+                from google.cloud import storage
+                _storage_client = storage.Client()
+    return _storage_client
 
 def get_bucket(bucket_name: str):
-    return storage_client.bucket(bucket_name)
\ No newline at end of file
+    return get_storage_client().bucket(bucket_name)
@@ -0,0 +1,226 @@
+"""Streaming voice answers: voice-activity segmentation and pluggable transcription.
+
+Audio arrives as raw 16-bit little-endian mono PCM in arbitrary chunks. The
+segmenter cuts it into utterances as it arrives (an energy threshold per
+frame, with a silence hangover), and each finished utterance is handed to the
+transcriber straight away, so by the time the candidate stops only the last
+utterance is still being transcribed.
+
+A transcriber is any object with transcribe(pcm: bytes, sample_rate: int) ->
+str. It runs on the CPU pool, so blocking engines and HTTP clients are fine.
+Choose one with TRANSCRIBER=package.module:ClassName for a real engine, or
+TRANSCRIBER=stub for the deterministic stand-in used by tests and offline
+runs. With neither, voice answers are refused: the stub's canned sentences
+must never be scored as a candidate's answer.
+"""
+import os
+import zlib
+import time
+import asyncio
+import importlib
+from typing import Any, List, Optional
+
+from services.executors import run_cpu
+
+VOICE_SAMPLE_RATE = int(os.getenv("VOICE_SAMPLE_RATE", "16000"))
+# Longest spoken answer accepted, in seconds of audio
+VOICE_MAX_SECONDS = float(os.getenv("VOICE_MAX_SECONDS", "300"))
+VAD_FRAME_MS = 30
+# Frames louder than this (RMS, dB below full scale) count as speech
+VAD_THRESHOLD_DBFS = float(os.getenv("VAD_THRESHOLD_DBFS", "-40"))
+# Silence that ends an utterance
+VAD_HANGOVER_MS = int(os.getenv("VAD_HANGOVER_MS", "300"))
+# Utterances with less speech than this are clicks and breaths, and are dropped
+VAD_MIN_SPEECH_MS = 90
+# Audio kept before the first loud frame and after the last, so word edges are not clipped
+VAD_PADDING_MS = 120
+# Longer utterances are cut here so transcription keeps pace with a candidate who never pauses
+VAD_MAX_SEGMENT_SECONDS = float(os.getenv("VAD_MAX_SEGMENT_SECONDS", "15"))
+
+SAMPLE_BYTES = 2
+
+class VoiceActivitySegmenter:
+    """Cuts a PCM stream into utterances incrementally; feed() returns the utterances each chunk completes"""
+
+    def __init__(self, sample_rate: int = VOICE_SAMPLE_RATE, threshold_dbfs: float = VAD_THRESHOLD_DBFS,
+                 hangover_ms: int = VAD_HANGOVER_MS, max_segment_seconds: float = VAD_MAX_SEGMENT_SECONDS):
+        self.sample_rate = sample_rate
+        self.frame_bytes = sample_rate * VAD_FRAME_MS // 1000 * SAMPLE_BYTES
+        # Compared against mean squared amplitude, so no square root or log per frame
+        self.threshold = (32768.0 * 10 ** (threshold_dbfs / 20)) ** 2
+        self.hangover_frames = max(1, hangover_ms // VAD_FRAME_MS)
+        self.padding_frames = VAD_PADDING_MS // VAD_FRAME_MS
+        self.min_speech_frames = max(1, VAD_MIN_SPEECH_MS // VAD_FRAME_MS)
+        self.max_segment_frames = int(max_segment_seconds * 1000 // VAD_FRAME_MS)
+        self.total_bytes = 0
+        self._pending = b""
+        self._preroll: List[bytes] = []
+        self._segment: List[bytes] = []
+        self._speech_frames = 0
+        self._silent_run = 0
+
+    @property
+    def seconds(self) -> float:
+        """Audio received so far"""
+        return self.total_bytes / SAMPLE_BYTES / self.sample_rate
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        # NumPy loads with the first voice answer rather than at startup
+        import numpy as np
+        self.total_bytes += len(chunk)
+        data = self._pending + chunk
+        count = len(data) // self.frame_bytes
+        self._pending = data[count * self.frame_bytes:]
+        if not count:
+            return []
+        frames = np.frombuffer(data, dtype="<i2", count=count * self.frame_bytes // SAMPLE_BYTES)
+        energy = np.square(frames.reshape(count, -1).astype(np.float32)).mean(axis=1)
+        segments = []
+        for i, voiced in enumerate((energy > self.threshold).tolist()):
+            segment = self._frame(data[i * self.frame_bytes:(i + 1) * self.frame_bytes], voiced)
+            if segment is not None:
+                segments.append(segment)
+        return segments
+
+    def flush(self) -> List[bytes]:
+        """The utterance still open at the end of the stream, if any"""
+        segment = self._close() if self._segment else None
+        self._pending = b""
+        self._preroll = []
+        return [segment] if segment is not None else []
+
+    def _frame(self, frame: bytes, voiced: bool) -> Optional[bytes]:
+        if not self._segment:
+            if not voiced:
+                self._preroll = (self._preroll + [frame])[-self.padding_frames:] if self.padding_frames else []
+                return None
+            self._segment = self._preroll
+            self._preroll = []
+        self._segment.append(frame)
+        if voiced:
+            self._speech_frames += 1
+            self._silent_run = 0
+        else:
+            self._silent_run += 1
+        if self._silent_run >= self.hangover_frames or len(self._segment) >= self.max_segment_frames:
+            return self._close()
+        return None
+
+    def _close(self) -> Optional[bytes]:
+        # Trailing silence beyond the padding is dropped
+        keep = len(self._segment) - max(0, self._silent_run - self.padding_frames)
+        segment = b"".join(self._segment[:keep]) if self._speech_frames >= self.min_speech_frames else None
+        self._segment = []
+        self._speech_frames = 0
+        self._silent_run = 0
+        return segment
+
+class StubTranscriber:
+    """Deterministic stand-in for a speech-to-text engine, for tests, benchmarks and offline runs.
+
+    Each utterance maps to one of `phrases` by a checksum of its audio, so the
+    same audio always yields the same text. realtime_factor simulates engine
+    cost as seconds of work per second of audio.
+    """
+
+    PHRASES = [
+        "In my last project the situation was that our API latency had doubled.",
+        "My task was to find the cause and bring p99 latency back under 200 milliseconds.",
+        "I profiled the service, added a cache with a short TTL and batched the database queries.",
+        "As a result latency dropped by 40 percent and we cut infrastructure cost.",
+    ]
+
+    def __init__(self, phrases: Optional[List[str]] = None, realtime_factor: float = 0.0):
+        self.phrases = phrases or self.PHRASES
+        self.realtime_factor = realtime_factor
+
+    def transcribe(self, pcm: bytes, sample_rate: int) -> str:
+        if self.realtime_factor:
+            time.sleep(len(pcm) / SAMPLE_BYTES / sample_rate * self.realtime_factor)
+        return self.phrases[zlib.crc32(pcm) % len(self.phrases)]
+
+class TranscriberUnavailable(Exception):
+    """No speech-to-text engine is configured"""
+
+class TranscriptionError(Exception):
+    """The transcriber failed on an utterance"""
+
+def _default_transcriber():
+    name = os.getenv("TRANSCRIBER", "").strip()
+    if not name:
+        return None
+    if name.lower() == "stub":
+        print("WARNING: using the stub transcriber; voice answers get canned transcripts, not real speech-to-text")
+        return StubTranscriber()
+    module, _, attr = name.partition(":")
+    return getattr(importlib.import_module(module), attr)()
+
+_transcriber: Any = None
+
+def get_transcriber():
+    """The configured transcriber; raises TranscriberUnavailable when TRANSCRIBER is unset"""
+    global _transcriber
+    if _transcriber is None:
+        _transcriber = _default_transcriber()
+        if _transcriber is None:
+            raise TranscriberUnavailable("No speech-to-text engine is configured (set TRANSCRIBER)")
+    return _transcriber
+
+def set_transcriber(transcriber) -> None:
+    """Swap the transcriber (anything with transcribe(pcm, sample_rate) -> str)"""
+    global _transcriber
+    _transcriber = transcriber
+
+class VoiceAnswer:
+    """One spoken answer in flight: segments as audio arrives and transcribes each utterance as soon as it ends.
+
+    Call feed() from a running event loop; transcriptions run concurrently on
+    the CPU pool while more audio arrives.
+    """
+
+    def __init__(self, sample_rate: int = VOICE_SAMPLE_RATE, transcriber=None):
+        self.sample_rate = sample_rate
+        self.transcriber = transcriber or get_transcriber()
+        self.segmenter = VoiceActivitySegmenter(sample_rate)
+        self._tasks: List[asyncio.Task] = []
+        self._reported = 0
+
+    @property
+    def seconds(self) -> float:
+        return self.segmenter.seconds
+
+    def feed(self, chunk: bytes) -> None:
+        for segment in self.segmenter.feed(chunk):
+            self._start(segment)
+
+    def ready(self) -> List[str]:
+        """Utterance transcripts finished since the last call, in speaking order"""
+        texts = []
+        while self._reported < len(self._tasks) and self._tasks[self._reported].done():
+            texts.append(self._result(self._tasks[self._reported]))
+            self._reported += 1
+        return [text for text in texts if text]
+
+    async def finish(self) -> str:
+        """Close the stream and return the full transcript"""
+        for segment in self.segmenter.flush():
+            self._start(segment)
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+        texts = [self._result(task) for task in self._tasks]
+        return " ".join(text.strip() for text in texts if text and text.strip())
+
+    @staticmethod
+    def _result(task: asyncio.Task) -> str:
+        # Transcribers are pluggable, so any exception they raise is reported as one error type
+        try:
+            return task.result()
+        except Exception as e:
+            raise TranscriptionError(f"{type(e).__name__}: {str(e)}") from e
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    def _start(self, segment: bytes) -> None:
+        self._tasks.append(asyncio.ensure_future(run_cpu(self.transcriber.transcribe, segment, self.sample_rate)))
@@ -0,0 +1,59 @@
+import math
+import statistics
+from services.aggregates import (
+    AGGREGATED, answer_samples, add_samples, stats_from_entries, summarize, consistency, complete_stats
+)
+from services.ai import build_interview_report
+
+ENTRIES = [
+    {"score": 82, "components": {"technical": 90, "communication": 75, "confidence": 80}},
+    {"score": 64, "components": {"technical": 60, "communication": 70, "confidence": 62}},
+    {"score": 71, "components": {"technical": 75, "communication": 68, "confidence": 70}},
+]
+
+def test_answer_samples_keep_only_tracked_components():
+    assert answer_samples(70, {"technical": 80, "unknown": 5}) == {"overall": 70, "technical": 80}
+    assert answer_samples(70, None) == {"overall": 70}
+
+def test_running_stats_match_the_direct_computation():
+    stats = stats_from_entries(ENTRIES)
+    for name in AGGREGATED:
+        values = [entry["score"] if name == "overall" else entry["components"][name] for entry in ENTRIES]
+        summary = summarize(stats[name])
+        assert summary["count"] == 3
+        assert math.isclose(summary["mean"], statistics.fmean(values))
+        assert math.isclose(summary["std"], statistics.pstdev(values))
+        assert (summary["min"], summary["max"]) == (min(values), max(values))
+
+def test_incremental_updates_equal_a_rebuild():
+    stats = {}
+    for entry in ENTRIES:
+        add_samples(stats, answer_samples(entry["score"], entry["components"]))
+    assert stats == stats_from_entries(ENTRIES)
+
+def test_equal_scores_never_give_a_negative_variance():
+    for value in (0.1, 0.7, 33.3, 71):
+        std = summarize(stats_from_entries([{"score": value}] * 10)["overall"])["std"]
+        assert 0.0 <= std < 1e-6
+
+def test_consistency_scale():
+    assert consistency(0) == 100
+    assert consistency(10) == 80
+    assert consistency(80) == 0
+
+def test_complete_stats_require_every_answer_counted():
+    stats = stats_from_entries(ENTRIES)
+    assert complete_stats({"stats": stats, "answerCount": 3}) is stats
+    assert complete_stats({"stats": stats, "answerCount": 4}) is None
+    partial = stats_from_entries(ENTRIES[:1] + [{"score": 50}])
+    assert complete_stats({"stats": partial, "answerCount": 2}) is None
+    assert complete_stats({"answerCount": 2, "scoreTotal": 140}) is None
+
+def test_report_from_stats_and_legacy_fallback():
+    report = build_interview_report("iv1", {"stats": stats_from_entries(ENTRIES), "answerCount": 3})
+    assert report["score"] == round(statistics.fmean(entry["score"] for entry in ENTRIES))
+    assert report["components"]["technical"] == 75
+    assert report["consistency"] == consistency(statistics.pstdev(entry["score"] for entry in ENTRIES))
+    legacy = build_interview_report("iv2", {"answerCount": 2, "scoreTotal": 150})
+    assert legacy["score"] == 75 and "consistency" not in legacy
+    assert build_interview_report("iv3", {"scores": [70, 90]})["score"] == 80
@@ -0,0 +1,39 @@
+import pytest
+from benchmarks.corpus import resume_pdf, resume_docx
+from services.extraction import extract_text_with_stats, DocumentParseError
+
+def test_pdf_stops_at_the_page_limit():
+    content = resume_pdf(1, 5)
+    full, full_stats = extract_text_with_stats(content, "resume.pdf", max_pages=None, max_chars=None)
+    text, stats = extract_text_with_stats(content, "resume.pdf", max_pages=2, max_chars=None)
+    assert full_stats["pagesRead"] == full_stats["totalPages"] == 5 and not full_stats["truncated"]
+    assert stats["pagesRead"] == 2 and stats["totalPages"] == 5 and stats["truncated"]
+    assert full.startswith(text) and len(text) < len(full)
+
+def test_pdf_stops_at_the_character_limit():
+    content = resume_pdf(2, 5)
+    text, stats = extract_text_with_stats(content, "resume.pdf", max_pages=None, max_chars=500)
+    assert len(text) <= 500 and stats["truncated"]
+    # Pages after the one that reached the limit are never parsed
+    assert stats["pagesRead"] < stats["totalPages"]
+
+def test_docx_stops_at_the_character_limit():
+    content = resume_docx(3, 3)
+    full, full_stats = extract_text_with_stats(content, "resume.docx", max_chars=None)
+    text, stats = extract_text_with_stats(content, "resume.docx", max_chars=300)
+    assert not full_stats["truncated"]
+    assert len(text) <= 300 and stats["truncated"]
+    assert stats["blocksRead"] < full_stats["blocksRead"]
+    assert full.startswith(text[:200])
+
+def test_limits_above_the_document_change_nothing():
+    content = resume_pdf(4, 2)
+    text, stats = extract_text_with_stats(content, "resume.pdf", max_pages=10, max_chars=10 ** 6)
+    assert text == extract_text_with_stats(content, "resume.pdf", max_pages=None, max_chars=None)[0]
+    assert not stats["truncated"] and stats["chars"] == len(text)
+
+def test_unreadable_and_unsupported_files():
+    with pytest.raises(DocumentParseError):
+        extract_text_with_stats(b"not a pdf", "resume.pdf")
+    with pytest.raises(ValueError):
+        extract_text_with_stats(b"", "resume.txt")
@@ -0,0 +1,40 @@
+from services.keywords import KeywordMatcher, load_keyword_matcher
+
+def matcher():
+    return KeywordMatcher(
+        {"skills": ["Java", "JavaScript", "AI", "C++", "Machine Learning", "Node.js"], "soft": ["Leadership"]},
+        aliases={"js": "JavaScript", "ml": "Machine Learning", "nodejs": "Node.js"},
+    )
+
+def test_terms_match_whole_words_only():
+    found = matcher().scan("maintained javascript services; avoided java-less aims").found("skills")
+    # "ai" inside "maintained"/"aims" and "java" inside "javascript" do not count
+    assert found == ["Java", "JavaScript"]
+
+def test_longest_term_wins_at_the_same_position():
+    scan = matcher().scan("javascript")
+    assert scan.positions == {"JavaScript": [0]}
+
+def test_punctuated_terms_and_boundaries():
+    found = matcher().scan("c++, node.js and machine learning.").found("skills")
+    assert found == ["C++", "Machine Learning", "Node.js"]
+
+def test_aliases_map_to_canonical_terms():
+    scan = matcher().scan("js and ml with nodejs; more js")
+    assert scan.positions["JavaScript"] == [0, 28]
+    assert scan.found("skills") == ["JavaScript", "Machine Learning", "Node.js"]
+
+def test_categories_are_independent():
+    scan = matcher().scan("leadership in ai")
+    assert scan.has("soft") and scan.found("soft") == ["Leadership"]
+    assert scan.found("skills") == ["AI"]
+    assert not scan.has("missing")
+
+def test_fingerprint_tracks_dictionary_content():
+    assert matcher().fingerprint == matcher().fingerprint
+    changed = KeywordMatcher({"skills": ["Java"]})
+    assert changed.fingerprint != matcher().fingerprint
+
+def test_bundled_dictionary_loads():
+    bundled = load_keyword_matcher()
+    assert bundled.categories and all(bundled.terms(category) for category in bundled.categories)
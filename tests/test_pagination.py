@@ -0,0 +1,73 @@
+import asyncio
+import base64
+import json
+import pytest
+from services.repository import encode_cursor, decode_cursor
+from services.memory_repository import MemoryRepository
+from services.sqlite_repository import SQLiteRepository
+
+def raw_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+def test_cursor_round_trips():
+    row = {"id": "abc123", "createdAt": "2026-01-05T10:00:00", "role": "ignored"}
+    cursor = encode_cursor(row)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("2026-01-05T10:00:00", "abc123")
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor!",
+    raw_cursor({"createdAt": "2026-01-05", "id": "a"}),
+    raw_cursor(["2026-01-05", "a", "extra"]),
+    raw_cursor([None, "a"]),
+    raw_cursor(["2026-01-05", 7]),
+    raw_cursor(["2026-01-05", ""]),
+    raw_cursor(["2026-01-05", "users/other"]),
+])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRepository()
+    return SQLiteRepository(str(tmp_path / "interviewer.db"))
+
+def seed(repository):
+    async def create():
+        # Two interviews share each timestamp, so pages must break ties on id
+        for index in range(7):
+            await repository.create_interview(f"iv{index}", {
+                "userId": "u1", "createdAt": f"2026-01-0{1 + index // 2}T10:00:00", "role": f"Role {index}",
+                "report": {"score": index * 10, "feedback": "long"},
+            })
+        await repository.create_interview("other", {"userId": "u2", "createdAt": "2026-01-09T10:00:00"})
+    asyncio.run(create())
+
+def walk(repository, limit, fields=None):
+    async def pages():
+        result, after = [], None
+        while True:
+            rows = await repository.list_interviews("u1", limit=limit, after=after, fields=fields)
+            result.append(rows)
+            if len(rows) < limit:
+                return result
+            after = decode_cursor(encode_cursor(rows[-1]))
+    return asyncio.run(pages())
+
+def test_pages_are_newest_first_without_gaps_or_repeats(repository):
+    seed(repository)
+    pages = walk(repository, limit=3)
+    ids = [row["id"] for page in pages for row in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert ids == ["iv6", "iv5", "iv4", "iv3", "iv2", "iv1", "iv0"]
+    keys = [(row["createdAt"], row["id"]) for page in pages for row in page]
+    assert keys == sorted(keys, reverse=True)
+
+def test_projected_pages_keep_the_cursor_field(repository):
+    seed(repository)
+    pages = walk(repository, limit=4, fields=["role", "report.score"])
+    first = pages[0][0]
+    assert first == {"id": "iv6", "role": "Role 6", "report": {"score": 60}, "createdAt": "2026-01-04T10:00:00"}
+    assert [row["id"] for page in pages for row in page][-1] == "iv0"
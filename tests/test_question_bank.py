@@ -0,0 +1,68 @@
+import pytest
+from services.question_bank import QuestionBank, Question, OPENING_TOPIC, question_bank
+
+ROLES = {"backend-developer": {"name": "Backend Developer", "aliases": ["backend", "server engineer"]}}
+
+def q(id, roles, difficulty, topic="systems", modes=("text", "voice")):
+    return Question(id, f"Question {id}?", list(roles), difficulty, topic, list(modes), [])
+
+@pytest.fixture
+def bank():
+    questions = [q(f"be-m{i}", ["backend-developer"], "medium") for i in range(5)]
+    questions += [q(f"be-e{i}", ["backend-developer"], "easy") for i in range(2)]
+    questions += [q(f"gen-m{i}", ["general"], "medium") for i in range(3)]
+    questions += [q("be-intro", ["backend-developer"], "medium", topic=OPENING_TOPIC)]
+    questions += [q("be-voice", ["backend-developer"], "hard", modes=("voice",))]
+    return QuestionBank(ROLES, questions)
+
+def interview(bank, seed, role="Backend Developer", difficulty="medium", mode="text"):
+    asked = []
+    while True:
+        question = bank.select(role, difficulty, mode, asked, seed=seed)
+        if question is None:
+            return asked
+        assert question.text not in asked
+        asked.append(question.text)
+
+def test_selection_never_repeats_until_every_pool_is_used_up(bank):
+    asked = interview(bank, "iv-1")
+    ids = [bank.find(text).id for text in asked]
+    # The role's medium pool (general questions included) first, then easy; never the opener or voice-only ones
+    assert sorted(ids[:8]) == [f"be-m{i}" for i in range(5)] + [f"gen-m{i}" for i in range(3)]
+    assert sorted(ids[8:]) == ["be-e0", "be-e1"]
+
+def test_same_seed_walks_the_same_order(bank):
+    assert interview(bank, "iv-1") == interview(bank, "iv-1")
+    orders = {tuple(interview(bank, f"iv-{n}")[:5]) for n in range(20)}
+    assert len(orders) > 1
+
+def test_order_depends_only_on_what_was_asked(bank):
+    asked = interview(bank, "iv-7")
+    for position in range(len(asked)):
+        assert bank.select("backend", "medium", "text", asked[:position], seed="iv-7").text == asked[position]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 6, 9, 12, 30])
+def test_pool_walk_is_a_permutation(size):
+    bank = QuestionBank({}, [q(str(i), ["general"], "easy") for i in range(size)])
+    pool = tuple(range(size))
+    for seed in (0, 1, 7, 12345, 2 ** 31 - 1):
+        picked = {bank._pick(pool, set(), step, seed).id for step in range(size)}
+        assert len(picked) == size
+
+def test_topic_pools_and_modes(bank):
+    assert bank.select("backend", "medium", "text", seed="x", topic=OPENING_TOPIC).id == "be-intro"
+    assert bank.pool_size("backend-developer", "hard", "voice") == 1
+    assert bank.pool_size("backend-developer", "hard", "text") == 0
+
+def test_unknown_roles_and_difficulties_fall_back(bank):
+    assert bank.normalize_role("Server Engineer") == "backend-developer"
+    assert bank.normalize_role("Astronaut") == "general"
+    assert bank.normalize_difficulty("Senior") == "hard"
+    assert bank.normalize_difficulty("whatever") == "medium"
+    assert bank.select("Astronaut", "medium", "text", seed="x").id.startswith("gen-")
+
+def test_bundled_bank_serves_distinct_questions():
+    asked = []
+    for _ in range(5):
+        asked.append(question_bank.select("Software Engineer", "medium", "text", asked, seed="iv-bundled").text)
+    assert len(set(asked)) == 5
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+from services.repository import ConflictError, NotFoundError, apply_answer
+from services.memory_repository import MemoryRepository
+from services.sqlite_repository import SQLiteRepository
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        return MemoryRepository()
+    return SQLiteRepository(str(tmp_path / "interviewer.db"))
+
+def attempt(score: int):
+    return {"interviewId": "iv1", "userId": "u1", "createdAt": "2026-01-05T10:00:00", "score": score,
+            "components": {"technical": score, "communication": score - 10}}
+
+ROLLUP = [("u1", "day-2026-01-05", {"period": "day"}, {"answers": 1, "scoreTotal": 70})]
+
+def test_apply_answer_folds_an_answer_into_the_interview():
+    interview = {"questionsAsked": ["Q1"]}
+    apply_answer(interview, "a1", ["Q1", "Q2"], 70, {"technical": 80})
+    apply_answer(interview, "a2", ["Q2"], 50)
+    assert interview["questionsAsked"] == ["Q1", "Q2"]
+    assert interview["scores"] == [{"attemptId": "a1", "score": 70, "components": {"technical": 80}},
+                                   {"attemptId": "a2", "score": 50}]
+    assert interview["answerCount"] == 2 and interview["scoreTotal"] == 120
+    assert interview["stats"]["overall"]["count"] == 2 and interview["stats"]["technical"]["count"] == 1
+
+def test_record_answer_writes_attempt_interview_and_rollups_together(repository):
+    async def scenario():
+        version = await repository.create_interview("iv1", {"userId": "u1", "questionsAsked": ["Q1"]})
+        attempt_id, new_version = await repository.record_answer("iv1", attempt(70), ["Q2"], 70,
+                                                                 expected_version=version, rollups=ROLLUP)
+        interview, current = await repository.get_interview_versioned("iv1")
+        attempts = await repository.scan_attempts(10)
+        rollups = await repository.get_rollups("u1", ["day-2026-01-05"])
+        return version, attempt_id, new_version, interview, current, attempts, rollups
+
+    version, attempt_id, new_version, interview, current, attempts, rollups = asyncio.run(scenario())
+    assert new_version == current and new_version != version
+    assert interview["questionsAsked"] == ["Q1", "Q2"] and interview["answerCount"] == 1
+    assert interview["scores"][0]["attemptId"] == attempt_id
+    assert [row["id"] for row in attempts] == [attempt_id]
+    assert rollups["day-2026-01-05"] == {"period": "day", "answers": 1, "scoreTotal": 70}
+
+def test_stale_version_conflicts_and_writes_nothing(repository):
+    async def scenario():
+        version = await repository.create_interview("iv1", {"userId": "u1"})
+        await repository.record_answer("iv1", attempt(70), ["Q1"], 70, expected_version=version)
+        with pytest.raises(ConflictError):
+            # Still holding the version from before the first answer
+            await repository.record_answer("iv1", attempt(40), ["Q2"], 40, expected_version=version, rollups=ROLLUP)
+        with pytest.raises(ConflictError):
+            await repository.update_interview("iv1", {"status": "finished"}, expected_version=version)
+        return (await repository.get_interview("iv1"), await repository.scan_attempts(10),
+                await repository.get_rollups("u1", ["day-2026-01-05"]))
+
+    interview, attempts, rollups = asyncio.run(scenario())
+    assert interview["answerCount"] == 1 and interview["questionsAsked"] == ["Q1"]
+    assert "status" not in interview
+    assert len(attempts) == 1 and rollups == {}
+
+def test_missing_interview_raises_not_found(repository):
+    async def scenario():
+        with pytest.raises(NotFoundError):
+            await repository.record_answer("missing", attempt(70), ["Q1"], 70)
+        with pytest.raises(NotFoundError):
+            await repository.update_interview("missing", {"status": "finished"})
+        return await repository.scan_attempts(10)
+
+    assert asyncio.run(scenario()) == []
+
+def test_unconditional_writes_always_apply(repository):
+    async def scenario():
+        await repository.create_interview("iv1", {"userId": "u1"})
+        for score in (60, 80):
+            await repository.record_answer("iv1", attempt(score), ["Q"], score)
+        return await repository.get_interview("iv1")
+
+    interview = asyncio.run(scenario())
+    assert interview["answerCount"] == 2 and interview["scoreTotal"] == 140
+
+def test_sqlite_rolls_back_a_write_that_fails_midway(tmp_path):
+    repository = SQLiteRepository(str(tmp_path / "interviewer.db"))
+    # "answers" is a number, so incrementing "answers.total" fails after the attempt row is inserted
+    broken = ROLLUP + [("u1", "day-2026-01-05", {}, {"answers.total": 1})]
+
+    async def scenario():
+        version = await repository.create_interview("iv1", {"userId": "u1"})
+        with pytest.raises(Exception):
+            await repository.record_answer("iv1", attempt(70), ["Q1"], 70, expected_version=version, rollups=broken)
+        interview, current = await repository.get_interview_versioned("iv1")
+        return version, interview, current, await repository.scan_attempts(10), await repository.get_rollups("u1", ["day-2026-01-05"])
+
+    version, interview, current, attempts, rollups = asyncio.run(scenario())
+    assert current == version and "answerCount" not in interview
+    assert attempts == [] and rollups == {}
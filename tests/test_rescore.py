@@ -0,0 +1,101 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from services.rescore import rescore, load_checkpoint, save_checkpoint
+from services.memory_repository import MemoryRepository
+
+ANSWERS = [
+    "I built a REST API in Python with caching and cut latency by 30 percent.",
+    "I am not sure.",
+    "I led a migration to Kubernetes, wrote the rollout plan and trained the team.",
+]
+
+def new_state():
+    return {"after": None, "attempts": 0, "rescored": 0, "interviews": 0, "elapsedSeconds": 0.0}
+
+def seed(repository, interviews=3, answers=3):
+    async def create():
+        for n in range(interviews):
+            interview_id = f"iv{n}"
+            scores = []
+            for index in range(answers):
+                # Stored with a stale score the current engine will not reproduce
+                attempt_id = await repository.add_attempt({
+                    "interviewId": interview_id, "userId": "u1", "question": "Tell me about a project you led.",
+                    "answer": ANSWERS[index % len(ANSWERS)], "score": -1, "components": {}, "feedback": "",
+                })
+                scores.append({"attemptId": attempt_id, "score": -1})
+            await repository.create_interview(interview_id, {
+                "userId": "u1", "role": "Software Engineer", "status": "finished", "scores": scores,
+                "answerCount": answers, "scoreTotal": -answers,
+            })
+    asyncio.run(create())
+
+def run(repository, state, checkpoint, page_size=2):
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        return asyncio.run(rescore(repository, pool, state, str(checkpoint), page_size, batch_size=1))
+
+def test_checkpoint_round_trip_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    assert load_checkpoint(str(path)) is None
+    save_checkpoint(str(path), new_state() | {"after": ["iv1", "a9"]})
+    assert load_checkpoint(str(path))["after"] == ["iv1", "a9"]
+    assert [p.name for p in tmp_path.iterdir()] == ["checkpoint.json"]
+
+def test_rescore_rewrites_attempts_and_interviews(tmp_path):
+    repository = MemoryRepository()
+    seed(repository)
+    state = run(repository, new_state(), tmp_path / "checkpoint.json")
+    assert state["done"] and state["attempts"] == state["rescored"] == 9 and state["interviews"] >= 3
+    assert load_checkpoint(str(tmp_path / "checkpoint.json"))["done"]
+    for interview_id, interview in repository.interviews.items():
+        attempts = {entry["attemptId"]: repository.attempts[entry["attemptId"]] for entry in interview["scores"]}
+        assert all(attempt["score"] >= 0 and attempt["components"] for attempt in attempts.values())
+        assert [entry["score"] for entry in interview["scores"]] == [attempts[e["attemptId"]]["score"] for e in interview["scores"]]
+        assert interview["scoreTotal"] == sum(entry["score"] for entry in interview["scores"])
+        assert interview["stats"]["overall"]["count"] == 3
+    # A second pass finds nothing left to change
+    again = run(repository, new_state(), tmp_path / "again.json")
+    assert again["attempts"] == 9 and again["rescored"] == 0
+
+class Interrupted(Exception):
+    pass
+
+class FailingRepository(MemoryRepository):
+    """Fails the bulk write after a given number of pages, like a job killed mid-run"""
+
+    def __init__(self, pages_before_failure: int):
+        super().__init__()
+        self.pages_left = pages_before_failure
+        self.scanned = []
+
+    async def scan_attempts(self, limit, after=None):
+        rows = await super().scan_attempts(limit, after)
+        self.scanned.extend(row["id"] for row in rows)
+        return rows
+
+    async def bulk_update(self, attempts, interviews):
+        if self.pages_left == 0:
+            raise Interrupted()
+        if self.pages_left is not None:
+            self.pages_left -= 1
+        await super().bulk_update(attempts, interviews)
+
+def test_interrupted_run_resumes_after_the_last_written_page(tmp_path):
+    checkpoint = tmp_path / "checkpoint.json"
+    repository = FailingRepository(pages_before_failure=2)
+    seed(repository)
+    with pytest.raises(Interrupted):
+        run(repository, new_state(), checkpoint)
+    saved = load_checkpoint(str(checkpoint))
+    assert saved["attempts"] == 4 and not saved.get("done")
+    order = [row["id"] for row in asyncio.run(MemoryRepository.scan_attempts(repository, 100))]
+    assert tuple(saved["after"]) == (repository.attempts[order[3]]["interviewId"], order[3])
+
+    repository.pages_left = None
+    repository.scanned = []
+    state = run(repository, saved, checkpoint)
+    # Only the attempts after the checkpoint are read again, and the totals carry over
+    assert repository.scanned == order[4:]
+    assert state["done"] and state["attempts"] == 9 and state["rescored"] == 9
+    assert all(attempt["score"] >= 0 for attempt in repository.attempts.values())
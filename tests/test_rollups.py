@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime
+from services.memory_repository import MemoryRepository
+from services.repository import apply_rollup
+from services.rollups import (
+    period_start, bucket_id, answer_rollups, finish_rollups, summarize_bucket, progress, backfill
+)
+
+COMPONENTS = {"technical": 80, "communication": 70, "confidence": 60}
+
+def test_days_and_weeks_start_at_midnight_and_monday():
+    sunday = datetime(2026, 10, 18, 23, 59)
+    assert period_start("day", sunday) == datetime(2026, 10, 18)
+    assert period_start("week", sunday) == datetime(2026, 10, 12)
+    assert period_start("week", datetime(2026, 10, 12, 0, 0)) == datetime(2026, 10, 12)
+    # Weeks cross month and year boundaries
+    assert bucket_id("week", period_start("week", datetime(2027, 1, 1))) == "week-2026-12-28"
+    assert bucket_id("day", period_start("day", datetime(2027, 1, 1, 8))) == "day-2027-01-01"
+
+def test_an_answer_updates_its_day_and_week():
+    updates = answer_rollups("u1", "Backend Developer", 75, COMPONENTS, datetime(2026, 10, 14, 9, 30))
+    assert [(uid, bucket) for uid, bucket, _, _ in updates] == [("u1", "day-2026-10-14"), ("u1", "week-2026-10-12")]
+    _, _, fields, increments = updates[1]
+    assert fields == {"period": "week", "start": "2026-10-12"}
+    assert increments["answers.overall.count"] == 1 and increments["answers.overall.sumSq"] == 75 * 75
+    assert increments["answers.technical.sum"] == 80
+
+def week_of_answers():
+    # Monday to Sunday of one week, then the next Monday
+    bucket_days = {}
+    for day, score in [(12, 60), (12, 80), (15, 70), (18, 90), (19, 50)]:
+        for uid, bucket, fields, increments in answer_rollups("u1", "SWE", score, COMPONENTS, datetime(2026, 10, day, 12)):
+            apply_rollup(bucket_days.setdefault(bucket, {}), fields, increments)
+    return bucket_days
+
+def test_answers_fall_into_the_right_buckets():
+    buckets = week_of_answers()
+    assert summarize_bucket(buckets["day-2026-10-12"])["answers"] == 2
+    assert summarize_bucket(buckets["week-2026-10-12"])["answers"] == 4
+    assert summarize_bucket(buckets["week-2026-10-12"])["averageScore"] == 75.0
+    assert summarize_bucket(buckets["week-2026-10-19"])["answers"] == 1
+
+def test_progress_lists_every_bucket_oldest_first():
+    repository = MemoryRepository()
+    repository.rollups["u1"] = week_of_answers()
+    now = datetime(2026, 10, 19, 8)
+    weeks = asyncio.run(progress(repository, "u1", "week", 3, now))
+    assert [bucket["start"] for bucket in weeks["buckets"]] == ["2026-10-05", "2026-10-12", "2026-10-19"]
+    assert [bucket["answers"] for bucket in weeks["buckets"]] == [0, 4, 1]
+    assert weeks["buckets"][0]["averageScore"] is None
+    assert weeks["totals"]["answers"] == 5 and weeks["totals"]["averageScore"] == 70.0
+    days = asyncio.run(progress(repository, "u1", "day", 8, now))
+    assert [bucket["answers"] for bucket in days["buckets"]] == [2, 0, 0, 1, 0, 0, 1, 1]
+
+def test_backfill_rebuilds_live_rollups_including_interviews_without_attempts():
+    repository = MemoryRepository()
+
+    async def scenario():
+        live = {}
+        await repository.create_interview("iv1", {"userId": "u1", "role": "SWE", "status": "finished",
+                                                  "createdAt": "2026-10-12T09:00:00",
+                                                  "finishedAt": "2026-10-13T10:00:00", "report": {"score": 72}})
+        for day, score in [(12, 70), (13, 74)]:
+            when = datetime(2026, 10, day, 9)
+            await repository.add_attempt({"interviewId": "iv1", "userId": "u1", "score": score,
+                                          "components": COMPONENTS, "createdAt": when.isoformat()})
+            updates = answer_rollups("u1", "SWE", score, COMPONENTS, when)
+            for uid, bucket, fields, increments in updates:
+                apply_rollup(live.setdefault(bucket, {}), fields, increments)
+        for uid, bucket, fields, increments in finish_rollups("u1", "SWE", 72, datetime(2026, 10, 13, 10)):
+            apply_rollup(live.setdefault(bucket, {}), fields, increments)
+        # Finished without any stored answers, and one still in progress
+        await repository.create_interview("iv2", {"userId": "u1", "role": "SWE", "status": "finished",
+                                                  "createdAt": "2026-10-16T09:00:00", "report": {"score": 40}})
+        await repository.create_interview("iv3", {"userId": "u1", "role": "SWE", "status": "active",
+                                                  "createdAt": "2026-10-16T10:00:00"})
+        for uid, bucket, fields, increments in finish_rollups("u1", "SWE", 40, datetime(2026, 10, 16, 9)):
+            apply_rollup(live.setdefault(bucket, {}), fields, increments)
+        counts = await backfill(repository, page_size=1)
+        return live, counts
+
+    live, counts = asyncio.run(scenario())
+    assert counts["attempts"] == 2 and counts["interviews"] == 2 and counts["skipped"] == 0
+    assert repository.rollups["u1"] == live
+    week = summarize_bucket(live["week-2026-10-12"])
+    assert week["interviewsFinished"] == 2 and week["averageInterviewScore"] == 56.0
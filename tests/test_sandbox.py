@@ -0,0 +1,74 @@
+import os
+import time
+import pytest
+from services.sandbox import ParserPool, DocumentParseError, resource
+
+# Jobs run in spawned workers, so they must be module-level
+
+def worker_pid() -> int:
+    return os.getpid()
+
+def sleep_for(seconds: float) -> str:
+    time.sleep(seconds)
+    return "slept"
+
+def allocate(megabytes: int) -> int:
+    return len(bytearray(megabytes * 1024 * 1024))
+
+def corrupt_document() -> None:
+    raise DocumentParseError("No text found")
+
+def buggy() -> None:
+    raise KeyError("missing")
+
+def crash() -> None:
+    os._exit(3)
+
+def staged(count: int, on_stage=None) -> int:
+    for index in range(count):
+        on_stage("page", index)
+    return count
+
+@pytest.fixture(scope="module")
+def pool():
+    return ParserPool(1, timeout=10, memory_limit=512 * 1024 * 1024)
+
+def test_workers_are_reused_for_good_and_corrupt_documents(pool):
+    pid = pool.run(worker_pid)
+    replaced = pool.replaced
+    with pytest.raises(DocumentParseError, match="No text found"):
+        pool.run(corrupt_document)
+    with pytest.raises(Exception, match="missing"):
+        pool.run(buggy)
+    assert pool.run(worker_pid) == pid and pool.replaced == replaced
+
+def test_timeout_kills_and_replaces_the_worker(pool):
+    pid = pool.run(worker_pid)
+    replaced = pool.replaced
+    started = time.monotonic()
+    with pytest.raises(DocumentParseError, match="timed out"):
+        pool.run(sleep_for, 30, timeout=0.5)
+    assert time.monotonic() - started < 5
+    assert pool.replaced == replaced + 1
+    assert pool.run(worker_pid) != pid
+
+@pytest.mark.skipif(resource is None, reason="no rlimits on this platform")
+def test_memory_cap_replaces_the_worker(pool):
+    replaced = pool.replaced
+    assert pool.run(allocate, 16) == 16 * 1024 * 1024
+    with pytest.raises(DocumentParseError, match="memory limit"):
+        pool.run(allocate, 2048)
+    assert pool.replaced == replaced + 1
+    assert pool.run(allocate, 16) == 16 * 1024 * 1024
+
+def test_crashed_worker_is_replaced(pool):
+    replaced = pool.replaced
+    with pytest.raises(DocumentParseError, match="crashed"):
+        pool.run(crash)
+    assert pool.replaced == replaced + 1
+    assert pool.run(sleep_for, 0) == "slept"
+
+def test_stages_stream_to_the_caller(pool):
+    stages = []
+    assert pool.run(staged, 3, on_stage=lambda *stage: stages.append(stage)) == 3
+    assert stages == [("page", 0), ("page", 1), ("page", 2)]
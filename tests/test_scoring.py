@@ -0,0 +1,76 @@
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+from services import scoring
+from services.question_bank import question_bank
+from services.scoring import AnswerScorer, TOKEN_RE, _encode
+
+OFF_BANK = "How would you design a rate limiter for payment webhooks?"
+ANSWER = ("As the frontend developer on the payments team I designed a token bucket limiter for our provider "
+          "webhooks, and as a result retries dropped by 40 percent.")
+
+@pytest.fixture
+def scorer():
+    return AnswerScorer(question_bank)
+
+def test_off_bank_reference_is_cached_per_role(scorer):
+    assert question_bank.find(OFF_BANK) is None
+    data = scorer._reference("Data Scientist", OFF_BANK)
+    frontend = scorer._reference("Frontend Developer", OFF_BANK)
+    assert data is not frontend
+    assert scorer._reference("Data Scientist", OFF_BANK) is data
+
+    fresh = AnswerScorer(question_bank)
+    expected = fresh._reference("Frontend Developer", OFF_BANK)
+    assert np.array_equal(frontend.buckets, expected.buckets)
+    assert np.allclose(frontend.weights, expected.weights)
+
+def test_off_bank_score_does_not_depend_on_earlier_roles(scorer):
+    scorer.score([("Data Scientist", OFF_BANK, ANSWER)])
+    warmed = scorer.score([("Frontend Developer", OFF_BANK, ANSWER)])
+    cold = AnswerScorer(question_bank).score([("Frontend Developer", OFF_BANK, ANSWER)])
+    assert warmed == cold
+
+def test_bank_reference_is_shared_across_roles(scorer):
+    question = question_bank.questions[0].text
+    assert scorer._reference("Data Scientist", question) is scorer._reference("Frontend Developer", question)
+
+def test_token_codes_reset_replaces_the_table(scorer, monkeypatch):
+    monkeypatch.setattr(scoring, "TOKEN_CACHE_SIZE", 8)
+    scorer._token_codes("alpha beta gamma delta")
+    before = scorer._codes
+    snapshot = dict(before)
+    codes = scorer._token_codes("one two three four five six seven")
+    # Readers holding the old table must still find every entry in it
+    assert scorer._codes is not before
+    assert before == snapshot
+    assert codes.tolist() == [_encode(token) for token in TOKEN_RE.findall("one two three four five six seven")]
+
+def test_token_codes_under_concurrent_resets(scorer, monkeypatch):
+    monkeypatch.setattr(scoring, "TOKEN_CACHE_SIZE", 64)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    errors = []
+
+    def work(worker: int) -> None:
+        try:
+            for round_ in range(200):
+                # A shared prefix (often cached) followed by tokens that force resets
+                text = "shared words stay cached " + " ".join(f"w{worker}x{round_}y{i}" for i in range(40))
+                codes = scorer._token_codes(text)
+                assert codes.tolist() == [_encode(token) for token in TOKEN_RE.findall(text)]
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from services import sessions
+from services.sessions import SessionCache, SessionWriter, start_session, load_session, record_session_answer
+from services import repository as repository_module
+from services.repository import ConflictError
+from services.memory_repository import MemoryRepository
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(sessions, "time", clock)
+    return clock
+
+@pytest.fixture
+def use_repository(monkeypatch):
+    def install(repository):
+        monkeypatch.setattr(repository_module, "_repository", repository)
+        return repository
+    sessions.get_session_cache().clear()
+    yield install
+    sessions.get_session_cache().clear()
+
+@pytest.fixture
+def repository(use_repository):
+    return use_repository(MemoryRepository())
+
+def attempt(score: int):
+    return {"interviewId": "iv1", "userId": "u1", "score": score}
+
+def test_idle_sessions_expire_on_read(clock):
+    cache = SessionCache(10, idle_seconds=60)
+    cache.put("iv1", {"turn": 1}, 1)
+    clock.now += 59
+    assert cache.get("iv1") == ({"turn": 1}, 1)
+    # Reading refreshes the idle timer
+    clock.now += 59
+    assert cache.get("iv1") is not None
+    clock.now += 60
+    assert cache.get("iv1") is None
+    assert cache.stats()["entries"] == 0
+
+def test_writes_sweep_out_idle_sessions(clock):
+    cache = SessionCache(10, idle_seconds=60)
+    cache.put("old", {}, 1)
+    clock.now += 30
+    cache.put("recent", {}, 1)
+    clock.now += 45
+    cache.put("new", {}, 1)
+    assert cache.stats()["entries"] == 2
+    assert cache.get("old") is None and cache.get("recent") is not None
+
+def test_cache_is_bounded_and_returns_copies(clock):
+    cache = SessionCache(2, idle_seconds=60)
+    for interview_id in ("a", "b", "c"):
+        cache.put(interview_id, {"id": interview_id}, 1)
+    assert cache.get("a") is None
+    data, _ = cache.get("c")
+    data["id"] = "changed"
+    assert cache.get("c")[0] == {"id": "c"}
+
+def test_only_active_interviews_are_cached(repository):
+    async def scenario():
+        await repository.create_interview("done", {"status": "finished"})
+        await load_session("done")
+        await start_session("iv1", {"status": "active"})
+    asyncio.run(scenario())
+    cache = sessions.get_session_cache()
+    assert cache.get("done") is None and cache.get("iv1") is not None
+
+def test_conflicting_write_drops_the_cached_session(repository):
+    async def scenario():
+        await start_session("iv1", {"status": "active", "userId": "u1"})
+        data, version = await load_session("iv1")
+        await repository.update_interview("iv1", {"note": "written elsewhere"})
+        with pytest.raises(ConflictError):
+            await record_session_answer("iv1", data, version, attempt(70), ["Q1"], 70)
+        assert sessions.get_session_cache().get("iv1") is None
+        # The re-read sees the other write and records on top of it
+        data, version = await load_session("iv1")
+        _, new_version = await record_session_answer("iv1", data, version, attempt(70), ["Q1"], 70)
+        return sessions.get_session_cache().get("iv1"), new_version
+    (cached, cached_version), new_version = asyncio.run(scenario())
+    assert cached_version == new_version
+    assert cached["note"] == "written elsewhere" and cached["answerCount"] == 1
+
+def test_writer_retries_on_conflict(repository):
+    async def scenario():
+        await start_session("iv1", {"status": "active", "userId": "u1"})
+        writer = SessionWriter("iv1", *await load_session("iv1"))
+        await repository.update_interview("iv1", {"note": "written elsewhere"})
+        writer.record(attempt(60), ["Q1"], 60)
+        writer.record(attempt(80), ["Q2"], 80)
+        assert await writer.drain() is None
+        return writer, await repository.get_interview_versioned("iv1")
+    writer, (stored, version) = asyncio.run(scenario())
+    assert writer.pending == 0 and writer.version == version
+    assert stored["note"] == "written elsewhere"
+    assert stored["answerCount"] == 2 and stored["questionsAsked"] == ["Q1", "Q2"]
+
+class AlwaysConflicting(MemoryRepository):
+    async def record_answer(self, *args, **kwargs):
+        self.calls = getattr(self, "calls", 0) + 1
+        raise ConflictError("changed")
+
+def test_writer_gives_up_after_repeated_conflicts(use_repository):
+    repository = use_repository(AlwaysConflicting())
+
+    async def scenario():
+        await start_session("iv1", {"status": "active"})
+        writer = SessionWriter("iv1", *await load_session("iv1"))
+        writer.record(attempt(60), ["Q1"], 60)
+        # Later answers are not attempted once one has failed
+        writer.record(attempt(80), ["Q2"], 80)
+        return await writer.drain()
+    error = asyncio.run(scenario())
+    assert isinstance(error, ConflictError) and "kept changing" in str(error)
+    assert repository.calls == sessions.SESSION_WRITE_ATTEMPTS
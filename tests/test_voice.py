@@ -0,0 +1,81 @@
+import asyncio
+import math
+import struct
+import pytest
+from services.voice import (
+    VoiceActivitySegmenter, VoiceAnswer, StubTranscriber, TranscriptionError, VAD_FRAME_MS, VAD_PADDING_MS
+)
+
+RATE = 16000
+FRAME = RATE * VAD_FRAME_MS // 1000 * 2
+PADDING = VAD_PADDING_MS // VAD_FRAME_MS
+
+def tone(ms: int, amplitude: int = 8000) -> bytes:
+    count = RATE * ms // 1000
+    return struct.pack(f"<{count}h", *(int(amplitude * math.sin(2 * math.pi * 440 * i / RATE)) for i in range(count)))
+
+def silence(ms: int) -> bytes:
+    return b"\x00\x00" * (RATE * ms // 1000)
+
+def segments(audio: bytes, chunk: int = 0, **options):
+    segmenter = VoiceActivitySegmenter(RATE, **options)
+    chunks = [audio[i:i + chunk] for i in range(0, len(audio), chunk)] if chunk else [audio]
+    found = [segment for piece in chunks for segment in segmenter.feed(piece)]
+    return found + segmenter.flush()
+
+def test_pauses_split_utterances_with_padding():
+    audio = silence(600) + tone(600) + silence(600) + tone(300) + silence(600)
+    first, second = segments(audio)
+    # Each utterance keeps PADDING frames of silence on both sides
+    assert len(first) == (20 + 2 * PADDING) * FRAME
+    assert len(second) == (10 + 2 * PADDING) * FRAME
+    assert first[:PADDING * FRAME] == silence(VAD_PADDING_MS)
+    assert first[PADDING * FRAME:PADDING * FRAME + 20 * FRAME] == tone(600)
+
+def test_short_pauses_do_not_split():
+    assert len(segments(tone(300) + silence(150) + tone(300) + silence(600))) == 1
+
+@pytest.mark.parametrize("chunk", [1, 333, FRAME, 4096])
+def test_chunking_does_not_change_the_result(chunk):
+    audio = silence(200) + tone(450) + silence(500) + tone(900) + silence(400)
+    assert segments(audio, chunk) == segments(audio)
+
+def test_clicks_and_quiet_noise_are_ignored():
+    assert segments(silence(300) + tone(30) + silence(600)) == []
+    assert segments(tone(1000, amplitude=50)) == []
+
+def test_long_speech_is_cut_at_the_segment_limit():
+    found = segments(tone(2500), max_segment_seconds=1.0)
+    assert [len(segment) // FRAME for segment in found] == [33, 33, 17]
+
+def test_open_utterance_is_flushed_at_the_end():
+    segmenter = VoiceActivitySegmenter(RATE)
+    assert segmenter.feed(tone(500)) == []
+    assert len(segmenter.flush()) == 1
+    assert segmenter.seconds == pytest.approx(0.5)
+
+class Failing:
+    def transcribe(self, pcm: bytes, sample_rate: int) -> str:
+        raise RuntimeError("engine crashed")
+
+def test_voice_answer_transcribes_in_speaking_order():
+    audio = tone(600) + silence(600) + tone(900) + silence(600)
+    stub = StubTranscriber()
+    expected = " ".join(stub.transcribe(segment, RATE) for segment in segments(audio))
+
+    async def scenario():
+        answer = VoiceAnswer(RATE, transcriber=stub)
+        answer.feed(audio)
+        return await answer.finish()
+    assert asyncio.run(scenario()) == expected
+
+def test_transcriber_failures_surface_as_one_error_type():
+    async def scenario():
+        answer = VoiceAnswer(RATE, transcriber=Failing())
+        answer.feed(tone(600) + silence(600))
+        await asyncio.wait(answer._tasks)
+        with pytest.raises(TranscriptionError, match="RuntimeError: engine crashed"):
+            answer.ready()
+        with pytest.raises(TranscriptionError):
+            await answer.finish()
+    asyncio.run(scenario())